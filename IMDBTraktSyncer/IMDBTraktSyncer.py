@@ -1,2090 +1,2623 @@
-import os
-import time
-import sys
-import argparse
-import subprocess
-from datetime import datetime, timezone
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from IMDBTraktSyncer import arguments
-
-class PageLoadException(Exception):
-    pass
-
-# Performance optimization constants
-TRAKT_BATCH_SIZE = 50  # Number of items to batch together for Trakt API requests (Trakt allows up to 50 items per request)
-TRAKT_BATCH_DELAY = 0.1  # Small delay between batch requests (100ms) to avoid rate limiting
-IMDB_OPERATION_DELAY = 0.3  # Small delay between IMDB operations (300ms) to avoid being flagged as bot
-IMDB_BATCH_DELAY = 1.0  # Slightly longer delay every 10 IMDB operations (1 second)
-IMDB_API_DELAY = 0.35  # Throttle between lightweight IMDB API calls (350ms) to respect IMDB rules
-IMDB_API_FAILURE_LIMIT = 3  # Disable the fast path after this many consecutive API failures
-
-def add_to_imdb_watchlist_via_api(driver, imdb_id):
-    """
-    Attempt to add a title to the IMDB watchlist using the lightweight IMDB AJAX endpoint.
-    Falls back to Selenium UI clicks when the endpoint is unavailable or fails repeatedly.
-    
-    Returns:
-        tuple: (success: bool, status_code: int, error_message: str | None)
-    """
-    try:
-        result = driver.execute_async_script("""
-            const imdbId = arguments[0];
-            const callback = arguments[1];
-            
-            // Extract CSRF token from cookies if present
-            const csrfMatch = document.cookie.match(/csrfToken=([^;]+)/);
-            const csrfToken = csrfMatch ? decodeURIComponent(csrfMatch[1]).split('%3A')[0] : '';
-            
-            const headers = {
-                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-                'X-Requested-With': 'XMLHttpRequest'
-            };
-            if (csrfToken) {
-                headers['X-Imdb-Csrf-Token'] = csrfToken;
-            }
-            
-            fetch('https://www.imdb.com/list/_ajax/watchlist_add', {
-                method: 'POST',
-                credentials: 'include',
-                headers,
-                body: 'const=' + encodeURIComponent(imdbId)
-            }).then(async (resp) => {
-                let data = null;
-                try {
-                    data = await resp.json();
-                } catch (e) {
-                    // If response is not JSON, ignore parsing errors
-                }
-                callback({ status: resp.status, ok: resp.ok, data });
-            }).catch((err) => callback({ status: 0, ok: false, error: err ? err.toString() : 'unknown error' }));
-        """, imdb_id)
-        
-        if isinstance(result, dict) and result.get('ok') and result.get('status') == 200:
-            return True, 200, None
-        
-        status_code = result.get('status') if isinstance(result, dict) else 0
-        error_message = None
-        if isinstance(result, dict):
-            error_message = result.get('error')
-        return False, status_code, error_message
-    except Exception as e:
-        return False, 0, str(e)
-
-def main():
-    parser = argparse.ArgumentParser(description="IMDBTraktSyncer CLI")
-    parser.add_argument("--clear-user-data", action="store_true", help="Clears user entered credentials.")
-    parser.add_argument("--clear-cache", action="store_true", help="Clears cached browsers, drivers and error logs.")
-    parser.add_argument("--uninstall", action="store_true", help="Clears cached browsers and drivers before uninstalling.")
-    parser.add_argument("--clean-uninstall", action="store_true", help="Clears all cached data, inluding user credentials, cached browsers and drivers before uninstalling.")
-    parser.add_argument("--directory", action="store_true", help="Prints the package install directory.")
-    
-    args = parser.parse_args()
-    
-    main_directory = os.path.dirname(os.path.realpath(__file__))
-
-    if args.clear_user_data:
-        arguments.clear_user_data(main_directory)
-    
-    if args.clear_cache:
-        arguments.clear_cache(main_directory)
-    
-    if args.uninstall:
-        arguments.uninstall(main_directory)
-    
-    if args.clean_uninstall:
-        arguments.clean_uninstall(main_directory)
-    
-    if args.directory:
-        arguments.print_directory(main_directory)
-    
-    # If no arguments are passed, run the main package logic
-    if not any([args.clear_user_data, args.clear_cache, args.uninstall, args.clean_uninstall, args.directory]):
-        
-        # Run main package
-        print("Starting IMDBTraktSyncer....")
-        from IMDBTraktSyncer import checkVersion as CV
-        from IMDBTraktSyncer import verifyCredentials as VC
-        from IMDBTraktSyncer import checkChrome as CC
-        from IMDBTraktSyncer import traktData
-        from IMDBTraktSyncer import imdbData
-        from IMDBTraktSyncer import errorHandling as EH
-        from IMDBTraktSyncer import errorLogger as EL
-        
-        # Check if package is up to date
-        CV.checkVersion()
-        
-        try:
-            # Print credentials directory
-            VC.print_directory(main_directory)
-            
-            # Get credentials
-            _, _, _, _, imdb_username, imdb_password = VC.prompt_get_credentials()
-            sync_watchlist_value = VC.prompt_sync_watchlist()
-            sync_ratings_value = VC.prompt_sync_ratings()
-            remove_watched_from_watchlists_value = VC.prompt_remove_watched_from_watchlists()
-            sync_reviews_value = VC.prompt_sync_reviews()
-            sync_watch_history_value = VC.prompt_sync_watch_history()
-            mark_rated_as_watched_value = VC.prompt_mark_rated_as_watched()
-            remove_watchlist_items_older_than_x_days_value, watchlist_days_to_remove_value = VC.prompt_remove_watchlist_items_older_than_x_days()
-            
-            # Check if Chrome portable browser is downloaded and up to date
-            CC.checkChrome()
-            browser_type, headless = CC.get_browser_type()
-
-            # Set up directory for downloads
-            directory = os.path.dirname(os.path.realpath(__file__))
-
-            # Start WebDriver
-            print('Starting WebDriver...')
-            
-            chrome_binary_path  = CC.get_chrome_binary_path(directory)
-            chromedriver_binary_path  = CC.get_chromedriver_binary_path(directory)
-            user_data_directory = CC.get_user_data_directory()
-            
-            # Initialize Chrome options
-            options = Options()
-            options.binary_location = chrome_binary_path
-            options.add_argument(f"--user-data-dir={user_data_directory}")
-            if headless == True:
-                options.add_argument("--headless=new")
-            options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36')
-            options.add_experimental_option("prefs", {
-                "download.default_directory": directory,
-                "download.directory_upgrade": True,
-                "download.prompt_for_download": False,
-                "profile.default_content_setting_values.automatic_downloads": 1,
-                "credentials_enable_service": False,
-                "profile.password_manager_enabled": False
-            })
-            options.add_argument('--disable-gpu')
-            options.add_argument('--start-maximized')
-            options.add_argument('--disable-notifications')
-            options.add_argument("--disable-third-party-cookies")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-extensions")
-            options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
-            options.add_argument('--log-level=3')
-            
-            service = Service(executable_path=chromedriver_binary_path)
-                        
-            # Temporary solution for removing "DevTools listening on ws:" line on Windows for better readability
-            # Only use CREATE_NO_WINDOW on Windows systems (32-bit or 64-bit)
-            if browser_type == "chrome":
-                if sys.platform == "win32":
-                    creation_flags = subprocess.CREATE_NO_WINDOW
-                    service.creation_flags = creation_flags
-
-            try:
-                # Initialize WebDriver with the given options and service
-                driver = webdriver.Chrome(service=service, options=options)
-                driver.set_page_load_timeout(60)
-
-            except Exception as e:
-                error_message = (f"Error initializing WebDriver: {str(e)}")
-                print(f"{error_message}")
-                EL.logger.error(error_message)
-                raise SystemExit
-            
-            # Example: Wait for an element and interact with it
-            wait = WebDriverWait(driver, 30)  # Increased timeout to 30 seconds
-            
-            # go to IMDB homepage
-            success, status_code, url, driver, wait = EH.get_page_with_retries('https://www.imdb.com/', driver, wait)
-            if not success:
-                # Page failed to load, raise an exception
-                raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
-
-            # Wait for page to fully load and JavaScript to execute
-            time.sleep(3)
-            
-            # Wait for document ready state
-            WebDriverWait(driver, 10).until(lambda d: d.execute_script("return document.readyState") == "complete")
-
-            # Check if still signed in from previous session using multiple methods
-            # Method 1: Use JavaScript to check for common sign-in indicators
-            signed_in = False
-            try:
-                # JavaScript to check for various sign-in indicators
-                sign_in_check_js = """
-                return (function() {
-                    // Check for user menu elements (various possible selectors)
-                    var userMenuSelectors = [
-                        '.nav__userMenu',
-                        '.navbar__user',
-                        '[data-testid="user-menu"]',
-                        '.imdb-header__accountmenu',
-                        '.nav__userMenu .navbar__user-menu-toggle__button',
-                        '.nav__userMenu.navbar__user'
-                    ];
-                    
-                    for (var i = 0; i < userMenuSelectors.length; i++) {
-                        var elements = document.querySelectorAll(userMenuSelectors[i]);
-                        if (elements && elements.length > 0) {
-                            return true;
-                        }
-                    }
-                    
-                    // Check if sign-in button exists (means not signed in)
-                    var signInButton = document.querySelector('a[href*="signin"], a[href*="sign-in"], .ipc-button[href*="signin"]');
-                    if (signInButton && signInButton.offsetParent !== null) {
-                        return false;
-                    }
-                    
-                    // Check for cookies that might indicate sign-in
-                    var cookies = document.cookie;
-                    if (cookies.includes('session-id') || cookies.includes('ubid-main') || cookies.includes('at-main')) {
-                        return true;
-                    }
-                    
-                    // Check for localStorage/sessionStorage
-                    try {
-                        if (localStorage.getItem('signin_status') === 'true' || sessionStorage.getItem('signed_in') === 'true') {
-                            return true;
-                        }
-                    } catch(e) {}
-                    
-                    // Default: assume not signed in if we can't determine
-                    return false;
-                })();
-                """
-                signed_in = driver.execute_script(sign_in_check_js)
-                
-                # Method 2: Try to find user menu elements with shorter timeout (fallback)
-                if not signed_in:
-                    short_wait = WebDriverWait(driver, 5)  # Shorter timeout for fallback check
-                    selectors_to_try = [
-                        ".nav__userMenu .navbar__user-menu-toggle__button",
-                        ".nav__userMenu.navbar__user",
-                        ".nav__userMenu",
-                        "[data-testid='user-menu']",
-                        ".imdb-header__accountmenu",
-                        "a[href*='/user/']",
-                        ".navbar__user"
-                    ]
-                    
-                    for selector in selectors_to_try:
-                        try:
-                            # Use a very short timeout for each selector
-                            element = WebDriverWait(driver, 2).until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                            # Verify it's visible
-                            if element.is_displayed():
-                                signed_in = True
-                                break
-                        except (TimeoutException, NoSuchElementException):
-                            continue
-                            
-            except Exception as e:
-                # If JavaScript check fails, assume not signed in and proceed
-                # Don't print error for expected cases where user might not be signed in
-                signed_in = False
-            
-            if signed_in:
-                print("Successfully signed in to IMDB")
-            else:
-                # Not signed in - this is expected and we'll proceed with sign-in flow
-                pass
-                # Not signed in from previous session, proceed with sign in logic
-                time.sleep(2)
-                
-                # Load sign in page
-                success, status_code, url, driver, wait = EH.get_page_with_retries('https://www.imdb.com/registration/signin/?subPageType=sign_in', driver, wait)
-                if not success:
-                    # Page failed to load, raise an exception
-                    raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
-                
-                # Wait for sign in link to appear and then click it
-                sign_in_link = wait.until(EC.presence_of_element_located((By.XPATH, "//*[contains(@class, 'display-button-container')]//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'imdb')]")))
-                driver.execute_script("arguments[0].click();", sign_in_link)
-                
-                # wait for email input field and password input field to appear, then enter credentials and submit
-                email_input = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "input[type='email']")))[0]
-                password_input = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "input[type='password']")))[0]
-                email_input.send_keys(imdb_username)
-                password_input.send_keys(imdb_password)
-                submit_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='submit']")))
-                driver.execute_script("arguments[0].click();", submit_button)
-
-                time.sleep(2)
-
-                # go to IMDB homepage
-                success, status_code, url, driver, wait = EH.get_page_with_retries('https://www.imdb.com/', driver, wait)
-                if not success:
-                    # Page failed to load, raise an exception
-                    raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
-
-                time.sleep(2)
-                
-                # Wait for document ready state after navigation
-                WebDriverWait(driver, 10).until(lambda d: d.execute_script("return document.readyState") == "complete")
-
-                # Check if signed in after login attempt using multiple methods
-                signed_in = False
-                try:
-                    # Use JavaScript to check for sign-in indicators
-                    sign_in_check_js = """
-                    return (function() {
-                        var userMenuSelectors = [
-                            '.nav__userMenu',
-                            '.navbar__user',
-                            '[data-testid="user-menu"]',
-                            '.imdb-header__accountmenu',
-                            '.nav__userMenu .navbar__user-menu-toggle__button',
-                            '.nav__userMenu.navbar__user'
-                        ];
-                        
-                        for (var i = 0; i < userMenuSelectors.length; i++) {
-                            var elements = document.querySelectorAll(userMenuSelectors[i]);
-                            if (elements && elements.length > 0 && elements[0].offsetParent !== null) {
-                                return true;
-                            }
-                        }
-                        
-                        // Check if we're redirected away from sign-in page
-                        if (!window.location.href.includes('signin') && !window.location.href.includes('sign-in')) {
-                            var signInButton = document.querySelector('a[href*="signin"], a[href*="sign-in"]');
-                            if (!signInButton || signInButton.offsetParent === null) {
-                                return true;  // No sign-in button visible, likely signed in
-                            }
-                        }
-                        
-                        return false;
-                    })();
-                    """
-                    signed_in = driver.execute_script(sign_in_check_js)
-                    
-                    # Fallback: Try CSS selectors with shorter timeout
-                    if not signed_in:
-                        short_wait = WebDriverWait(driver, 5)
-                        selectors_to_try = [
-                            ".nav__userMenu .navbar__user-menu-toggle__button",
-                            ".nav__userMenu.navbar__user",
-                            ".nav__userMenu",
-                            "[data-testid='user-menu']",
-                            ".imdb-header__accountmenu",
-                            "a[href*='/user/']"
-                        ]
-                        
-                        for selector in selectors_to_try:
-                            try:
-                                element = short_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                                if element.is_displayed():
-                                    signed_in = True
-                                    break
-                            except (TimeoutException, NoSuchElementException):
-                                continue
-                                
-                except Exception as e:
-                    print(f"Could not verify sign-in status after login: {e}")
-                    # Assume not signed in and let error handling below handle it
-                    signed_in = False
-                
-                if signed_in:
-                    print("Successfully signed in to IMDB")
-                else:
-                    print("\nError: Not signed in to IMDB")
-                    print("\nPossible Causes and Solutions:")
-                    print("- IMDB captcha check triggered or incorrect IMDB login.")
-                    
-                    print("\n1. IMDB Captcha Check:")
-                    print("   If your login is correct, the issue is likely due to an IMDB captcha check.")
-                    print("   To resolve this, follow these steps:")
-                    print("   - Log in to IMDB on your browser (preferably Chrome) and on the same computer.")
-                    print("   - If already logged in, log out and log back in.")
-                    print("   - Repeat this process until a captcha check is triggered.")
-                    print("   - Complete the captcha and finish logging in.")
-                    print("   - After successfully logging in, run the script again.")
-                    print("   - You may need to repeat these steps until the captcha check is no longer triggered.")
-                    
-                    print("\n2. Incorrect IMDB Login:")
-                    print("   If your IMDB login is incorrect, update your login credentials:")
-                    print("   - Edit the 'credentials.txt' file in your settings directory with the correct login information.")
-                    print("   - Alternatively, delete the 'credentials.txt' file and run the script again.")
-                    
-                    print("\nFor more details, see the following GitHub link:")
-                    print("https://github.com/RileyXX/IMDB-Trakt-Syncer/issues/2")
-                    
-                    print("\nStopping script...")
-                    
-                    EL.logger.error("Error: Not signed in to IMDB")
-                    driver.close()
-                    driver.quit()
-                    service.stop()
-                    raise SystemExit
-            
-            # Check IMDB Language for compatability
-            # Get Current Language
-            language_element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "span[id*='nav-language-selector-contents'] .selected"))).get_attribute("aria-label")
-            original_language = language_element
-            if (original_language != "English (United States)"):
-                print("Temporarily changing IMDB Language to English for compatability. See: https://www.imdb.com/preferences/general")
-                # Open Language Dropdown
-                language_dropdown = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "label[for*='nav-language-selector']")))
-                driver.execute_script("arguments[0].click();", language_dropdown)
-                # Change Language to English
-                english_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "span[id*='nav-language-selector-contents'] li[aria-label*='English (United States)']")))
-                driver.execute_script("arguments[0].click();", english_element)
-            
-            # Check IMDB reference view setting for compatability. See: https://www.imdb.com/preferences/general
-            reference_view_changed = False
-            try:
-                # Load page
-                success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/preferences/general', driver, wait, total_wait_time=30)
-                if success:
-                    # Try to find reference view checkbox (with short timeout since IMDB may have removed this)
-                    try:
-                        reference_checkbox = WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, "input[id*='reference-view-toggle']"))
-                        ).get_attribute("checked")
-                        
-                        if reference_checkbox:
-                            print("Temporarily disabling reference view IMDB setting for compatability. See: https://www.imdb.com/preferences/general")
-                            # Click reference view checkbox
-                            reference_checkbox_elem = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[id*='reference-view-toggle']")))
-                            driver.execute_script("arguments[0].click();", reference_checkbox_elem)
-                            # Submit
-                            submit = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".article input[type*='submit']")))
-                            driver.execute_script("arguments[0].click();", submit)
-                            reference_view_changed = True
-                            time.sleep(1)
-                    except (TimeoutException, NoSuchElementException):
-                        # Reference view setting not found - IMDB may have removed it or changed the UI
-                        # This is fine, just continue without it
-                        pass
-            except Exception as e:
-                # If there's any error accessing the preferences page, log it but continue
-                print(f"Note: Could not check IMDB reference view setting (page may have changed). Continuing...")
-                EL.logger.warning(f"Failed to access IMDB preferences: {e}")
-                
-            # Initalize list values
-            trakt_watchlist = trakt_ratings = trakt_reviews = trakt_watch_history = imdb_watchlist = imdb_ratings = imdb_reviews = imdb_watch_history = []
-            
-            # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE: Processing Trakt Data (fast API calls)
-            # ═══════════════════════════════════════════════════════════════════════════
-            print('\n🎬 Processing Trakt Data', flush=True)
-            print('─' * 24, flush=True)
-            trakt_start_time = time.time()
-            
-            print('  • Fetching user profile...', flush=True)
-            trakt_encoded_username = traktData.get_trakt_encoded_username()
-            
-            if sync_watchlist_value or remove_watched_from_watchlists_value:
-                print('  • Loading watchlist...', end='', flush=True)
-                trakt_watchlist = traktData.get_trakt_watchlist(trakt_encoded_username)
-                print(f' ✓ {len(trakt_watchlist)} items', flush=True)
-            
-            if sync_ratings_value or mark_rated_as_watched_value:
-                print('  • Loading ratings...', end='', flush=True)
-                trakt_ratings = traktData.get_trakt_ratings(trakt_encoded_username)
-                print(f' ✓ {len(trakt_ratings)} items', flush=True)
-            
-            if sync_reviews_value:
-                print('  • Loading reviews/comments...', end='', flush=True)
-                trakt_reviews = traktData.get_trakt_comments(trakt_encoded_username)
-                print(f' ✓ {len(trakt_reviews)} items', flush=True)
-            
-            if sync_watch_history_value or remove_watched_from_watchlists_value or mark_rated_as_watched_value:
-                print('  • Loading watch history...', end='', flush=True)
-                trakt_watch_history = traktData.get_trakt_watch_history(trakt_encoded_username)
-                print(f' ✓ {len(trakt_watch_history)} items', flush=True)
-            
-            trakt_elapsed = time.time() - trakt_start_time
-            print(f'  ✓ Trakt data loaded ({trakt_elapsed:.1f}s)', flush=True)
-            
-            # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE: Processing IMDB Data (export generation + CSV parsing)
-            # ═══════════════════════════════════════════════════════════════════════════
-            print('\n🎥 Processing IMDB Data', flush=True)
-            print('─' * 23, flush=True)
-            imdb_start_time = time.time()
-            
-            print('  • Requesting IMDB data exports (this may take a few minutes)...', flush=True)
-            driver, wait = imdbData.generate_imdb_exports(driver, wait, directory, sync_watchlist_value, sync_ratings_value, sync_watch_history_value, remove_watched_from_watchlists_value, mark_rated_as_watched_value)
-            
-            print('  • Downloading IMDB export files...', flush=True)
-            driver, wait = imdbData.download_imdb_exports(driver, wait, directory, sync_watchlist_value, sync_ratings_value, sync_watch_history_value, remove_watched_from_watchlists_value, mark_rated_as_watched_value)
-            
-            print('  • Parsing downloaded CSV files...', flush=True)
-            if sync_watchlist_value or remove_watched_from_watchlists_value:
-                print('    • Parsing watchlist...', end='', flush=True)
-                imdb_watchlist, imdb_watchlist_size, driver, wait = imdbData.get_imdb_watchlist(driver, wait, directory)
-                print(f' ✓ {imdb_watchlist_size} items', flush=True)
-            
-            if sync_ratings_value or mark_rated_as_watched_value:
-                print('    • Parsing ratings...', end='', flush=True)
-                imdb_ratings, driver, wait = imdbData.get_imdb_ratings(driver, wait, directory)
-                print(f' ✓ {len(imdb_ratings)} items', flush=True)
-            
-            if sync_reviews_value:
-                print('    • Fetching reviews (via web scraping)...', end='', flush=True)
-                imdb_reviews, errors_found_getting_imdb_reviews, driver, wait = imdbData.get_imdb_reviews(driver, wait, directory)
-                print(f' ✓ {len(imdb_reviews)} items', flush=True)
-            
-            if sync_watch_history_value or remove_watched_from_watchlists_value or mark_rated_as_watched_value:
-                print('    • Parsing watch history...', end='', flush=True)
-                imdb_watch_history, imdb_watch_history_size, driver, wait = imdbData.get_imdb_checkins(driver, wait, directory)
-                print(f' ✓ {imdb_watch_history_size} items', flush=True)
-            
-            imdb_elapsed = time.time() - imdb_start_time
-            print(f'  ✓ IMDB data loaded ({imdb_elapsed:.1f}s)', flush=True)
-            
-            # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE: Analyzing & Comparing Data
-            # ═══════════════════════════════════════════════════════════════════════════
-            print('\n📊 Analyzing & Comparing Data', flush=True)
-            print('─' * 30, flush=True)
-            analysis_start_time = time.time()
-            
-            print('  • Checking list limits...', flush=True)
-            if sync_watchlist_value:
-                # Check if IMDB watchlist has reached the 10,000 item limit. If limit is reached, disable syncing watchlists.
-                imdb_watchlist_limit_reached = EH.check_if_watchlist_limit_reached(imdb_watchlist_size)
-                              
-            if sync_watch_history_value or mark_rated_as_watched_value:
-                # Check if IMDB watch history has reached the 10,000 item limit. If limit is reached, disable syncing watch history.
-                imdb_watch_history_limit_reached = EH.check_if_watch_history_limit_reached(imdb_watch_history_size)
-            
-            print('  • Removing duplicates & filtering invalid items...', flush=True)
-            # Remove duplicates from Trakt watch_history
-            trakt_watch_history = EH.remove_duplicates_by_imdb_id(trakt_watch_history)
-                       
-            # Get trakt and imdb data and filter out items with missing imdb id
-            trakt_ratings = [rating for rating in trakt_ratings if rating.get('IMDB_ID') is not None]
-            imdb_ratings = [rating for rating in imdb_ratings if rating.get('IMDB_ID') is not None]
-            trakt_reviews = [review for review in trakt_reviews if review.get('IMDB_ID') is not None]
-            imdb_reviews = [review for review in imdb_reviews if review.get('IMDB_ID') is not None]
-            trakt_watchlist = [item for item in trakt_watchlist if item.get('IMDB_ID') is not None]
-            imdb_watchlist = [item for item in imdb_watchlist if item.get('IMDB_ID') is not None]
-            trakt_watch_history = [item for item in trakt_watch_history if item.get('IMDB_ID') is not None]
-            imdb_watch_history = [item for item in imdb_watch_history if item.get('IMDB_ID') is not None]
-            
-            # Remove unknown Types from review lists
-            imdb_reviews, trakt_reviews = EH.remove_unknown_types(imdb_reviews, trakt_reviews)
-            
-            # ── Resolve conflicting IMDB IDs (fast HEAD requests with caching) ──
-            print('  • Resolving conflicting IMDB IDs (using fast cached resolution)...', flush=True)
-            EH.clear_imdb_id_cache()  # Start fresh for this sync session
-            
-            # Update outdated IMDB_IDs from trakt lists based on matching Title and Type comparison
-            if sync_ratings_value:
-                trakt_ratings, imdb_ratings, driver, wait = EH.update_outdated_imdb_ids_from_trakt(trakt_ratings, imdb_ratings, driver, wait, list_name="ratings")
-            if sync_reviews_value:
-                trakt_reviews, imdb_reviews, driver, wait = EH.update_outdated_imdb_ids_from_trakt(trakt_reviews, imdb_reviews, driver, wait, list_name="reviews")
-            if sync_watchlist_value:
-                trakt_watchlist, imdb_watchlist, driver, wait = EH.update_outdated_imdb_ids_from_trakt(trakt_watchlist, imdb_watchlist, driver, wait, list_name="watchlist")
-            if sync_watch_history_value or mark_rated_as_watched_value:
-                trakt_watch_history, imdb_watch_history, driver, wait = EH.update_outdated_imdb_ids_from_trakt(trakt_watch_history, imdb_watch_history, driver, wait, list_name="watch history")
-            
-            '''
-            # Removed temporarily to monitor impact. Most conflicts should be resolved by update_outdated_imdb_ids_from_trakt() function
-            # Filter out items that share the same Title, Year and Type, AND have non-matching IMDB_ID values
-            trakt_ratings, imdb_ratings = EH.filter_out_mismatched_items(trakt_ratings, imdb_ratings)
-            trakt_reviews, imdb_reviews = EH.filter_out_mismatched_items(trakt_reviews, imdb_reviews)
-            trakt_watchlist, imdb_watchlist = EH.filter_out_mismatched_items(trakt_watchlist, imdb_watchlist)
-            trakt_watch_history, imdb_watch_history = EH.filter_out_mismatched_items(trakt_watch_history, imdb_watch_history)
-            '''
-            
-            # ── Finding items to sync ──
-            print('  • Comparing lists to find items to sync...', flush=True)
-            
-            # Filter out items already set: Filters items from the target_list that are not already present in the source_list based on key
-            imdb_ratings_to_set = EH.filter_items(imdb_ratings, trakt_ratings, key="IMDB_ID")
-            trakt_ratings_to_set = EH.filter_items(trakt_ratings, imdb_ratings, key="IMDB_ID")
-
-            imdb_reviews_to_set = EH.filter_items(imdb_reviews, trakt_reviews, key="IMDB_ID")
-            trakt_reviews_to_set = EH.filter_items(trakt_reviews, imdb_reviews, key="IMDB_ID")
-
-            imdb_watchlist_to_set = EH.filter_items(imdb_watchlist, trakt_watchlist, key="IMDB_ID")
-            trakt_watchlist_to_set = EH.filter_items(trakt_watchlist, imdb_watchlist, key="IMDB_ID")
-
-            imdb_watch_history_to_set = EH.filter_items(imdb_watch_history, trakt_watch_history, key="IMDB_ID")
-            trakt_watch_history_to_set = EH.filter_items(trakt_watch_history, imdb_watch_history, key="IMDB_ID")
-            
-            if mark_rated_as_watched_value:
-                # Combine Trakt and IMDB Ratings into one list
-                combined_ratings = trakt_ratings + imdb_ratings
-
-                # Remove duplicates from combined_ratings by IMDB_ID
-                combined_ratings = EH.remove_duplicates_by_imdb_id(combined_ratings)
-
-                # Loop through combined ratings and check if they are already in both watch histories
-                for item in combined_ratings:
-                    imdb_id = item['IMDB_ID']
-
-                    # Skip items with 'Type' as 'show' (shows cannot be marked as watched on Trakt)
-                    if item['Type'] == 'show':
-                        continue
-                    
-                    # Check if this imdb_id exists in both trakt_watch_history and imdb_watch_history
-                    if not any(imdb_id == watch_item['IMDB_ID'] for watch_item in trakt_watch_history) and \
-                       not any(imdb_id == watch_item['IMDB_ID'] for watch_item in imdb_watch_history):
-                        # If not found in both, add to the appropriate watch history to set list
-                        trakt_watch_history_to_set.append(item)
-                        imdb_watch_history_to_set.append(item)
-                        trakt_watch_history.append(item)
-                        imdb_watch_history.append(item)
-                        
-                        # Remove duplicates from trakt and imdb watch history (in case items added with mark_rated_as_watched_value)
-                        trakt_watch_history = EH.remove_duplicates_by_imdb_id(trakt_watch_history)
-                        imdb_watch_history = EH.remove_duplicates_by_imdb_id(imdb_watch_history)
-            
-            # Skip adding shows to trakt watch history, because it will mark all episodes as watched
-            trakt_watch_history_to_set = EH.remove_shows(trakt_watch_history_to_set)
-            
-            # Filter ratings to update
-            imdb_ratings_to_update = []
-            trakt_ratings_to_update = []
-
-            # Dictionary to store IMDB_IDs and their corresponding ratings for IMDB and Trakt
-            imdb_ratings_dict = {rating['IMDB_ID']: rating for rating in imdb_ratings}
-            trakt_ratings_dict = {rating['IMDB_ID']: rating for rating in trakt_ratings}
-
-            # Include only items with the same IMDB_ID and different ratings and prefer the most recent rating
-            for imdb_id, imdb_rating in imdb_ratings_dict.items():
-                if imdb_id in trakt_ratings_dict:
-                    trakt_rating = trakt_ratings_dict[imdb_id]
-                    if imdb_rating['Rating'] != trakt_rating['Rating']:
-                        imdb_date_added = datetime.fromisoformat(imdb_rating['Date_Added'].replace('Z', '')).replace(tzinfo=timezone.utc)
-                        trakt_date_added = datetime.fromisoformat(trakt_rating['Date_Added'].replace('Z', '')).replace(tzinfo=timezone.utc)
-                        
-                        # Check if ratings were added on different days
-                        if (imdb_date_added.year, imdb_date_added.month, imdb_date_added.day) != (trakt_date_added.year, trakt_date_added.month, trakt_date_added.day):
-                            # If IMDB rating is more recent, add the Trakt rating to the update list, and vice versa
-                            if imdb_date_added > trakt_date_added:
-                                trakt_ratings_to_update.append(imdb_rating)
-                            else:
-                                imdb_ratings_to_update.append(trakt_rating)
-
-            # Update ratings_to_set
-            imdb_ratings_to_set.extend(imdb_ratings_to_update)
-            trakt_ratings_to_set.extend(trakt_ratings_to_update)
-            
-            # Filter out setting review IMDB where the comment length is less than 600 characters
-            imdb_reviews_to_set = EH.filter_by_comment_length(imdb_reviews_to_set, 600)
-            
-            # Initialize watchlist_items_to_remove variables
-            trakt_watchlist_items_to_remove = []
-            imdb_watchlist_items_to_remove = []
-            
-            # If remove_watched_from_watchlists_value is true
-            if remove_watched_from_watchlists_value:
-                # Combine Trakt and IMDB Watch History into one list
-                watched_content = trakt_watch_history + imdb_watch_history
-                
-                # Remove duplicates from watched_content
-                watched_content = EH.remove_duplicates_by_imdb_id(watched_content)
-                
-                # Get the IDs from watched_content
-                watched_content_ids = set(item['IMDB_ID'] for item in watched_content if item['IMDB_ID'])
-                        
-                # Filter out watched content from trakt_watchlist_to_set
-                trakt_watchlist_to_set = [item for item in trakt_watchlist_to_set if item['IMDB_ID'] not in watched_content_ids]
-                # Filter out watched content from imdb_watchlist_to_set
-                imdb_watchlist_to_set = [item for item in imdb_watchlist_to_set if item['IMDB_ID'] not in watched_content_ids]
-                
-                # Find items to remove from trakt_watchlist
-                trakt_watchlist_items_to_remove = [item for item in trakt_watchlist if item['IMDB_ID'] in watched_content_ids]
-                # Find items to remove from imdb_watchlist
-                imdb_watchlist_items_to_remove = [item for item in imdb_watchlist if item['IMDB_ID'] in watched_content_ids]
-                
-                # Sort lists by date
-                trakt_watchlist_items_to_remove = EH.sort_by_date_added(trakt_watchlist_items_to_remove)
-                imdb_watchlist_items_to_remove = EH.sort_by_date_added(imdb_watchlist_items_to_remove)
-            
-            # If remove_watchlist_items_older_than_x_days_value is true, add items older than x days to watchlist_items_to_remove lists
-            if remove_watchlist_items_older_than_x_days_value:
-                days = watchlist_days_to_remove_value
-                
-                combined_watchlist = trakt_watchlist + imdb_watchlist
-                combined_watchlist = EH.remove_duplicates_by_imdb_id(combined_watchlist)
-                
-                # Get items older than x days
-                combined_watchlist_to_remove = EH.get_items_older_than_x_days(combined_watchlist, days)
-                
-                # Append items to remove to the watchlist_items_to_remove lists
-                trakt_watchlist_items_to_remove.extend(combined_watchlist_to_remove)
-                imdb_watchlist_items_to_remove.extend(combined_watchlist_to_remove)
-                
-                # Remove combined_watchlist_to_remove items from watchlist_to_set lists
-                imdb_watchlist_to_set, trakt_watchlist_to_set = EH.remove_combined_watchlist_to_remove_items_from_watchlist_to_set_lists_by_imdb_id(combined_watchlist_to_remove, imdb_watchlist_to_set, trakt_watchlist_to_set)
-            
-            # Sort lists by date
-            print('  • Sorting items by date...', flush=True)
-            imdb_ratings_to_set = EH.sort_by_date_added(imdb_ratings_to_set)
-            trakt_ratings_to_set = EH.sort_by_date_added(trakt_ratings_to_set)
-            imdb_watchlist_to_set = EH.sort_by_date_added(imdb_watchlist_to_set)
-            trakt_watchlist_to_set = EH.sort_by_date_added(trakt_watchlist_to_set)
-            imdb_watch_history_to_set = EH.sort_by_date_added(imdb_watch_history_to_set)
-            trakt_watch_history_to_set = EH.sort_by_date_added(trakt_watch_history_to_set)
-            
-            # ── Analysis complete - show summary ──
-            analysis_elapsed = time.time() - analysis_start_time
-            print(f'  ✓ Analysis complete ({analysis_elapsed:.1f}s)', flush=True)
-            
-            # Print sync summary
-            print('\n📋 Sync Summary', flush=True)
-            print('─' * 15, flush=True)
-            sync_summary = []
-            if sync_ratings_value:
-                sync_summary.append(f"  Ratings:       {len(trakt_ratings_to_set):>4} → Trakt | {len(imdb_ratings_to_set):>4} → IMDB")
-            if sync_watchlist_value:
-                sync_summary.append(f"  Watchlist:     {len(trakt_watchlist_to_set):>4} → Trakt | {len(imdb_watchlist_to_set):>4} → IMDB")
-            if sync_watch_history_value or mark_rated_as_watched_value:
-                sync_summary.append(f"  Watch History: {len(trakt_watch_history_to_set):>4} → Trakt | {len(imdb_watch_history_to_set):>4} → IMDB")
-            if sync_reviews_value:
-                sync_summary.append(f"  Reviews:       {len(trakt_reviews_to_set):>4} → Trakt | {len(imdb_reviews_to_set):>4} → IMDB")
-            if remove_watched_from_watchlists_value:
-                sync_summary.append(f"  Remove from WL:{len(trakt_watchlist_items_to_remove):>4} Trakt  | {len(imdb_watchlist_items_to_remove):>4} IMDB")
-            
-            for line in sync_summary:
-                print(line, flush=True)
-            
-            total_operations = (len(trakt_ratings_to_set) + len(imdb_ratings_to_set) + 
-                               len(trakt_watchlist_to_set) + len(imdb_watchlist_to_set) + 
-                               len(trakt_watch_history_to_set) + len(imdb_watch_history_to_set) +
-                               len(trakt_reviews_to_set) + len(imdb_reviews_to_set) +
-                               len(trakt_watchlist_items_to_remove) + len(imdb_watchlist_items_to_remove))
-            if total_operations == 0:
-                print('\n  ✓ Everything is already in sync!', flush=True)
-            else:
-                print(f'\n  Total operations: {total_operations}', flush=True)
-            
-            if sync_watchlist_value and imdb_watchlist_limit_reached:
-                # IMDB watchlist limit reached, skip watchlist actions for IMDB
-                imdb_watchlist_to_set = []
-            
-            if sync_watch_history_value and imdb_watch_history_limit_reached:
-                # IMDB watch history limit reached, skip watch history actions for IMDB
-                imdb_watch_history_to_set = []
-            
-            if mark_rated_as_watched_value and imdb_watch_history_limit_reached:
-                # IMDB watch history limit reached, skip watch history actions for IMDB
-                imdb_watch_history_to_set = []
-            
-            # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE: Syncing Data
-            # ═══════════════════════════════════════════════════════════════════════════
-            if total_operations > 0:
-                print('\n🔄 Syncing Data', flush=True)
-                print('─' * 15, flush=True)
-                sync_start_time = time.time()
-                        
-            # If sync_watchlist_value is true
-            if sync_watchlist_value:
-                # Set Trakt Watchlist Items (with batching for faster processing)
-                if trakt_watchlist_to_set:
-                    print('Setting Trakt Watchlist Items')
-
-                    # Count the total number of items
-                    num_items = len(trakt_watchlist_to_set)
-                    
-                    # Process items in batches
-                    url = f"https://api.trakt.tv/sync/watchlist"
-                    
-                    # Group items by type for better batching
-                    batch = {
-                        "movies": [],
-                        "shows": [],
-                        "episodes": []
-                    }
-                    
-                    items_in_batch = []
-                    batch_count = 0
-                    processed_count = 0
-                    
-                    for item in trakt_watchlist_to_set:
-                        imdb_id = item['IMDB_ID']
-                        media_type = item['Type']  # 'movie', 'show', or 'episode'
-                        
-                        # Prepare item data
-                        item_data = {
-                            "ids": {
-                                "imdb": imdb_id
-                            }
-                        }
-                        
-                        if media_type == 'movie':
-                            batch['movies'].append(item_data)
-                        elif media_type == 'show':
-                            batch['shows'].append(item_data)
-                        elif media_type == 'episode':
-                            batch['episodes'].append(item_data)
-                        else:
-                            continue
-                        
-                        items_in_batch.append(item)
-                        
-                        # Send batch when it reaches the batch size
-                        if len(batch['movies']) + len(batch['shows']) + len(batch['episodes']) >= TRAKT_BATCH_SIZE:
-                            batch_count += 1
-                            response = EH.make_trakt_request(url, payload=batch)
-                            
-                            if response and response.status_code in [200, 201, 204]:
-                                # Print all items in batch
-                                for item in items_in_batch:
-                                    processed_count += 1
-                                    season_number = item.get('SeasonNumber')
-                                    episode_number = item.get('EpisodeNumber')
-                                    if season_number and episode_number:
-                                        season_number = str(season_number).zfill(2)
-                                        episode_number = str(episode_number).zfill(2)
-                                        episode_title = f'[S{season_number}E{episode_number}] '
-                                    else:
-                                        episode_title = ''
-                                    print(f" - Added {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) to Trakt Watchlist ({item['IMDB_ID']})")
-                            else:
-                                # Print errors for failed items
-                                for item in items_in_batch:
-                                    processed_count += 1
-                                    season_number = item.get('SeasonNumber')
-                                    episode_number = item.get('EpisodeNumber')
-                                    if season_number and episode_number:
-                                        season_number = str(season_number).zfill(2)
-                                        episode_number = str(episode_number).zfill(2)
-                                        episode_title = f'[S{season_number}E{episode_number}] '
-                                    else:
-                                        episode_title = ''
-                                    error_message = f"Failed to add {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) to Trakt Watchlist ({item['IMDB_ID']})"
-                                    print(f"   - {error_message}")
-                                    EL.logger.error(error_message)
-                            
-                            # Reset batch
-                            batch = {
-                                "movies": [],
-                                "shows": [],
-                                "episodes": []
-                            }
-                            items_in_batch = []
-                            
-                            # Small delay between batches to avoid rate limiting
-                            if batch_count % 10 == 0:  # Every 10 batches (500 items)
-                                time.sleep(TRAKT_BATCH_DELAY * 2)
-                            else:
-                                time.sleep(TRAKT_BATCH_DELAY)
-                    
-                    # Send remaining items in final batch
-                    if len(batch['movies']) + len(batch['shows']) + len(batch['episodes']) > 0:
-                        batch_count += 1
-                        response = EH.make_trakt_request(url, payload=batch)
-                        
-                        if response and response.status_code in [200, 201, 204]:
-                            # Print all items in final batch
-                            for item in items_in_batch:
-                                processed_count += 1
-                                season_number = item.get('SeasonNumber')
-                                episode_number = item.get('EpisodeNumber')
-                                if season_number and episode_number:
-                                    season_number = str(season_number).zfill(2)
-                                    episode_number = str(episode_number).zfill(2)
-                                    episode_title = f'[S{season_number}E{episode_number}] '
-                                else:
-                                    episode_title = ''
-                                print(f" - Added {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) to Trakt Watchlist ({item['IMDB_ID']})")
-                        else:
-                            # Print errors for failed items
-                            for item in items_in_batch:
-                                processed_count += 1
-                                season_number = item.get('SeasonNumber')
-                                episode_number = item.get('EpisodeNumber')
-                                if season_number and episode_number:
-                                    season_number = str(season_number).zfill(2)
-                                    episode_number = str(episode_number).zfill(2)
-                                    episode_title = f'[S{season_number}E{episode_number}] '
-                                else:
-                                    episode_title = ''
-                                error_message = f"Failed to add {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) to Trakt Watchlist ({item['IMDB_ID']})"
-                                print(f"   - {error_message}")
-                                EL.logger.error(error_message)
-
-                    print(f'Setting Trakt Watchlist Items Complete (Processed {processed_count} items in {batch_count} batch(es))')
-                else:
-                    print('No Trakt Watchlist Items To Set')
-
-                # Set IMDB Watchlist Items
-                if imdb_watchlist_to_set:
-                    print('Setting IMDB Watchlist Items')
-                    
-                    # Count the total number of items
-                    num_items = len(imdb_watchlist_to_set)
-                    item_count = 0
-                    consecutive_api_failures = 0
-                                    
-                    for item in imdb_watchlist_to_set:
-                        item_count += 1
-                        season_number = item.get('SeasonNumber')
-                        episode_number = item.get('EpisodeNumber')
-                        if season_number and episode_number:
-                            season_number = str(season_number).zfill(2)
-                            episode_number = str(episode_number).zfill(2)
-                            episode_title = f'[S{season_number}E{episode_number}] '
-                        else:
-                            episode_title = ''
-                        
-                        year_str = f' ({item["Year"]})' if item["Year"] is not None else '' # sometimes year is None for episodes from trakt so remove it from the print string
-                        
-                        # Fast path: use IMDB's AJAX watchlist endpoint first, then fall back to Selenium UI if needed
-                        api_succeeded = False
-                        if consecutive_api_failures < IMDB_API_FAILURE_LIMIT:
-                            try:
-                                api_succeeded, status_code, api_error = add_to_imdb_watchlist_via_api(driver, item["IMDB_ID"])
-                                if api_succeeded:
-                                    consecutive_api_failures = 0
-                                    print(f" - Added {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) [API]")
-                                    
-                                    # Respect IMDB API rules with lightweight throttling
-                                    if item_count % 10 == 0:
-                                        time.sleep(IMDB_BATCH_DELAY)
-                                    else:
-                                        time.sleep(IMDB_API_DELAY)
-                                    
-                                    continue  # Move to the next item without opening the page
-                                else:
-                                    consecutive_api_failures += 1
-                                    if api_error:
-                                        EL.logger.warning(f"Fast IMDB add failed for {item['IMDB_ID']} (status {status_code}): {api_error}. Falling back to Selenium...")
-                            except Exception as e:
-                                consecutive_api_failures += 1
-                                EL.logger.warning(f"API add exception for {item['IMDB_ID']}: {e}. Falling back to Selenium...")
-                        
-                        # If we reach here, API either failed or is disabled - use Selenium UI
-                        if item_count == 1:
-                            print(f"  → Using Selenium UI method (API fast-path: {consecutive_api_failures} failures)")
-                        
-                        try:
-                            # Load page with better error handling
-                            try:
-                                success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/title/{item["IMDB_ID"]}/', driver, wait, total_wait_time=60)
-                                if not success:
-                                    # Page failed to load, log and skip
-                                    error_message = f"Failed to add item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - Page load failed (status {status_code})"
-                                    print(f" - {error_message}")
-                                    EL.logger.error(error_message)
-                                    continue
-                            except KeyboardInterrupt:
-                                # User wants to stop - re-raise to stop the entire script
-                                raise
-                            except Exception as e:
-                                error_message = f"Failed to add item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - Exception: {e}"
-                                print(f" - {error_message}")
-                                EL.logger.error(error_message)
-                                continue
-                            
-                            current_url = driver.current_url
-                            
-                            # Check if the URL doesn't contain "/reference"
-                            if "/reference" not in current_url:
-                                try:
-                                    # Wait until the loader has disappeared, indicating the watchlist button has loaded
-                                    wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, '[data-testid="tm-box-wl-loader"]')))
-                                except TimeoutException:
-                                    # Loader not found or already gone - that's fine, continue
-                                    pass
-                                
-                                # Find and check watchlist button with stale element retry
-                                max_stale_retries = 3
-                                stale_retry = 0
-                                button_clicked = False
-                                
-                                while stale_retry < max_stale_retries and not button_clicked:
-                                    try:
-                                        # Try multiple selectors for the watchlist button
-                                        watchlist_button = None
-                                        selectors = [
-                                            'div.sc-dcb1530e-3:nth-child(2)',           # Updated IMDB selector (2024)
-                                            'button[data-testid="tm-box-wl-button"]',  # Primary selector
-                                            'button[aria-label*="watchlist" i]',        # Backup: aria-label contains "watchlist"
-                                            'button.ipc-split-button__btn--add',       # Backup: Add to watchlist button class
-                                            '[data-testid="title-actions-menu"] button', # Backup: Actions menu button
-                                            'div[class*="sc-"][class*="-3"]',          # Generic pattern for IMDB dynamic classes
-                                        ]
-                                        
-                                        # Also try XPath as last resort
-                                        xpath_selector = '/html/body/div[2]/main/div/section[1]/section/div[3]/section/section/div[3]/div[2]/div[2]/div[3]/div[2]'
-                                        
-                                        for selector in selectors:
-                                            try:
-                                                watchlist_button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                                                if watchlist_button:
-                                                    EL.logger.info(f"Found watchlist button using selector: {selector}")
-                                                    break
-                                            except (TimeoutException, NoSuchElementException):
-                                                continue
-                                        
-                                        # If CSS selectors failed, try XPath
-                                        if not watchlist_button:
-                                            try:
-                                                watchlist_button = wait.until(EC.presence_of_element_located((By.XPATH, xpath_selector)))
-                                                if watchlist_button:
-                                                    EL.logger.info(f"Found watchlist button using XPath")
-                                            except (TimeoutException, NoSuchElementException):
-                                                pass
-                                        
-                                        if not watchlist_button:
-                                            # Could not find watchlist button with any selector
-                                            error_message = f"Failed to add item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - Watchlist button not found on page"
-                                            print(f" - {error_message}")
-                                            EL.logger.error(f"{error_message}. Current URL: {driver.current_url}")
-                                            break
-                                        
-                                        # Element found, scroll into view
-                                        driver.execute_script("arguments[0].scrollIntoView(true);", watchlist_button)
-                                        
-                                        # Small wait for any animations
-                                        time.sleep(0.3)
-                                        
-                                        # Re-find after scroll to ensure element is fresh (use the same selector that worked)
-                                        working_selector = None
-                                        working_selector_type = "CSS"
-                                        
-                                        for selector in selectors:
-                                            try:
-                                                watchlist_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                                                if watchlist_button:
-                                                    working_selector = selector
-                                                    break
-                                            except (TimeoutException, NoSuchElementException):
-                                                continue
-                                        
-                                        # If CSS selectors failed, try XPath
-                                        if not watchlist_button:
-                                            try:
-                                                watchlist_button = wait.until(EC.element_to_be_clickable((By.XPATH, xpath_selector)))
-                                                if watchlist_button:
-                                                    working_selector = xpath_selector
-                                                    working_selector_type = "XPATH"
-                                            except (TimeoutException, NoSuchElementException):
-                                                pass
-                                        
-                                        # Check if item is already in watchlist
-                                        button_html = watchlist_button.get_attribute('innerHTML')
-                                        button_text = watchlist_button.text.lower() if watchlist_button.text else ""
-                                        
-                                        # Check multiple indicators that item is already in watchlist
-                                        already_in_watchlist = (
-                                            'ipc-icon--done' in button_html or 
-                                            'checkmark' in button_html.lower() or
-                                            'in watchlist' in button_text or
-                                            'added' in button_text
-                                        )
-                                        
-                                        if already_in_watchlist:
-                                            error_message1 = f" - Skipped item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} - Already in IMDB watchlist ({item['IMDB_ID']})"
-                                            print(error_message1)
-                                            EL.logger.info(error_message1)
-                                            button_clicked = True
-                                            break
-                                        
-                                        # Click the button
-                                        retry_count = 0
-                                        while retry_count < 2:
-                                            try:
-                                                # Re-find button right before clicking to minimize staleness
-                                                watchlist_button = None
-                                                if working_selector_type == "CSS":
-                                                    for selector in selectors:
-                                                        try:
-                                                            watchlist_button = driver.find_element(By.CSS_SELECTOR, selector)
-                                                            if watchlist_button:
-                                                                break
-                                                        except NoSuchElementException:
-                                                            continue
-                                                else:  # XPATH
-                                                    try:
-                                                        watchlist_button = driver.find_element(By.XPATH, xpath_selector)
-                                                    except NoSuchElementException:
-                                                        pass
-                                                
-                                                if not watchlist_button:
-                                                    raise NoSuchElementException("Watchlist button disappeared")
-                                                
-                                                driver.execute_script("arguments[0].click();", watchlist_button)
-                                                
-                                                # Wait for success indicator (check multiple possible indicators)
-                                                def check_success(driver):
-                                                    try:
-                                                        # Try to find the button again and check if it changed
-                                                        if working_selector_type == "CSS":
-                                                            btn = driver.find_element(By.CSS_SELECTOR, working_selector)
-                                                        else:
-                                                            btn = driver.find_element(By.XPATH, working_selector)
-                                                        
-                                                        html = btn.get_attribute('innerHTML')
-                                                        text = btn.text.lower() if btn.text else ""
-                                                        return ('ipc-icon--done' in html or 
-                                                               'checkmark' in html.lower() or 
-                                                               'in watchlist' in text or
-                                                               'added' in text)
-                                                    except:
-                                                        return False
-                                                
-                                                WebDriverWait(driver, 5).until(check_success)
-                                                
-                                                print(f" - Added {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) [Selenium]")
-                                                
-                                                # Small delay between operations to avoid being flagged
-                                                if item_count % 10 == 0:  # Every 10 items, slightly longer delay
-                                                    time.sleep(IMDB_BATCH_DELAY)
-                                                else:
-                                                    time.sleep(IMDB_OPERATION_DELAY)
-                                                
-                                                button_clicked = True
-                                                break  # Break the loop if successful
-                                            except (TimeoutException, NoSuchElementException) as e:
-                                                retry_count += 1
-                                                if retry_count >= 2:
-                                                    error_message = f"Failed to add item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - Button click timeout or element disappeared"
-                                                    print(f" - {error_message}")
-                                                    EL.logger.error(f"{error_message}. Exception: {e}")
-                                                    button_clicked = True
-                                                else:
-                                                    time.sleep(0.5)  # Wait before retry
-                                        
-                                        break  # Exit stale retry loop if we got this far
-                                        
-                                    except Exception as e:
-                                        # Handle stale element or other errors
-                                        if 'stale element' in str(e).lower():
-                                            stale_retry += 1
-                                            if stale_retry >= max_stale_retries:
-                                                error_message = f"Failed to add item ({item_count} of {num_items}) after {max_stale_retries} retries: {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']})"
-                                                print(f" - {error_message}")
-                                                EL.logger.error(error_message)
-                                            else:
-                                                time.sleep(0.5)  # Wait before retry
-                                        else:
-                                            raise  # Re-raise if it's not a stale element error
-                            else:
-                                # Handle the case when the URL contains "/reference"
-                                
-                                # Scroll the page to bring the element into view
-                                watchlist_button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.titlereference-watch-ribbon > .wl-ribbon')))
-                                driver.execute_script("arguments[0].scrollIntoView(true);", watchlist_button)
-                                
-                                # Check if watchlist_button has class .not-inWL before clicking
-                                if 'not-inWL' in watchlist_button.get_attribute('class'):
-                                    driver.execute_script("arguments[0].click();", watchlist_button)
-                            
-                        except KeyboardInterrupt:
-                            # User pressed Ctrl+C - stop the script
-                            raise
-                        except (NoSuchElementException, TimeoutException, PageLoadException) as e:
-                            error_message = f"Failed to add item ({item_count} of {num_items}): {item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - {type(e).__name__}"
-                            print(f"  - {error_message}")
-                            EL.logger.error(error_message, exc_info=True)
-                        except Exception as e:
-                            error_message = f"Unexpected error adding item ({item_count} of {num_items}): {item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - {type(e).__name__}: {e}"
-                            print(f"  - {error_message}")
-                            EL.logger.error(error_message, exc_info=True)
-
-                    
-                    print('Setting IMDB Watchlist Items Complete')
-                else:
-                    print('No IMDB Watchlist Items To Set')
-             
-            # If sync_ratings_value is true
-            if sync_ratings_value:
-                
-                #Set Trakt Ratings (with batching for faster processing)
-                if trakt_ratings_to_set:
-                    print('Setting Trakt Ratings')
-
-                    # Set the API endpoints
-                    rate_url = "https://api.trakt.tv/sync/ratings"
-                    
-                    # Count the total number of items
-                    num_items = len(trakt_ratings_to_set)
-                    
-                    # Process items in batches
-                    batch = {
-                        "movies": [],
-                        "shows": [],
-                        "episodes": []
-                    }
-                    
-                    items_in_batch = []
-                    batch_count = 0
-                    processed_count = 0
-                    
-                    # Loop through your data table and rate each item on Trakt
-                    for item in trakt_ratings_to_set:
-                        item_data = {
-                            "ids": {
-                                "imdb": item["IMDB_ID"]
-                            },
-                            "rating": item["Rating"]
-                        }
-                        
-                        if item["Type"] == "show":
-                            batch['shows'].append(item_data)
-                        elif item["Type"] == "movie":
-                            batch['movies'].append(item_data)
-                        elif item["Type"] == "episode":
-                            batch['episodes'].append(item_data)
-                        else:
-                            continue
-                        
-                        items_in_batch.append(item)
-                        
-                        # Send batch when it reaches the batch size
-                        if len(batch['movies']) + len(batch['shows']) + len(batch['episodes']) >= TRAKT_BATCH_SIZE:
-                            batch_count += 1
-                            response = EH.make_trakt_request(rate_url, payload=batch)
-                            
-                            if response and response.status_code in [200, 201, 204]:
-                                # Print all items in batch
-                                for item in items_in_batch:
-                                    processed_count += 1
-                                    season_number = item.get('SeasonNumber')
-                                    episode_number = item.get('EpisodeNumber')
-                                    if season_number and episode_number:
-                                        season_number = str(season_number).zfill(2)
-                                        episode_number = str(episode_number).zfill(2)
-                                        episode_title = f'[S{season_number}E{episode_number}] '
-                                    else:
-                                        episode_title = ''
-                                    print(f" - Rated {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}): {item['Rating']}/10 on Trakt ({item['IMDB_ID']})")
-                            else:
-                                # Print errors for failed items
-                                for item in items_in_batch:
-                                    processed_count += 1
-                                    season_number = item.get('SeasonNumber')
-                                    episode_number = item.get('EpisodeNumber')
-                                    if season_number and episode_number:
-                                        season_number = str(season_number).zfill(2)
-                                        episode_number = str(episode_number).zfill(2)
-                                        episode_title = f'[S{season_number}E{episode_number}] '
-                                    else:
-                                        episode_title = ''
-                                    error_message = f"Failed rating {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}): {item['Rating']}/10 on Trakt ({item['IMDB_ID']})"
-                                    print(f"   - {error_message}")
-                                    EL.logger.error(error_message)
-                            
-                            # Reset batch
-                            batch = {
-                                "movies": [],
-                                "shows": [],
-                                "episodes": []
-                            }
-                            items_in_batch = []
-                            
-                            # Small delay between batches to avoid rate limiting
-                            if batch_count % 10 == 0:  # Every 10 batches (500 items)
-                                time.sleep(TRAKT_BATCH_DELAY * 2)
-                            else:
-                                time.sleep(TRAKT_BATCH_DELAY)
-                    
-                    # Send remaining items in final batch
-                    if len(batch['movies']) + len(batch['shows']) + len(batch['episodes']) > 0:
-                        batch_count += 1
-                        response = EH.make_trakt_request(rate_url, payload=batch)
-                        
-                        if response and response.status_code in [200, 201, 204]:
-                            # Print all items in final batch
-                            for item in items_in_batch:
-                                processed_count += 1
-                                season_number = item.get('SeasonNumber')
-                                episode_number = item.get('EpisodeNumber')
-                                if season_number and episode_number:
-                                    season_number = str(season_number).zfill(2)
-                                    episode_number = str(episode_number).zfill(2)
-                                    episode_title = f'[S{season_number}E{episode_number}] '
-                                else:
-                                    episode_title = ''
-                                print(f" - Rated {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}): {item['Rating']}/10 on Trakt ({item['IMDB_ID']})")
-                        else:
-                            # Print errors for failed items
-                            for item in items_in_batch:
-                                processed_count += 1
-                                season_number = item.get('SeasonNumber')
-                                episode_number = item.get('EpisodeNumber')
-                                if season_number and episode_number:
-                                    season_number = str(season_number).zfill(2)
-                                    episode_number = str(episode_number).zfill(2)
-                                    episode_title = f'[S{season_number}E{episode_number}] '
-                                else:
-                                    episode_title = ''
-                                error_message = f"Failed rating {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}): {item['Rating']}/10 on Trakt ({item['IMDB_ID']})"
-                                print(f"   - {error_message}")
-                                EL.logger.error(error_message)
-
-                    print(f'Setting Trakt Ratings Complete (Processed {processed_count} items in {batch_count} batch(es))')
-                else:
-                    print('No Trakt Ratings To Set')
-
-                # Set IMDB Ratings
-                if imdb_ratings_to_set:
-                    print('Setting IMDB Ratings')
-                        
-                    # loop through each movie and TV show rating and submit rating on IMDB website
-                    for i, item in enumerate(imdb_ratings_to_set, 1):
-                        
-                        season_number = item.get('SeasonNumber')
-                        episode_number = item.get('EpisodeNumber')
-                        if season_number and episode_number:
-                            season_number = str(season_number).zfill(2)
-                            episode_number = str(episode_number).zfill(2)
-                            episode_title = f'[S{season_number}E{episode_number}] '
-                        else:
-                            episode_title = ''
-                        
-                        year_str = f' ({item["Year"]})' if item["Year"] is not None else '' # sometimes year is None for episodes from trakt so remove it from the print string
-                        
-                        try:
-                            # Load page
-                            success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/title/{item["IMDB_ID"]}/', driver, wait)
-                            if not success:
-                                # Page failed to load, raise an exception
-                                raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
-                            
-                            current_url = driver.current_url
-                            
-                            # Check if the URL doesn't contain "/reference"
-                            if "/reference" not in current_url:
-                                # Wait until the rating bar has loaded
-                                wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, '[data-testid="hero-rating-bar__loading"]')))
-                                
-                                # Wait until rate button is located and scroll to it
-                                button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="hero-rating-bar__user-rating"] button.ipc-btn')))
-                                # driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                                
-                                # click on "Rate" button and select rating option, then submit rating
-                                locator = (By.CSS_SELECTOR, '[data-testid="hero-rating-bar__user-rating"] button.ipc-btn')
-                                button = wait.until(lambda d: (lambda el: el if el.get_attribute("aria-disabled") == "false" else False)(d.find_element(*locator)))
-                                try:
-                                    has_existing_rating = button.find_element(By.CSS_SELECTOR, '[data-testid="hero-rating-bar__user-rating__score"] span')
-                                    existing_rating_text = has_existing_rating.get_attribute("textContent").strip()
-                                    existing_rating = int(existing_rating_text)
-                                except NoSuchElementException:
-                                    existing_rating = None
-                                except ValueError as e:
-                                    error_message = f'There was a ValueError when attempting to get existing rating for for this item {item["Type"]}. See error log for details. Script will still attempt to rate this {item["Type"]}. : ({i} of {len(imdb_ratings_to_set)}) {episode_title}{item["Title"]}{year_str}: {item["Rating"]}/10 on IMDB ({item["IMDB_ID"]})'
-                                    print(error_message)
-                                    existing_rating = None
-                                    EL.logger.error(error_message, exc_info=True)
-                                    
-                                if existing_rating != item["Rating"]:
-                                    button = driver.find_element(By.CSS_SELECTOR, '[data-testid="hero-rating-bar__user-rating"] button.ipc-btn')
-                                    driver.execute_script("arguments[0].click();", button)
-                                    rating_option_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f'button[aria-label="Rate {item["Rating"]}"]')))
-                                    driver.execute_script("arguments[0].click();", rating_option_element)
-                                    submit_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button.ipc-rating-prompt__rate-button')))
-                                    driver.execute_script("arguments[0].click();", submit_element)
-                                    # Small delay after rating submission
-                                    if i % 10 == 0:  # Every 10 items, slightly longer delay
-                                        time.sleep(IMDB_BATCH_DELAY)
-                                    else:
-                                        time.sleep(IMDB_OPERATION_DELAY)
-                                    
-                                    print(f' - Rated {item["Type"]}: ({i} of {len(imdb_ratings_to_set)}) {episode_title}{item["Title"]}{year_str}: {item["Rating"]}/10 on IMDB ({item["IMDB_ID"]})')
-                                    
-                                else:
-                                    error_message1 = f' - Rating already exists on IMDB for this {item["Type"]}: ({i} of {len(imdb_ratings_to_set)}) {episode_title}{item["Title"]}{year_str}: {item["Rating"]}/10 on IMDB ({item["IMDB_ID"]})'
-                                    print(error_message1)
-                                    EL.logger.error(error_message1)
-                            else:
-                                # Handle the case when the URL contains "/reference"
-                                
-                                # Wait until rate button is located and scroll to it
-                                button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.ipl-rating-interactive__star-container')))
-                                driver.execute_script("arguments[0].scrollIntoView(true);", button)
-
-                                # click on "Rate" button and select rating option, then submit rating
-                                button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, '.ipl-rating-interactive__star-container')))
-                                driver.execute_script("arguments[0].click();", button)
-                                
-                                # Find the rating option element based on the data-value attribute
-                                rating_option_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f'.ipl-rating-selector__star-link[data-value="{item["Rating"]}"]')))
-                                driver.execute_script("arguments[0].click();", rating_option_element)
-                                
-                                # Small delay after rating submission
-                                if i % 10 == 0:  # Every 10 items, slightly longer delay
-                                    time.sleep(IMDB_BATCH_DELAY)
-                                else:
-                                    time.sleep(IMDB_OPERATION_DELAY)
-                                
-                        except (NoSuchElementException, TimeoutException, PageLoadException):
-                            error_message = f'Failed to rate {item["Type"]}: ({i} of {len(imdb_ratings_to_set)}) {episode_title}{item["Title"]}{year_str}: {item["Rating"]}/10 on IMDB ({item["IMDB_ID"]})'
-                            print(f" - {error_message}")
-                            EL.logger.error(error_message, exc_info=True)
-                            pass
-
-                    print('Setting IMDB Ratings Complete')
-                else:
-                    print('No IMDB Ratings To Set')
-
-            # If sync_reviews_value is true
-            if sync_reviews_value:
-                
-                # Check if there was an error getting IMDB reviews
-                if not errors_found_getting_imdb_reviews:
-                    
-                    # Set Trakt Reviews
-                    if trakt_reviews_to_set:
-                        print('Setting Trakt Reviews')
-
-                        # Count the total number of items
-                        num_items = len(trakt_reviews_to_set)
-                        item_count = 0
-
-                        for item in trakt_reviews_to_set:
-                            item_count += 1
-                            
-                            imdb_id = item['IMDB_ID']
-                            comment = item['Comment']
-                            media_type = item['Type']  # 'movie', 'show', or 'episode'
-
-                            url = f"https://api.trakt.tv/comments"
-
-                            data = {
-                                "comment": comment
-                            }
-
-                            if media_type == 'movie':
-                                data['movie'] = {
-                                    "ids": {
-                                        "imdb": imdb_id
-                                    }
-                                }
-                            elif media_type == 'show':
-                                data['show'] = {
-                                    "ids": {
-                                        "imdb": imdb_id
-                                    }
-                                }
-                            elif media_type == 'episode':
-                                data['episode'] = {
-                                    "ids": {
-                                        "imdb": imdb_id
-                                    }
-                                }
-                            else:
-                                data = None
-                            
-                            if data:
-                                response = EH.make_trakt_request(url, payload=data)
-                                
-                                season_number = item.get('SeasonNumber')
-                                episode_number = item.get('EpisodeNumber')
-                                if season_number and episode_number:
-                                    season_number = str(season_number).zfill(2)
-                                    episode_number = str(episode_number).zfill(2)
-                                    episode_title = f'[S{season_number}E{episode_number}] '
-                                else:
-                                    episode_title = ''
-
-                                if response and response.status_code in [200, 201, 204]:
-                                    print(f" - Submitted comment ({item_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) on Trakt ({item['IMDB_ID']})")
-                                else:
-                                    error_message = f"Failed to submit comment ({item_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) on Trakt ({item['IMDB_ID']})"
-                                    print(f"   - {error_message}")
-                                    EL.logger.error(error_message)
-
-                        print('Trakt Reviews Set Successfully')
-                    else:
-                        print('No Trakt Reviews To Set')
-
-                    # Set IMDB Reviews
-                    if imdb_reviews_to_set:
-                        # Call the check_last_run() function
-                        if VC.check_imdb_reviews_last_submitted():
-                            print('Setting IMDB Reviews')
-                            
-                            # Count the total number of items
-                            num_items = len(imdb_reviews_to_set)
-                            item_count = 0
-                            
-                            for item in imdb_reviews_to_set:
-                                item_count += 1
-                                try:
-                                
-                                    season_number = item.get('SeasonNumber')
-                                    episode_number = item.get('EpisodeNumber')
-                                    if season_number and episode_number:
-                                        season_number = str(season_number).zfill(2)
-                                        episode_number = str(episode_number).zfill(2)
-                                        episode_title = f'[S{season_number}E{episode_number}] '
-                                    else:
-                                        episode_title = ''
-                                    
-                                    # Load page
-                                    success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://contribute.imdb.com/review/{item["IMDB_ID"]}/add?bus=imdb', driver, wait)
-                                    if not success:
-                                        # Page failed to load, raise an exception
-                                        raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
-                                    
-                                    # wait for input dom elements to fully load (reduced delay)
-                                    time.sleep(1)
-                                    
-                                    review_title_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#text-input__0")))
-                                    review_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#textarea__0")))
-                                    
-                                    existing_title = review_title_input.get_attribute("value") or ""
-                                    existing_review = review_input.get_attribute("value") or ""
-                                    
-                                    # Skip submission if review title or review body already contains text
-                                    if existing_title.strip() or existing_review.strip():
-                                        print(f"   - Skipped setting review for {item['Title']} ({item['Year']}) on IMDB ({item['IMDB_ID']}) — a review already exists for this item")
-                                        continue
-                                    
-                                    # Clear old review inputs if review already exists
-                                    driver.execute_script("arguments[0].click();", review_title_input)
-                                    review_title_input.send_keys(Keys.CONTROL + "a", Keys.DELETE)
-                                    driver.execute_script("arguments[0].click();", review_input)
-                                    review_input.send_keys(Keys.CONTROL + "a", Keys.DELETE)
-                                    
-                                    review_title_input.send_keys("My Review")
-                                    review_input.send_keys(item["Comment"])
-                                    
-                                    no_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#is_spoiler-1")))
-                                    yes_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#is_spoiler-0")))
-                                    
-                                    if item["Spoiler"]:
-                                        driver.execute_script("arguments[0].click();", yes_element)
-                                    else:
-                                        driver.execute_script("arguments[0].click();", no_element)
-                                                            
-                                    submit_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button[aria-label='Submit']")))
-
-                                    driver.execute_script("arguments[0].click();", submit_button)
-                                    
-                                    # Wait for review to submit, with optimized delays
-                                    if item_count % 10 == 0:  # Every 10 reviews, slightly longer delay
-                                        time.sleep(IMDB_BATCH_DELAY * 2)
-                                    else:
-                                        time.sleep(IMDB_BATCH_DELAY)
-                                    
-                                    print(f" - Submitted review ({item_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) on IMDB ({item['IMDB_ID']})")
-                                    
-                                except (NoSuchElementException, TimeoutException, PageLoadException):
-                                    error_message = f"Failed to submit review ({item_count} of {num_items}): {item['Title']} ({item['Year']}) on IMDB ({item['IMDB_ID']})"
-                                    print(f"   - {error_message}")
-                                    EL.logger.error(error_message, exc_info=True)
-                                    pass
-                            
-                            print('Setting IMDB Reviews Complete')
-                        else:
-                            print('IMDB reviews were submitted within the last 10 days. Skipping IMDB review submission.')
-                    else:
-                        print('No IMDB Reviews To Set')
-                else:
-                    print('There was an error getting IMDB reviews. See exception. Skipping reviews submissions.')
-
-            # If remove_watched_from_watchlists_value is true
-            if remove_watched_from_watchlists_value or remove_watchlist_items_older_than_x_days_value:
-                
-                # Remove Watched Items Trakt Watchlist (with batching for faster processing)
-                if trakt_watchlist_items_to_remove:
-                    print('Removing Watched Items From Trakt Watchlist')
-
-                    # Set the API endpoint
-                    remove_url = "https://api.trakt.tv/sync/watchlist/remove"
-
-                    # Count the total number of items
-                    num_items = len(trakt_watchlist_items_to_remove)
-                    
-                    # Process items in batches
-                    batch = {
-                        "movies": [],
-                        "shows": [],
-                        "episodes": []
-                    }
-                    
-                    items_in_batch = []
-                    batch_count = 0
-                    processed_count = 0
-
-                    # Loop through the items to remove from the watchlist
-                    for item in trakt_watchlist_items_to_remove:
-                        item_data = {
-                            "ids": {
-                                "imdb": item["IMDB_ID"]
-                            }
-                        }
-                        
-                        if item["Type"] == "show":
-                            batch['shows'].append(item_data)
-                        elif item["Type"] == "movie":
-                            batch['movies'].append(item_data)
-                        elif item["Type"] == "episode":
-                            batch['episodes'].append(item_data)
-                        else:
-                            continue
-                        
-                        items_in_batch.append(item)
-                        
-                        # Send batch when it reaches the batch size
-                        if len(batch['movies']) + len(batch['shows']) + len(batch['episodes']) >= TRAKT_BATCH_SIZE:
-                            batch_count += 1
-                            response = EH.make_trakt_request(remove_url, payload=batch)
-                            
-                            if response and response.status_code in [200, 201, 204]:
-                                # Print all items in batch
-                                for item in items_in_batch:
-                                    processed_count += 1
-                                    season_number = item.get('SeasonNumber')
-                                    episode_number = item.get('EpisodeNumber')
-                                    if season_number and episode_number:
-                                        season_number = str(season_number).zfill(2)
-                                        episode_number = str(episode_number).zfill(2)
-                                        episode_title = f'[S{season_number}E{episode_number}] '
-                                    else:
-                                        episode_title = ''
-                                    print(f" - Removed {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) from Trakt Watchlist ({item['IMDB_ID']})")
-                            else:
-                                # Print errors for failed items
-                                for item in items_in_batch:
-                                    processed_count += 1
-                                    season_number = item.get('SeasonNumber')
-                                    episode_number = item.get('EpisodeNumber')
-                                    if season_number and episode_number:
-                                        season_number = str(season_number).zfill(2)
-                                        episode_number = str(episode_number).zfill(2)
-                                        episode_title = f'[S{season_number}E{episode_number}] '
-                                    else:
-                                        episode_title = ''
-                                    error_message = f"Failed removing {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) from Trakt Watchlist ({item['IMDB_ID']})"
-                                    print(f"   - {error_message}")
-                                    EL.logger.error(error_message)
-                            
-                            # Reset batch
-                            batch = {
-                                "movies": [],
-                                "shows": [],
-                                "episodes": []
-                            }
-                            items_in_batch = []
-                            
-                            # Small delay between batches to avoid rate limiting
-                            if batch_count % 10 == 0:  # Every 10 batches (500 items)
-                                time.sleep(TRAKT_BATCH_DELAY * 2)
-                            else:
-                                time.sleep(TRAKT_BATCH_DELAY)
-                    
-                    # Send remaining items in final batch
-                    if len(batch['movies']) + len(batch['shows']) + len(batch['episodes']) > 0:
-                        batch_count += 1
-                        response = EH.make_trakt_request(remove_url, payload=batch)
-                        
-                        if response and response.status_code in [200, 201, 204]:
-                            # Print all items in final batch
-                            for item in items_in_batch:
-                                processed_count += 1
-                                season_number = item.get('SeasonNumber')
-                                episode_number = item.get('EpisodeNumber')
-                                if season_number and episode_number:
-                                    season_number = str(season_number).zfill(2)
-                                    episode_number = str(episode_number).zfill(2)
-                                    episode_title = f'[S{season_number}E{episode_number}] '
-                                else:
-                                    episode_title = ''
-                                print(f" - Removed {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) from Trakt Watchlist ({item['IMDB_ID']})")
-                        else:
-                            # Print errors for failed items
-                            for item in items_in_batch:
-                                processed_count += 1
-                                season_number = item.get('SeasonNumber')
-                                episode_number = item.get('EpisodeNumber')
-                                if season_number and episode_number:
-                                    season_number = str(season_number).zfill(2)
-                                    episode_number = str(episode_number).zfill(2)
-                                    episode_title = f'[S{season_number}E{episode_number}] '
-                                else:
-                                    episode_title = ''
-                                error_message = f"Failed removing {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) from Trakt Watchlist ({item['IMDB_ID']})"
-                                print(f"   - {error_message}")
-                                EL.logger.error(error_message)
-
-                    print(f'Removing Watched Items From Trakt Watchlist Complete (Processed {processed_count} items in {batch_count} batch(es))')
-                else:
-                    print('No Trakt Watchlist Items To Remove')
-
-                # Remove Watched Items IMDB Watchlist
-                if imdb_watchlist_items_to_remove:
-                    print('Removing Watched Items From IMDB Watchlist')
-                    
-                    # Count the total number of items
-                    num_items = len(imdb_watchlist_items_to_remove)
-                    item_count = 0
-                                    
-                    for item in imdb_watchlist_items_to_remove:
-                    
-                        season_number = item.get('SeasonNumber')
-                        episode_number = item.get('EpisodeNumber')
-                        if season_number and episode_number:
-                            season_number = str(season_number).zfill(2)
-                            episode_number = str(episode_number).zfill(2)
-                            episode_title = f'[S{season_number}E{episode_number}] '
-                        else:
-                            episode_title = ''
-                        
-                        year_str = f' ({item["Year"]})' if item["Year"] is not None else '' # sometimes year is None for episodes from trakt so remove it from the print string
-                        
-                        try:
-                            item_count += 1
-                            
-                            # Load page
-                            success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/title/{item["IMDB_ID"]}/', driver, wait)
-                            if not success:
-                                # Page failed to load, raise an exception
-                                raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
-                            
-                            current_url = driver.current_url
-                            
-                            # Check if the URL doesn't contain "/reference"
-                            if "/reference" not in current_url:
-                                # Wait until the loader has disappeared, indicating the watchlist button has loaded
-                                wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, '[data-testid="tm-box-wl-loader"]')))
-                                
-                                # Scroll the page to bring the element into view
-                                watchlist_button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'button[data-testid="tm-box-wl-button"]')))
-                                driver.execute_script("arguments[0].scrollIntoView(true);", watchlist_button)
-                                
-                                # Wait for the element to be clickable
-                                watchlist_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[data-testid="tm-box-wl-button"]')))
-                                
-                                # Check if item is not in watchlist otherwise skip it
-                                if 'ipc-icon--add' not in watchlist_button.get_attribute('innerHTML'):
-                                    retry_count = 0
-                                    while retry_count < 2:
-                                        driver.execute_script("arguments[0].click();", watchlist_button)
-                                        try:
-                                            WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'button[data-testid="tm-box-wl-button"] .ipc-icon--add')))
-                                            
-                                            print(f" - Removed {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} from IMDB Watchlist ({item['IMDB_ID']})")
-                                            
-                                            break  # Break the loop if successful
-                                        except TimeoutException:
-                                            retry_count += 1
-
-                                    if retry_count == 2:
-                                        error_message = f"Failed to remove {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} from IMDB Watchlist ({item['IMDB_ID']})"
-                                        print(f" - {error_message}")
-                                        EL.logger.error(error_message)
-                                    
-                                else:
-                                    error_message1 = f" - Failed to remove {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} from IMDB Watchlist ({item['IMDB_ID']})"
-                                    error_message2 = f"   - {item['Type'].capitalize()} not in IMDB watchlist."
-                                    EL.logger.error(error_message1)
-                                    EL.logger.error(error_message2)
-                        
-                            else:
-                                # Handle the case when the URL contains "/reference"
-                                
-                                # Scroll the page to bring the element into view
-                                watchlist_button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.titlereference-watch-ribbon > .wl-ribbon')))
-                                driver.execute_script("arguments[0].scrollIntoView(true);", watchlist_button)
-                                
-                                # Check if watchlist_button doesn't have the class .not-inWL before clicking
-                                if 'not-inWL' not in watchlist_button.get_attribute('class'):
-                                    driver.execute_script("arguments[0].click();", watchlist_button)
-
-                        except (NoSuchElementException, TimeoutException, PageLoadException):
-                            error_message = f"Failed to remove {item['Type']} ({item_count} of {num_items}): {item['Title']}{year_str} from IMDB Watchlist ({item['IMDB_ID']})"
-                            print(f" - {error_message}")
-                            EL.logger.error(error_message, exc_info=True)
-                            pass
-
-                    
-                    print('Removing Watched Items From IMDB Watchlist Complete')
-                else:
-                    print('No IMDB Watchlist Items To Remove')
-            
-            # If sync_watch_history_value is true
-            if sync_watch_history_value or mark_rated_as_watched_value:
-            
-                # Set Trakt Watch History (with batching for faster processing)
-                if trakt_watch_history_to_set:
-                    print('Setting Trakt Watch History')
-
-                    # Set the API endpoint for syncing watch history
-                    watch_history_url = "https://api.trakt.tv/sync/history"
-                    
-                    # Count the total number of items
-                    num_items = len(trakt_watch_history_to_set)
-                    
-                    # Process items in batches
-                    batch = {
-                        "movies": [],
-                        "episodes": []
-                    }
-                    
-                    items_in_batch = []
-                    batch_count = 0
-                    processed_count = 0
-                    
-                    # Loop through your data table and set watch history for each item
-                    for item in trakt_watch_history_to_set:
-                        item_data = {
-                            "ids": {
-                                "imdb": item["IMDB_ID"]
-                            },
-                            "watched_at": item["WatchedAt"]  # Mark when the item was watched
-                        }
-                        
-                        if item["Type"] == "movie":
-                            batch['movies'].append(item_data)
-                        elif item["Type"] == "episode":
-                            batch['episodes'].append(item_data)
-                        else:
-                            # Skip shows as they will mark all episodes as watched
-                            continue
-                        
-                        items_in_batch.append(item)
-                        
-                        # Send batch when it reaches the batch size
-                        if len(batch['movies']) + len(batch['episodes']) >= TRAKT_BATCH_SIZE:
-                            batch_count += 1
-                            response = EH.make_trakt_request(watch_history_url, payload=batch)
-                            
-                            if response and response.status_code in [200, 201, 204]:
-                                # Print all items in batch
-                                for item in items_in_batch:
-                                    processed_count += 1
-                                    season_number = item.get('SeasonNumber')
-                                    episode_number = item.get('EpisodeNumber')
-                                    if season_number and episode_number:
-                                        season_number = str(season_number).zfill(2)
-                                        episode_number = str(episode_number).zfill(2)
-                                        episode_title = f'[S{season_number}E{episode_number}] '
-                                    else:
-                                        episode_title = ''
-                                    print(f" - Adding {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) to Trakt Watch History ({item['IMDB_ID']})")
-                            else:
-                                # Print errors for failed items
-                                for item in items_in_batch:
-                                    processed_count += 1
-                                    season_number = item.get('SeasonNumber')
-                                    episode_number = item.get('EpisodeNumber')
-                                    if season_number and episode_number:
-                                        season_number = str(season_number).zfill(2)
-                                        episode_number = str(episode_number).zfill(2)
-                                        episode_title = f'[S{season_number}E{episode_number}] '
-                                    else:
-                                        episode_title = ''
-                                    error_message = f"Failed to add {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) to Trakt Watch History ({item['IMDB_ID']})"
-                                    print(f"   - {error_message}")
-                                    EL.logger.error(error_message)
-                            
-                            # Reset batch
-                            batch = {
-                                "movies": [],
-                                "episodes": []
-                            }
-                            items_in_batch = []
-                            
-                            # Small delay between batches to avoid rate limiting
-                            if batch_count % 10 == 0:  # Every 10 batches (500 items)
-                                time.sleep(TRAKT_BATCH_DELAY * 2)
-                            else:
-                                time.sleep(TRAKT_BATCH_DELAY)
-                    
-                    # Send remaining items in final batch
-                    if len(batch['movies']) + len(batch['episodes']) > 0:
-                        batch_count += 1
-                        response = EH.make_trakt_request(watch_history_url, payload=batch)
-                        
-                        if response and response.status_code in [200, 201, 204]:
-                            # Print all items in final batch
-                            for item in items_in_batch:
-                                processed_count += 1
-                                season_number = item.get('SeasonNumber')
-                                episode_number = item.get('EpisodeNumber')
-                                if season_number and episode_number:
-                                    season_number = str(season_number).zfill(2)
-                                    episode_number = str(episode_number).zfill(2)
-                                    episode_title = f'[S{season_number}E{episode_number}] '
-                                else:
-                                    episode_title = ''
-                                print(f" - Adding {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) to Trakt Watch History ({item['IMDB_ID']})")
-                        else:
-                            # Print errors for failed items
-                            for item in items_in_batch:
-                                processed_count += 1
-                                season_number = item.get('SeasonNumber')
-                                episode_number = item.get('EpisodeNumber')
-                                if season_number and episode_number:
-                                    season_number = str(season_number).zfill(2)
-                                    episode_number = str(episode_number).zfill(2)
-                                    episode_title = f'[S{season_number}E{episode_number}] '
-                                else:
-                                    episode_title = ''
-                                error_message = f"Failed to add {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) to Trakt Watch History ({item['IMDB_ID']})"
-                                print(f"   - {error_message}")
-                                EL.logger.error(error_message)
-
-                    print(f'Setting Trakt Watch History Complete (Processed {processed_count} items in {batch_count} batch(es))')
-                else:
-                    print('No Trakt Watch History To Set')
-                    
-                # Set IMDB Watch History Items
-                if imdb_watch_history_to_set:
-                    print('Setting IMDB Watch History Items')
-                    
-                    # Count the total number of items
-                    num_items = len(imdb_watch_history_to_set)
-                    item_count = 0
-                                    
-                    for item in imdb_watch_history_to_set:
-                        
-                        season_number = item.get('SeasonNumber')
-                        episode_number = item.get('EpisodeNumber')
-                        if season_number and episode_number:
-                            season_number = str(season_number).zfill(2)
-                            episode_number = str(episode_number).zfill(2)
-                            episode_title = f'[S{season_number}E{episode_number}] '
-                        else:
-                            episode_title = ''
-                            
-                        year_str = f' ({item.get("Year")})' if item.get("Year") is not None else ''  # Handles None safely
-                        
-                        try:
-                            item_count += 1
-                            
-                            # Load page
-                            success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/title/{item["IMDB_ID"]}/', driver, wait)
-                            if not success:
-                                # Page failed to load, raise an exception
-                                raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
-                            
-                            current_url = driver.current_url
-                            
-                            # Check if the URL doesn't contain "/reference"
-                            if "/reference" not in current_url:
-                                # Wait until the loader has disappeared, indicating the watch history button has loaded
-                                wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, '[data-testid="tm-box-wl-loader"]')))
-                                
-                                # Scroll the page to bring the element into view
-                                watch_history_button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'button[data-testid="tm-box-addtolist-button"]')))
-                                driver.execute_script("arguments[0].scrollIntoView(true);", watch_history_button)
-                                
-                                # Wait for the element to be clickable
-                                watch_history_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[data-testid="tm-box-addtolist-button"]')))
-                                
-                                driver.execute_script("arguments[0].click();", watch_history_button)
-                                
-                                watch_history_button = wait.until(EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Your check-ins')]")))
-                                
-                                watch_history_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[contains(text(), 'Your check-ins')]")))
-                                                                
-                                # Check if item is already in watch history otherwise skip it
-                                if 'true' not in watch_history_button.get_attribute('data-titleinlist'):
-                                    retry_count = 0
-                                    while retry_count < 2:
-                                        driver.execute_script("arguments[0].click();", watch_history_button)
-                                        try:
-                                            WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'ipc-promptable-base__content')]//div[@data-titleinlist='true']")))
-                                            
-                                            print(f" - Adding {item.get('Type')} ({item_count} of {num_items}): {episode_title}{item.get('Title')}{year_str} to IMDB Watch History ({item.get('IMDB_ID')})")
-                                            
-                                            # Small delay between operations to avoid being flagged
-                                            if item_count % 10 == 0:  # Every 10 items, slightly longer delay
-                                                time.sleep(IMDB_BATCH_DELAY)
-                                            else:
-                                                time.sleep(IMDB_OPERATION_DELAY)
-                            
-                                            break  # Break the loop if successful
-                                        except TimeoutException:
-                                            retry_count += 1
-
-                                    if retry_count == 2:
-                                        error_message = f"Failed to add {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watch History ({item['IMDB_ID']})"
-                                        print(f" - {error_message}")
-                                        EL.logger.error(error_message)
-                                else:
-                                    error_message1 = f" - Failed to add {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watch History ({item['IMDB_ID']})"
-                                    error_message2 = f"   - {item['Type'].capitalize()} already exists in IMDB watch history."
-                                    EL.logger.error(error_message1)
-                                    EL.logger.error(error_message2)
-                            else:
-                                # Handle the case when the URL contains "/reference"
-                                error_message1 = f"IMDB reference view setting is enabled. Adding items to IMDB Check-ins is not supported. See: https://www.imdb.com/preferences/general"
-                                error_message2 = f"Failed to add item ({item_count} of {num_items}): {item['Title']}{year_str} to IMDB Watch History ({item['IMDB_ID']})"
-                                print(f" - {error_message1}")
-                                print(f" - {error_message2}")
-                                EL.logger.error(error_message1)
-                                EL.logger.error(error_message2)
-                            
-                        except (NoSuchElementException, TimeoutException, PageLoadException):
-                            error_message = f"Failed to add item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watch History ({item['IMDB_ID']})"
-                            print(f" - {error_message}")
-                            EL.logger.error(error_message, exc_info=True)
-                            pass
-
-                    
-                    print('Setting IMDB Watch History Items Complete')
-                else:
-                    print('No IMDB Watch History Items To Set')
-            
-            # Change language back to original if was changed
-            if (original_language != "English (United States)"):
-                print("Changing IMDB Language Back to Original. See: https://www.imdb.com/preferences/general")
-                # go to IMDB homepage
-                success, status_code, url, driver, wait = EH.get_page_with_retries('https://www.imdb.com/', driver, wait)
-                if not success:
-                    # Page failed to load, raise an exception
-                    raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
-                
-                # Change Language Back to Original
-                # Open Language Dropdown
-                language_dropdown = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "label[for*='nav-language-selector']")))
-                driver.execute_script("arguments[0].click();", language_dropdown)
-                # Change Language to Original
-                original_language_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f"span[id*='nav-language-selector-contents'] li[aria-label*='{original_language}']")))
-                driver.execute_script("arguments[0].click();", original_language_element)
-                
-            # Find reference view checkbox
-            if reference_view_changed:
-                print("Changing reference view IMDB setting back to original. See: https://www.imdb.com/preferences/general")
-                # Load page
-                success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/preferences/general', driver, wait)
-                if not success:
-                    # Page failed to load, raise an exception
-                    raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
-                # Click reference view checkbox
-                reference_checkbox = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[id*='reference-view-toggle']")))
-                driver.execute_script("arguments[0].click();", reference_checkbox)
-                # Submit
-                submit = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".article input[type*='submit']")))
-                driver.execute_script("arguments[0].click();", submit)
-                time.sleep(1)
-            
-            # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE: Cleanup & Completion
-            # ═══════════════════════════════════════════════════════════════════════════
-            if total_operations > 0:
-                sync_elapsed = time.time() - sync_start_time
-                print(f'\n✓ Sync complete ({sync_elapsed:.1f}s)', flush=True)
-            
-            #Close web driver
-            print("\n🔒 Closing webdriver...", flush=True)
-            driver.close()
-            driver.quit()
-            service.stop()
-            print("\n" + "═" * 50, flush=True)
-            print("✅ IMDBTraktSyncer Complete", flush=True)
-            print("═" * 50, flush=True)
-        
-        except Exception as e:
-            error_message = "An error occurred while running the script."
-            EH.report_error(error_message)
-            EL.logger.error(error_message, exc_info=True)
-            
-            # Close the driver and stop the service if they were initialized
-            if 'driver' in locals() and driver is not None:
-                driver.close()
-                driver.quit()
-            if 'service' in locals() and service is not None:
-                service.stop()
-
-if __name__ == '__main__':
-    main()
+import os
+import re
+import operator
+import time
+from itertools import chain
+import random
+import sys
+import socket
+import argparse
+import subprocess
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from urllib.parse import urljoin
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+class PageLoadException(Exception):
+    pass
+
+# Performance optimization constants
+TRAKT_BATCH_SIZE = 200  # Starting number of items to batch together for Trakt API requests; adapted per response between TRAKT_BATCH_SIZE_MIN and TRAKT_BATCH_SIZE_MAX
+TRAKT_BATCH_SIZE_MIN = 50  # Floor for the adaptive batch size after server timeouts
+TRAKT_BATCH_SIZE_MAX = 500  # Ceiling for the adaptive batch size on sustained success
+TRAKT_TYPE_BUCKETS = {'movie': 'movies', 'show': 'shows', 'episode': 'episodes'}  # Item Type -> payload key, replaces if/elif dispatch in the batching loops
+IMDB_OPERATION_DELAY = 0.3  # Small delay between IMDB operations (300ms) to avoid being flagged as bot
+IMDB_BATCH_DELAY = 1.0  # Slightly longer delay every 10 IMDB operations (1 second)
+IMDB_API_DELAY = 0.35  # Throttle between lightweight IMDB API calls (350ms) to respect IMDB rules
+IMDB_API_BACKOFF_BASE = 0.5  # Initial backoff window after a fast-path API failure (seconds)
+IMDB_API_BACKOFF_CAP = 30  # Upper bound on the backoff window (seconds)
+IMDB_API_BATCH_SIZE = 15  # Parallel in-page watchlist_add fetches per WebDriver round trip
+
+# Selectors that indicate a signed-in IMDB session (user menu variants across IMDB
+# redesigns). Single source of truth, injected into the sign-in probe as an argument.
+SIGN_IN_SELECTORS = [
+    '.nav__userMenu',
+    '.navbar__user',
+    '[data-testid="user-menu"]',
+    '.imdb-header__accountmenu',
+    '.nav__userMenu .navbar__user-menu-toggle__button',
+    '.nav__userMenu.navbar__user',
+    'a[href*="/user/"]'
+]
+CHROME_DEBUG_PORT = 9222  # Fixed remote debugging port used by --keep-alive mode
+
+# Watchlist button selectors for IMDB's modern title layout, most specific first.
+# Module-scope tuple so the hot per-item loop loads them as constants; they are
+# combined into one CSS query so a single in-page wait covers all of them
+IMDB_WL_SELECTORS = (
+    'div.sc-dcb1530e-3:nth-child(2)',           # Updated IMDB selector (2024)
+    'button[data-testid="tm-box-wl-button"]',  # Primary selector
+    'button[aria-label*="watchlist" i]',        # Backup: aria-label contains "watchlist"
+    'button.ipc-split-button__btn--add',       # Backup: Add to watchlist button class
+    '[data-testid="title-actions-menu"] button', # Backup: Actions menu button
+    'div[class*="sc-"][class*="-3"]',          # Generic pattern for IMDB dynamic classes
+)
+IMDB_WL_COMBINED_SELECTOR = ', '.join(IMDB_WL_SELECTORS)
+
+# XPath last resort for the watchlist button
+IMDB_WL_XPATH_SELECTOR = '/html/body/div[2]/main/div/section[1]/section/div[3]/section/section/div[3]/div[2]/div[2]/div[3]/div[2]'
+
+# In-page wait for a clickable element matching the given selector. A MutationObserver
+# resolves as soon as the element appears enabled, so the whole wait costs one WebDriver
+# round trip instead of a Python-side polling loop of findElement commands.
+ELEMENT_CLICKABLE_WAIT_JS = """
+    const selector = arguments[0];
+    const timeoutMs = arguments[1];
+    const callback = arguments[arguments.length - 1];
+    const ready = () => {
+        const el = document.querySelector(selector);
+        return el && !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+    };
+    if (ready()) { callback('ok'); return; }
+    const observer = new MutationObserver(() => {
+        if (ready()) {
+            observer.disconnect();
+            clearTimeout(timer);
+            callback('ok');
+        }
+    });
+    const timer = setTimeout(() => { observer.disconnect(); callback('timeout'); }, timeoutMs);
+    observer.observe(document.body, { childList: true, subtree: true, attributes: true });
+"""
+
+# Reads every "already in watchlist" indicator off the button in one script call
+# instead of separate innerHTML/text round trips. Accepts either an element or a
+# selector (CSS when arguments[1] is true, XPath otherwise) resolved in-page.
+WATCHLIST_ADDED_CHECK_JS = """
+    let el = arguments[0];
+    if (typeof el === 'string') {
+        el = arguments[1]
+            ? document.querySelector(el)
+            : document.evaluate(el, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    if (!el) { return false; }
+    const html = el.innerHTML || '';
+    const text = (el.textContent || '').toLowerCase();
+    return html.includes('ipc-icon--done') ||
+           html.toLowerCase().includes('checkmark') ||
+           text.includes('in watchlist') ||
+           text.includes('added');
+"""
+
+# Injected on every new document via CDP: wraps fetch/XHR so the page itself
+# records when a watchlist mutation request gets a 2xx response. Reading the
+# flag is one cheap script call and turns true within a network RTT of the
+# server ack, ahead of any DOM re-render the visual check below depends on
+WATCHLIST_ACK_HOOK_JS = """
+(function() {
+    if (window.__wlAckHooked) { return; }
+    window.__wlAckHooked = true;
+    window.__wlAck = false;
+    var isWlUrl = function(url) {
+        url = String(url || '').toLowerCase();
+        return url.includes('watchlist') || url.includes('/list/add');
+    };
+    var origFetch = window.fetch;
+    if (origFetch) {
+        window.fetch = function(input, init) {
+            var url = (input && input.url) || input;
+            return origFetch.apply(this, arguments).then(function(resp) {
+                if (isWlUrl(url) && resp.status >= 200 && resp.status < 300) {
+                    window.__wlAck = true;
+                }
+                return resp;
+            });
+        };
+    }
+    var origOpen = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function(method, url) {
+        this.addEventListener('load', function() {
+            if (isWlUrl(url) && this.status >= 200 && this.status < 300) {
+                window.__wlAck = true;
+            }
+        });
+        return origOpen.apply(this, arguments);
+    };
+})();
+"""
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for IMDB operations. Tokens accrue at refill_rate per
+    second up to capacity, so fast responses can spend already-accrued budget
+    immediately instead of sleeping a fixed delay after every item; the bucket only
+    blocks once the burst budget is exhausted.
+    """
+    def __init__(self, refill_rate, capacity=10):
+        self.refill_rate = refill_rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def acquire(self, tokens=1):
+        # Refill from elapsed time, then sleep only for whatever budget is missing
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+        if self.tokens < tokens:
+            time.sleep((tokens - self.tokens) / self.refill_rate)
+            self.updated_at = time.monotonic()
+            self.tokens = 0.0
+        else:
+            self.tokens -= tokens
+
+# Rate limiters for IMDB traffic. Acquiring more tokens spends a larger budget, which
+# reproduces the old "longer delay every 10 items" pacing while letting fast batches
+# run at full speed until the burst allowance is used up. Average steady-state rates
+# still match the IMDB_*_DELAY constants above, so tune those to adjust throttling.
+imdb_api_bucket = TokenBucket(refill_rate=1 / IMDB_API_DELAY)
+imdb_operation_bucket = TokenBucket(refill_rate=1 / IMDB_OPERATION_DELAY)
+
+# Trakt batches need no pacing here: EH.make_trakt_request paces itself with
+# per-method token buckets sized from Trakt's published limits, and still
+# honors Retry-After (with capped, jittered exponential fallback) on 429/5xx
+
+# Fast-path API backoff state. Failures open an exponentially growing, jittered
+# backoff window rather than disabling the API for the rest of the run, so a
+# transient problem (CSRF rotation, 429 burst) only degrades throughput while it
+# lasts; successes decay the failure count back toward zero.
+_imdb_api_backoff = {'failures': 0, 'next_allowed': 0.0}
+
+def imdb_api_available():
+    """Check whether the fast-path IMDB API is outside its current backoff window."""
+    return time.monotonic() >= _imdb_api_backoff['next_allowed']
+
+def record_imdb_api_result(success):
+    """Update the fast-path backoff state after an API attempt."""
+    if success:
+        _imdb_api_backoff['failures'] = max(0, _imdb_api_backoff['failures'] - 1)
+        _imdb_api_backoff['next_allowed'] = 0.0
+    else:
+        delay = min(IMDB_API_BACKOFF_CAP, IMDB_API_BACKOFF_BASE * 2 ** _imdb_api_backoff['failures'])
+        _imdb_api_backoff['failures'] += 1
+        _imdb_api_backoff['next_allowed'] = time.monotonic() + delay + random.uniform(0, 0.25)
+
+def is_chrome_debug_port_open(timeout=0.2):
+    """Check whether a Chrome instance is already listening on the remote debugging port."""
+    try:
+        with socket.create_connection(('127.0.0.1', CHROME_DEBUG_PORT), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+def shutdown_webdriver(driver, service, keep_alive=False):
+    """
+    Shut down the WebDriver session. In keep-alive mode the browser (and chromedriver)
+    are left running so the next run can re-attach instantly; only the local command
+    executor connection is closed.
+    """
+    if keep_alive:
+        try:
+            driver.command_executor.close()
+        except Exception:
+            pass
+    else:
+        driver.close()
+        driver.quit()
+        if service is not None:
+            service.stop()
+
+def imdb_http_login(username, password):
+    """
+    Attempt to sign in to IMDB over plain HTTP using a requests.Session, bypassing the
+    Selenium UI sign-in flow (browser launch, DOM waits and form typing) entirely.
+    Fetches the IMDB sign in page, extracts the Amazon SSO form fields and posts the
+    credentials directly. Success is detected by the presence of the at-main cookie
+    (the same cookie the in-page sign_in_check_js looks for).
+
+    Returns:
+        requests.Session | None: The authenticated session on success, None on failure
+        (e.g. captcha/OTP challenge), in which case the Selenium sign-in flow should be used.
+    """
+    try:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9'
+        })
+
+        # Load the IMDB sign in page and follow the IMDB sign-in link to the Amazon SSO form
+        response = session.get('https://www.imdb.com/registration/signin/?subPageType=sign_in', timeout=30)
+        if response.status_code != 200:
+            return None
+
+        # Find the "Sign in with IMDb" link (points at the Amazon SSO sign in form)
+        imdb_signin_link = None
+        for link in re.findall(r'href="([^"]+)"', response.text):
+            if 'ap/signin' in link:
+                imdb_signin_link = link.replace('&amp;', '&')
+                break
+        if not imdb_signin_link:
+            return None
+
+        response = session.get(imdb_signin_link, timeout=30)
+        if response.status_code != 200:
+            return None
+
+        # Extract the SSO form action and hidden fields (appActionToken, appAction, openid.*, etc.)
+        form_match = re.search(r'<form[^>]*name="signIn"[^>]*action="([^"]+)"[^>]*>(.*?)</form>', response.text, re.DOTALL)
+        if not form_match:
+            return None
+        form_action = form_match.group(1).replace('&amp;', '&')
+        form_body = form_match.group(2)
+
+        form_data = {}
+        for input_tag in re.findall(r'<input[^>]+>', form_body):
+            name_match = re.search(r'name="([^"]*)"', input_tag)
+            value_match = re.search(r'value="([^"]*)"', input_tag)
+            if name_match:
+                form_data[name_match.group(1)] = value_match.group(1) if value_match else ''
+
+        form_data['email'] = username
+        form_data['password'] = password
+
+        # Post credentials to the Amazon SSO endpoint, then load imdb.com to finalize session cookies
+        response = session.post(form_action, data=form_data, timeout=30, headers={'Referer': response.url})
+        if response.status_code != 200:
+            return None
+
+        session.get('https://www.imdb.com/', timeout=30)
+
+        # Success is indicated by the at-main auth cookie being set
+        if any(cookie.name == 'at-main' for cookie in session.cookies):
+            return session
+        return None
+    except requests.RequestException:
+        return None
+
+def transfer_session_cookies_to_driver(session, driver):
+    """
+    Copy cookies from an authenticated requests.Session into the WebDriver so UI actions
+    downstream run signed in. The driver must already be on an imdb.com page.
+    """
+    for cookie in session.cookies:
+        try:
+            cookie_dict = {'name': cookie.name, 'value': cookie.value, 'path': cookie.path or '/'}
+            if cookie.domain:
+                cookie_dict['domain'] = cookie.domain
+            driver.add_cookie(cookie_dict)
+        except Exception:
+            # Skip cookies the driver rejects (e.g. mismatched domain)
+            continue
+
+def set_reference_view_via_http(driver, enabled):
+    """
+    Read and, if needed, flip the IMDB "reference view" preference by replaying the
+    preferences form over plain HTTP with the browser's cookies, skipping the
+    /preferences/general page load and render cycle in Chrome.
+
+    Returns:
+        True if the preference was changed, False if it was already in the requested
+        state, or None if the form could not be fetched or parsed (caller should fall
+        back to the Selenium flow).
+    """
+    try:
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36'
+        })
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+
+        response = session.get('https://www.imdb.com/preferences/general', timeout=30)
+        if response.status_code != 200:
+            return None
+
+        # Find the form containing the reference view toggle
+        form_match = None
+        for match in re.finditer(r'<form[^>]*action="([^"]+)"[^>]*>(.*?)</form>', response.text, re.DOTALL):
+            if 'reference-view-toggle' in match.group(2):
+                form_match = match
+                break
+        if not form_match:
+            return None
+        form_action = form_match.group(1).replace('&amp;', '&')
+        form_body = form_match.group(2)
+
+        # Collect the form fields, mirroring what a browser submit would send:
+        # text/hidden inputs always, checkboxes/radios only when checked
+        form_data = {}
+        toggle_name = None
+        toggle_checked = False
+        for input_tag in re.findall(r'<input[^>]+>', form_body):
+            name_match = re.search(r'name="([^"]*)"', input_tag)
+            if not name_match:
+                continue
+            name = name_match.group(1)
+            value_match = re.search(r'value="([^"]*)"', input_tag)
+            value = value_match.group(1) if value_match else ''
+            type_match = re.search(r'type="([^"]*)"', input_tag)
+            input_type = (type_match.group(1) if type_match else 'text').lower()
+
+            if 'reference-view-toggle' in input_tag:
+                toggle_name = name
+                toggle_checked = 'checked' in input_tag
+                continue
+            if input_type in ('checkbox', 'radio'):
+                if 'checked' in input_tag:
+                    form_data[name] = value or 'on'
+            elif input_type != 'submit':
+                form_data[name] = value
+
+        if toggle_name is None:
+            return None
+        if toggle_checked == enabled:
+            return False  # Already in the requested state, nothing to submit
+        if enabled:
+            form_data[toggle_name] = 'on'  # Unchecked boxes are omitted from the submit
+
+        if not form_action.startswith('http'):
+            form_action = f'https://www.imdb.com{form_action}'
+        response = session.post(form_action, data=form_data, timeout=30, headers={'Referer': 'https://www.imdb.com/preferences/general'})
+        if response.status_code != 200:
+            return None
+        return True
+    except requests.RequestException:
+        return None
+
+def get_imdb_csrf_token(driver):
+    """
+    Extract the IMDB CSRF token from document.cookie and cache it on the driver.
+    The token is stable for the lifetime of the session, so it only needs to be
+    parsed out once instead of on every watchlist API call.
+    """
+    token = getattr(driver, '_imdb_csrf_token', None)
+    if token is None:
+        token = driver.execute_script("""
+            const csrfMatch = document.cookie.match(/csrfToken=([^;]+)/);
+            return csrfMatch ? decodeURIComponent(csrfMatch[1]).split('%3A')[0] : '';
+        """) or ''
+        driver._imdb_csrf_token = token
+    return token
+
+def add_to_imdb_watchlist_via_api_batch(driver, imdb_ids):
+    """
+    Add multiple titles to the IMDB watchlist via the lightweight AJAX endpoint,
+    firing up to IMDB_API_BATCH_SIZE parallel in-page fetches per execute_async_script
+    round trip. The cached session CSRF token is passed in as an argument so the
+    per-item JS payload no longer re-parses document.cookie.
+
+    Returns:
+        dict: imdb_id -> {'status': int, 'ok': bool, 'error': str | None}
+    """
+    results = {}
+    if not imdb_ids:
+        return results
+    # The in-page fetches are same-origin calls, so make sure the driver is parked
+    # on an IMDB page once up front rather than navigating per item
+    if 'imdb.com' not in (driver.current_url or ''):
+        driver.get('https://www.imdb.com/')
+    csrf_token = get_imdb_csrf_token(driver)
+    for start in range(0, len(imdb_ids), IMDB_API_BATCH_SIZE):
+        # During a backoff window leave the remaining ids unresolved; the caller's
+        # Selenium fallback picks them up
+        if not imdb_api_available():
+            break
+        chunk = imdb_ids[start:start + IMDB_API_BATCH_SIZE]
+        batch_results = driver.execute_async_script("""
+            const imdbIds = arguments[0];
+            const csrfToken = arguments[1];
+            const callback = arguments[2];
+
+            const headers = {
+                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+                'X-Requested-With': 'XMLHttpRequest'
+            };
+            if (csrfToken) {
+                headers['X-Imdb-Csrf-Token'] = csrfToken;
+            }
+
+            Promise.all(imdbIds.map(imdbId =>
+                fetch('https://www.imdb.com/list/_ajax/watchlist_add', {
+                    method: 'POST',
+                    credentials: 'include',
+                    headers,
+                    body: 'const=' + encodeURIComponent(imdbId)
+                }).then(resp => ({ id: imdbId, status: resp.status, ok: resp.ok, error: null }))
+                  .catch(err => ({ id: imdbId, status: 0, ok: false, error: err ? err.toString() : 'unknown error' }))
+            )).then(callback);
+        """, chunk, csrf_token)
+
+        for entry in batch_results or []:
+            results[entry['id']] = entry
+
+        # A batch counts as a success if any item went through; total failure opens
+        # (or widens) the backoff window
+        record_imdb_api_result(any(entry.get('ok') for entry in batch_results or []))
+
+        # Throttle between batches to respect IMDB rules
+        if start + IMDB_API_BATCH_SIZE < len(imdb_ids):
+            imdb_api_bucket.acquire()
+    return results
+
+def remove_from_imdb_watchlist_via_api_batch(driver, imdb_ids):
+    """
+    Remove multiple titles from the IMDB watchlist via the lightweight AJAX
+    endpoint, mirroring add_to_imdb_watchlist_via_api_batch: up to
+    IMDB_API_BATCH_SIZE parallel in-page fetches per execute_async_script round
+    trip, sharing the cached CSRF token and the API backoff window.
+
+    Returns:
+        dict: imdb_id -> {'status': int, 'ok': bool, 'error': str | None}
+    """
+    results = {}
+    if not imdb_ids:
+        return results
+    # Same-origin calls; park the driver on an IMDB page once up front
+    if 'imdb.com' not in (driver.current_url or ''):
+        driver.get('https://www.imdb.com/')
+    csrf_token = get_imdb_csrf_token(driver)
+    for start in range(0, len(imdb_ids), IMDB_API_BATCH_SIZE):
+        if not imdb_api_available():
+            break
+        chunk = imdb_ids[start:start + IMDB_API_BATCH_SIZE]
+        batch_results = driver.execute_async_script("""
+            const imdbIds = arguments[0];
+            const csrfToken = arguments[1];
+            const callback = arguments[2];
+
+            const headers = {
+                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+                'X-Requested-With': 'XMLHttpRequest'
+            };
+            if (csrfToken) {
+                headers['X-Imdb-Csrf-Token'] = csrfToken;
+            }
+
+            Promise.all(imdbIds.map(imdbId =>
+                fetch('https://www.imdb.com/list/_ajax/watchlist_remove', {
+                    method: 'POST',
+                    credentials: 'include',
+                    headers,
+                    body: 'const=' + encodeURIComponent(imdbId)
+                }).then(resp => ({ id: imdbId, status: resp.status, ok: resp.ok, error: null }))
+                  .catch(err => ({ id: imdbId, status: 0, ok: false, error: err ? err.toString() : 'unknown error' }))
+            )).then(callback);
+        """, chunk, csrf_token)
+
+        for entry in batch_results or []:
+            results[entry['id']] = entry
+
+        record_imdb_api_result(any(entry.get('ok') for entry in batch_results or []))
+
+        # Throttle between batches to respect IMDB rules
+        if start + IMDB_API_BATCH_SIZE < len(imdb_ids):
+            imdb_api_bucket.acquire()
+    return results
+
+def add_to_imdb_watchlist_via_api(driver, imdb_id):
+    """
+    Attempt to add a title to the IMDB watchlist using the lightweight IMDB AJAX endpoint.
+    Falls back to Selenium UI clicks when the endpoint is unavailable or fails repeatedly.
+
+    Returns:
+        tuple: (success: bool, status_code: int, error_message: str | None)
+    """
+    if not imdb_api_available():
+        return False, 0, None  # Inside a backoff window; caller should use Selenium
+    try:
+        csrf_token = get_imdb_csrf_token(driver)
+        result = driver.execute_async_script("""
+            const imdbId = arguments[0];
+            const csrfToken = arguments[1];
+            const callback = arguments[2];
+
+            const headers = {
+                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+                'X-Requested-With': 'XMLHttpRequest'
+            };
+            if (csrfToken) {
+                headers['X-Imdb-Csrf-Token'] = csrfToken;
+            }
+            
+            fetch('https://www.imdb.com/list/_ajax/watchlist_add', {
+                method: 'POST',
+                credentials: 'include',
+                headers,
+                body: 'const=' + encodeURIComponent(imdbId)
+            }).then(async (resp) => {
+                let data = null;
+                try {
+                    data = await resp.json();
+                } catch (e) {
+                    // If response is not JSON, ignore parsing errors
+                }
+                callback({ status: resp.status, ok: resp.ok, data });
+            }).catch((err) => callback({ status: 0, ok: false, error: err ? err.toString() : 'unknown error' }));
+        """, imdb_id, csrf_token)
+        
+        if isinstance(result, dict) and result.get('ok') and result.get('status') == 200:
+            record_imdb_api_result(True)
+            return True, 200, None
+
+        record_imdb_api_result(False)
+        status_code = result.get('status') if isinstance(result, dict) else 0
+        error_message = None
+        if isinstance(result, dict):
+            error_message = result.get('error')
+        return False, status_code, error_message
+    except Exception as e:
+        record_imdb_api_result(False)
+        return False, 0, str(e)
+
+# Requests session seeded once from the browser's signed-in cookies, so review
+# form submissions can go over plain HTTP instead of a rendered page per item
+_imdb_http_session = None
+
+def get_imdb_http_session(driver):
+    global _imdb_http_session
+    if _imdb_http_session is None:
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+        session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36'})
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        _imdb_http_session = session
+    return _imdb_http_session
+
+def submit_imdb_review_via_http(driver, item):
+    """
+    Submit a review through the contribute.imdb.com form over plain HTTP: fetch
+    the server-rendered form once, carry over its hidden fields (auth tokens),
+    and POST the filled form with the browser's cookies. Replaces a full page
+    render plus DOM typing per review with two HTTP round trips.
+
+    Returns:
+        tuple: (success: bool, reason: str | None). reason 'exists' means the
+        item already has a review and was skipped; on failure the caller should
+        fall back to the Selenium path.
+    """
+    try:
+        session = get_imdb_http_session(driver)
+        form_url = f'https://contribute.imdb.com/review/{item["IMDB_ID"]}/add?bus=imdb'
+        resp = session.get(form_url, timeout=30)
+        if resp.status_code != 200:
+            return False, f'form fetch returned status {resp.status_code}'
+
+        form_match = re.search(r'<form[^>]*action="([^"]*)"[^>]*>(.*?)</form>', resp.text, re.S)
+        if not form_match:
+            return False, 'review form not found in page'
+        action, form_html = form_match.groups()
+
+        # A pre-filled body means a review already exists for this title
+        textarea_match = re.search(r'<textarea[^>]*>(.*?)</textarea>', form_html, re.S)
+        if textarea_match and textarea_match.group(1).strip():
+            return True, 'exists'
+
+        # Carry over every server-rendered hidden field, then fill the visible ones
+        fields = dict(re.findall(r'<input[^>]*type="hidden"[^>]*name="([^"]+)"[^>]*value="([^"]*)"', form_html))
+        fields['title'] = 'My Review'
+        fields['review'] = item['Comment']
+        fields['is_spoiler'] = '1' if item.get('Spoiler') else '0'
+
+        resp = session.post(urljoin(form_url, action or form_url), data=fields, timeout=30)
+        if resp.status_code in (200, 201, 302):
+            return True, None
+        return False, f'submit returned status {resp.status_code}'
+    except requests.RequestException as e:
+        return False, str(e)
+
+def add_imdb_checkin_via_http(driver, imdb_id):
+    """
+    Record a watch-history check-in by replaying the GraphQL mutation IMDB's
+    own UI issues, with the browser's cookies over the pooled HTTP session.
+    One JSON POST replaces a full title-page load plus the modal click flow.
+
+    Returns:
+        bool: True when the mutation succeeded; on any failure the caller
+        should fall back to the Selenium path, and the shared API backoff
+        window keeps subsequent items from retrying a dead endpoint.
+    """
+    if not imdb_api_available():
+        return False
+    try:
+        session = get_imdb_http_session(driver)
+        payload = {
+            'operationName': 'UpsertCheckins',
+            'variables': {'input': {'checkins': [{'titleId': imdb_id}]}},
+            'query': ('mutation UpsertCheckins($input: CheckinsUpsertInput!) '
+                      '{ checkinsUpsert(input: $input) { checkins { id } } }'),
+        }
+        response = session.post('https://api.graphql.imdb.com/', json=payload,
+                                headers={'Content-Type': 'application/json'}, timeout=10)
+        ok = response.status_code == 200 and not response.json().get('errors')
+        record_imdb_api_result(ok)
+        return ok
+    except Exception:
+        record_imdb_api_result(False)
+        return False
+
+def format_episode_label(item):
+    # Returns the '[SxxEyy] ' print prefix for episode items, or '' for everything else
+    season_number = item.get('SeasonNumber')
+    episode_number = item.get('EpisodeNumber')
+    if season_number and episode_number:
+        return f'[S{int(season_number):02d}E{int(episode_number):02d}] '
+    return ''
+
+def emit_trakt_batch_results(items_in_batch, response, list_label, num_items, processed_count,
+                             verb='Added', fail_verb='Failed to add', preposition='to'):
+    # Prints one aggregated line per successful Trakt batch (item detail goes
+    # to the debug log) and one buffered line per item on failure, returning
+    # the updated running processed_count. The verb/preposition parameters
+    # let the removal and watch-history loops reuse the same reporting path
+    from IMDBTraktSyncer import errorLogger as EL
+    lines = []
+    if response and response.status_code in [200, 201, 204]:
+        first_item = processed_count + 1
+        processed_count += len(items_in_batch)
+        lines.append(f" - {verb} items {first_item}-{processed_count} of {num_items} {preposition} {list_label} ({len(items_in_batch)} in batch)")
+        for item in items_in_batch:
+            # Lazy %s args: nothing is formatted unless debug logging is enabled
+            EL.logger.debug("%s %s: %s (%s) %s %s (%s)", verb, item['Type'], item['Title'], item['Year'], preposition, list_label, item['IMDB_ID'])
+    else:
+        for item in items_in_batch:
+            processed_count += 1
+            episode_title = format_episode_label(item)
+            error_message = f"{fail_verb} {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) {preposition} {list_label} ({item['IMDB_ID']})"
+            lines.append(f"   - {error_message}")
+            EL.logger.error(error_message)
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+    return processed_count
+
+def emit_trakt_rating_results(items_in_batch, response, num_items, processed_count):
+    # Rating-batch counterpart of emit_trakt_batch_results: one aggregated
+    # line per successful batch, per-item failure reporting, returning the
+    # updated processed_count
+    from IMDBTraktSyncer import errorLogger as EL
+    lines = []
+    if response and response.status_code in [200, 201, 204]:
+        first_item = processed_count + 1
+        processed_count += len(items_in_batch)
+        lines.append(f" - Rated items {first_item}-{processed_count} of {num_items} on Trakt ({len(items_in_batch)} in batch)")
+        for item in items_in_batch:
+            # Lazy %s args: nothing is formatted unless debug logging is enabled
+            EL.logger.debug("Rated %s: %s (%s): %s/10 on Trakt (%s)", item['Type'], item['Title'], item['Year'], item['Rating'], item['IMDB_ID'])
+    else:
+        for item in items_in_batch:
+            processed_count += 1
+            episode_title = format_episode_label(item)
+            error_message = f"Failed rating {item['Type']} ({processed_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}): {item['Rating']}/10 on Trakt ({item['IMDB_ID']})"
+            lines.append(f"   - {error_message}")
+            EL.logger.error(error_message)
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+    return processed_count
+
+def adjust_trakt_batch_size(batch_size, response):
+    # AIMD tuning of the Trakt batch size: grow additively while the server
+    # keeps up, halve when a batch times out or gets rate limited, so large
+    # syncs settle on the biggest payload the endpoint handles reliably.
+    # Backoff sleeps are already handled inside EH.make_trakt_request
+    if response is not None and response.status_code in [200, 201, 204]:
+        return min(batch_size + 50, TRAKT_BATCH_SIZE_MAX)
+    if response is None or response.status_code in (408, 429, 500, 502, 503, 504):
+        return max(batch_size // 2, TRAKT_BATCH_SIZE_MIN)
+    return batch_size
+
+def main():
+    parser = argparse.ArgumentParser(description="IMDBTraktSyncer CLI")
+    parser.add_argument("--clear-user-data", action="store_true", help="Clears user entered credentials.")
+    parser.add_argument("--clear-cache", action="store_true", help="Clears cached browsers, drivers and error logs.")
+    parser.add_argument("--uninstall", action="store_true", help="Clears cached browsers and drivers before uninstalling.")
+    parser.add_argument("--clean-uninstall", action="store_true", help="Clears all cached data, inluding user credentials, cached browsers and drivers before uninstalling.")
+    parser.add_argument("--directory", action="store_true", help="Prints the package install directory.")
+    parser.add_argument("--keep-alive", action="store_true", help="Reuses a persistent Chrome instance across runs to skip browser startup.")
+    
+    args = parser.parse_args()
+
+    main_directory = os.path.dirname(os.path.realpath(__file__))
+
+    # Only needed by the maintenance arg handlers below
+    from IMDBTraktSyncer import arguments
+
+    if args.clear_user_data:
+        arguments.clear_user_data(main_directory)
+    
+    if args.clear_cache:
+        arguments.clear_cache(main_directory)
+    
+    if args.uninstall:
+        arguments.uninstall(main_directory)
+    
+    if args.clean_uninstall:
+        arguments.clean_uninstall(main_directory)
+    
+    if args.directory:
+        arguments.print_directory(main_directory)
+    
+    # If no arguments are passed, run the main package logic
+    if not any([args.clear_user_data, args.clear_cache, args.uninstall, args.clean_uninstall, args.directory]):
+        
+        # Run main package
+        print("Starting IMDBTraktSyncer....")
+        # Selenium imports are heavy (~150ms+ cold); defer them so the maintenance
+        # flags (--directory, --clear-cache, ...) never pay for them
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from IMDBTraktSyncer import checkVersion as CV
+        from IMDBTraktSyncer import verifyCredentials as VC
+        from IMDBTraktSyncer import checkChrome as CC
+        from IMDBTraktSyncer import traktData
+        from IMDBTraktSyncer import imdbData
+        from IMDBTraktSyncer import errorHandling as EH
+        from IMDBTraktSyncer import errorLogger as EL
+
+        # Locator tuples used on every iteration of the IMDB watch-history
+        # loop, built once here instead of per item (By is only imported in
+        # this branch, so module scope is not an option)
+        WH_LOADER_LOCATOR = (By.CSS_SELECTOR, '[data-testid="tm-box-wl-loader"]')
+        WH_ADDTOLIST_LOCATOR = (By.CSS_SELECTOR, 'button[data-testid="tm-box-addtolist-button"]')
+        WH_CHECKINS_LOCATOR = (By.XPATH, "//div[contains(text(), 'Your check-ins')]")
+        WH_CHECKIN_CONFIRMED_LOCATOR = (By.XPATH, "//div[contains(@class, 'ipc-promptable-base__content')]//div[@data-titleinlist='true']")
+
+        # Check if package is up to date
+        CV.checkVersion()
+        
+        try:
+            # Print credentials directory
+            VC.print_directory(main_directory)
+            
+            # Get credentials
+            _, _, _, _, imdb_username, imdb_password = VC.prompt_get_credentials()
+            sync_watchlist_value = VC.prompt_sync_watchlist()
+            sync_ratings_value = VC.prompt_sync_ratings()
+            remove_watched_from_watchlists_value = VC.prompt_remove_watched_from_watchlists()
+            sync_reviews_value = VC.prompt_sync_reviews()
+            sync_watch_history_value = VC.prompt_sync_watch_history()
+            mark_rated_as_watched_value = VC.prompt_mark_rated_as_watched()
+            remove_watchlist_items_older_than_x_days_value, watchlist_days_to_remove_value = VC.prompt_remove_watchlist_items_older_than_x_days()
+            
+            # Check if Chrome portable browser is downloaded and up to date
+            CC.checkChrome()
+            browser_type, headless = CC.get_browser_type()
+
+            # Set up directory for downloads
+            directory = os.path.dirname(os.path.realpath(__file__))
+
+            # Start WebDriver
+            print('Starting WebDriver...')
+            
+            chrome_binary_path  = CC.get_chrome_binary_path(directory)
+            chromedriver_binary_path  = CC.get_chromedriver_binary_path(directory)
+            user_data_directory = CC.get_user_data_directory()
+            
+            # In keep-alive mode, attach to an already-running Chrome via the fixed remote
+            # debugging port so repeated runs skip the cold browser launch entirely.
+            attached_to_existing_chrome = False
+            if args.keep_alive:
+                if not is_chrome_debug_port_open():
+                    # No Chrome listening yet, spawn one detached with remote debugging enabled
+                    launch_args = [
+                        chrome_binary_path,
+                        f'--remote-debugging-port={CHROME_DEBUG_PORT}',
+                        f'--user-data-dir={user_data_directory}'
+                    ]
+                    if headless == True:
+                        launch_args.append('--headless=new')
+                    popen_kwargs = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.DEVNULL}
+                    if sys.platform == "win32":
+                        popen_kwargs['creationflags'] = subprocess.DETACHED_PROCESS
+                    else:
+                        popen_kwargs['start_new_session'] = True
+                    subprocess.Popen(launch_args, **popen_kwargs)
+
+                    # Poll the debugging port until Chrome is ready to accept connections
+                    deadline = time.time() + 30
+                    while time.time() < deadline:
+                        if is_chrome_debug_port_open():
+                            break
+                        time.sleep(0.2)
+
+                if is_chrome_debug_port_open():
+                    attached_to_existing_chrome = True
+                else:
+                    print("Could not reach the persistent Chrome instance, falling back to a fresh launch.")
+
+            # Initialize Chrome options
+            options = Options()
+            # Return from driver.get on DOMContentLoaded instead of the full load event;
+            # every page interaction below already waits explicitly for the elements it
+            # needs, so there is no reason to wait out third-party subresources
+            options.page_load_strategy = 'eager'
+            if attached_to_existing_chrome:
+                # Attach to the running browser; binary location, user data dir and prefs
+                # belong to the already-running process and must not be set here
+                options.debugger_address = f'127.0.0.1:{CHROME_DEBUG_PORT}'
+            else:
+                options.binary_location = chrome_binary_path
+                options.add_argument(f"--user-data-dir={user_data_directory}")
+                if headless == True:
+                    options.add_argument("--headless=new")
+                options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36')
+                options.add_experimental_option("prefs", {
+                    "download.default_directory": directory,
+                    "download.directory_upgrade": True,
+                    "download.prompt_for_download": False,
+                    "profile.default_content_setting_values.automatic_downloads": 1,
+                    "credentials_enable_service": False,
+                    "profile.password_manager_enabled": False,
+                    # Block images, plugins and notification prompts; every IMDB page pulls
+                    # megabytes of poster images that are never consumed, so this is the
+                    # single biggest bandwidth cut per run
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.images": 2,
+                    "profile.managed_default_content_settings.plugins": 2,
+                    "profile.default_content_setting_values.notifications": 2,
+                    # Stylesheets are also dead weight here: every interaction goes
+                    # through CSS-selector presence waits and JS clicks, neither of
+                    # which needs the page painted with IMDB's styling
+                    "profile.managed_default_content_settings.stylesheets": 2
+                })
+                options.add_argument('--blink-settings=imagesEnabled=false')
+                options.add_argument('--disable-remote-fonts')
+                options.add_argument('--disable-gpu')
+                options.add_argument('--start-maximized')
+                options.add_argument('--disable-notifications')
+                options.add_argument("--disable-third-party-cookies")
+                options.add_argument("--disable-dev-shm-usage")
+                options.add_argument("--no-sandbox")
+                options.add_argument("--disable-extensions")
+                options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
+                options.add_argument('--log-level=3')
+            
+            service = Service(executable_path=chromedriver_binary_path)
+                        
+            # Suppress the chromedriver console window on Windows (also removes the
+            # "DevTools listening on ws:" line). Selenium passes creationflags and a
+            # hidden-window STARTUPINFO to Popen itself, so they must go through
+            # creation_flags rather than popen_kw (duplicating them there raises
+            # TypeError); DETACHED_PROCESS also detaches the driver from this console
+            if sys.platform == "win32":
+                service.creation_flags = subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS
+
+            try:
+                # Initialize WebDriver with the given options and service
+                driver = webdriver.Chrome(service=service, options=options)
+                driver.set_page_load_timeout(60)
+
+                # Register the sign-in probe once per session via CDP so it exists on every
+                # page; each check then sends a tiny call instead of re-shipping and
+                # re-compiling the full ~30-line script over chromedriver per invocation.
+                # The postLogin flag switches between the startup heuristics (cookies and
+                # storage count as signed in) and the stricter post-login ones (must have
+                # navigated away from the sign-in page).
+                sign_in_probe_js = """
+                window.__itsSignedIn = function(userMenuSelectors, postLogin) {
+                    for (var i = 0; i < userMenuSelectors.length; i++) {
+                        var element = document.querySelector(userMenuSelectors[i]);
+                        if (element && element.offsetParent !== null) {
+                            return { signed_in: true, method: 'user-menu', selector: userMenuSelectors[i] };
+                        }
+                    }
+
+                    if (!postLogin) {
+                        // Check if sign-in button exists (means not signed in)
+                        var signInButton = document.querySelector('a[href*="signin"], a[href*="sign-in"], .ipc-button[href*="signin"]');
+                        if (signInButton && signInButton.offsetParent !== null) {
+                            return { signed_in: false, method: 'sign-in-button' };
+                        }
+
+                        // Check for cookies that might indicate sign-in
+                        var cookies = document.cookie;
+                        if (cookies.includes('session-id') || cookies.includes('ubid-main') || cookies.includes('at-main')) {
+                            return { signed_in: true, method: 'cookies' };
+                        }
+
+                        // Check for localStorage/sessionStorage
+                        try {
+                            if (localStorage.getItem('signin_status') === 'true' || sessionStorage.getItem('signed_in') === 'true') {
+                                return { signed_in: true, method: 'storage' };
+                            }
+                        } catch(e) {}
+                    } else {
+                        // Check if we're redirected away from sign-in page
+                        if (!window.location.href.includes('signin') && !window.location.href.includes('sign-in')) {
+                            var signInButton = document.querySelector('a[href*="signin"], a[href*="sign-in"]');
+                            if (!signInButton || signInButton.offsetParent === null) {
+                                return { signed_in: true, method: 'no-sign-in-button' };  // No sign-in button visible, likely signed in
+                            }
+                        }
+                    }
+
+                    // Default: assume not signed in if we can't determine
+                    return { signed_in: false, method: 'default' };
+                };
+                """
+                try:
+                    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': sign_in_probe_js})
+                    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': WATCHLIST_ACK_HOOK_JS})
+                except Exception:
+                    # CDP unavailable (non-Chrome driver); the guarded calls below return null
+                    pass
+
+                # Block analytics/ads requests plus image/media/CSS bytes via CDP;
+                # none of it affects the selectors the sync reads, and unlike the
+                # profile prefs this also covers the attach-to-existing-Chrome path
+                # where launch options cannot be set
+                try:
+                    driver.execute_cdp_cmd('Network.enable', {})
+                    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': [
+                        '*doubleclick*',
+                        '*google-analytics*',
+                        '*amazon-adsystem*',
+                        '*aax*',
+                        '*googletagmanager*',
+                        '*scorecardresearch*',
+                        '*facebook.net*',
+                        '*.woff',
+                        '*.woff2',
+                        '*.ttf',
+                        '*.jpg',
+                        '*.jpeg',
+                        '*.png',
+                        '*.webp',
+                        '*.gif',
+                        '*.svg',
+                        '*.css',
+                        '*.mp4'
+                    ]})
+                except Exception:
+                    pass
+
+            except Exception as e:
+                error_message = (f"Error initializing WebDriver: {str(e)}")
+                EL.print_logger.error(f"{error_message}")
+                raise SystemExit
+            
+            # Example: Wait for an element and interact with it
+            wait = WebDriverWait(driver, 30)  # Increased timeout to 30 seconds
+            
+            # go to IMDB homepage
+            success, status_code, url, driver, wait = EH.get_page_with_retries('https://www.imdb.com/', driver, wait)
+            if not success:
+                # Page failed to load, raise an exception
+                raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
+
+            # Wait for document ready state (gates page load without a fixed sleep)
+            WebDriverWait(driver, 10).until(lambda d: d.execute_script("return document.readyState") == "complete")
+
+            # Check if still signed in from previous session with a single synchronous JS probe.
+            # All sign-in indicators (user menu selectors, sign-in button, cookies, storage) are
+            # evaluated by the session-registered __itsSignedIn helper in one WebDriver round
+            # trip instead of polling each selector with its own WebDriverWait.
+            signed_in = False
+            try:
+                check_result = driver.execute_script("return window.__itsSignedIn ? window.__itsSignedIn(arguments[0], false) : null;", SIGN_IN_SELECTORS)
+                signed_in = bool(check_result and check_result.get('signed_in'))
+
+            except Exception as e:
+                # If JavaScript check fails, assume not signed in and proceed
+                # Don't print error for expected cases where user might not be signed in
+                signed_in = False
+            
+            if signed_in:
+                print("Successfully signed in to IMDB")
+            else:
+                # Not signed in from previous session, proceed with sign in logic
+
+                # Fast path: sign in over plain HTTP and transfer the session cookies into
+                # the WebDriver, skipping the Selenium form-filling flow and its waits
+                http_session = imdb_http_login(imdb_username, imdb_password)
+                if http_session:
+                    transfer_session_cookies_to_driver(http_session, driver)
+
+                if not http_session:
+                    # HTTP sign in failed (e.g. captcha/OTP challenge), fall back to the Selenium UI flow
+
+                    # Load sign in page
+                    success, status_code, url, driver, wait = EH.get_page_with_retries('https://www.imdb.com/registration/signin/?subPageType=sign_in', driver, wait)
+                    if not success:
+                        # Page failed to load, raise an exception
+                        raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
+
+                    # Wait for sign in link to appear and then click it
+                    sign_in_link = wait.until(EC.presence_of_element_located((By.XPATH, "//*[contains(@class, 'display-button-container')]//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'imdb')]")))
+                    driver.execute_script("arguments[0].click();", sign_in_link)
+
+                    # wait for email input field and password input field to appear, then enter credentials and submit
+                    email_input = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "input[type='email']")))[0]
+                    password_input = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "input[type='password']")))[0]
+                    email_input.send_keys(imdb_username)
+                    password_input.send_keys(imdb_password)
+                    submit_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='submit']")))
+                    driver.execute_script("arguments[0].click();", submit_button)
+
+                    # Wait for the submit to trigger navigation instead of sleeping a fixed amount
+                    try:
+                        WebDriverWait(driver, 10).until(EC.staleness_of(submit_button))
+                    except TimeoutException:
+                        pass
+
+                # go to IMDB homepage
+                success, status_code, url, driver, wait = EH.get_page_with_retries('https://www.imdb.com/', driver, wait)
+                if not success:
+                    # Page failed to load, raise an exception
+                    raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
+
+                # Wait for document ready state after navigation
+                WebDriverWait(driver, 10).until(lambda d: d.execute_script("return document.readyState") == "complete")
+
+                # Check if signed in after login attempt with a single synchronous JS probe
+                signed_in = False
+                try:
+                    check_result = driver.execute_script("return window.__itsSignedIn ? window.__itsSignedIn(arguments[0], true) : null;", SIGN_IN_SELECTORS)
+                    signed_in = bool(check_result and check_result.get('signed_in'))
+
+                except Exception as e:
+                    print(f"Could not verify sign-in status after login: {e}")
+                    # Assume not signed in and let error handling below handle it
+                    signed_in = False
+                
+                if signed_in:
+                    print("Successfully signed in to IMDB")
+                else:
+                    print("\nError: Not signed in to IMDB")
+                    print("\nPossible Causes and Solutions:")
+                    print("- IMDB captcha check triggered or incorrect IMDB login.")
+                    
+                    print("\n1. IMDB Captcha Check:")
+                    print("   If your login is correct, the issue is likely due to an IMDB captcha check.")
+                    print("   To resolve this, follow these steps:")
+                    print("   - Log in to IMDB on your browser (preferably Chrome) and on the same computer.")
+                    print("   - If already logged in, log out and log back in.")
+                    print("   - Repeat this process until a captcha check is triggered.")
+                    print("   - Complete the captcha and finish logging in.")
+                    print("   - After successfully logging in, run the script again.")
+                    print("   - You may need to repeat these steps until the captcha check is no longer triggered.")
+                    
+                    print("\n2. Incorrect IMDB Login:")
+                    print("   If your IMDB login is incorrect, update your login credentials:")
+                    print("   - Edit the 'credentials.txt' file in your settings directory with the correct login information.")
+                    print("   - Alternatively, delete the 'credentials.txt' file and run the script again.")
+                    
+                    print("\nFor more details, see the following GitHub link:")
+                    print("https://github.com/RileyXX/IMDB-Trakt-Syncer/issues/2")
+                    
+                    print("\nStopping script...")
+                    
+                    EL.logger.error("Error: Not signed in to IMDB")
+                    shutdown_webdriver(driver, service, keep_alive=args.keep_alive)
+                    EH.close_session()
+                    raise SystemExit
+            
+            # Check IMDB Language for compatability
+            # Get Current Language
+            language_element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "span[id*='nav-language-selector-contents'] .selected"))).get_attribute("aria-label")
+            original_language = language_element
+            if (original_language != "English (United States)"):
+                print("Temporarily changing IMDB Language to English for compatability. See: https://www.imdb.com/preferences/general")
+                # Open Language Dropdown
+                language_dropdown = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "label[for*='nav-language-selector']")))
+                driver.execute_script("arguments[0].click();", language_dropdown)
+                # Change Language to English
+                english_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "span[id*='nav-language-selector-contents'] li[aria-label*='English (United States)']")))
+                driver.execute_script("arguments[0].click();", english_element)
+            
+            # Check IMDB reference view setting for compatability. See: https://www.imdb.com/preferences/general
+            reference_view_changed = False
+            # Fast path: replay the preferences form over HTTP with the browser cookies
+            # instead of loading and rendering the page in Chrome
+            reference_view_http_result = set_reference_view_via_http(driver, enabled=False)
+            if reference_view_http_result is True:
+                print("Temporarily disabling reference view IMDB setting for compatability. See: https://www.imdb.com/preferences/general")
+                reference_view_changed = True
+            try:
+                # Selenium fallback, only when the HTTP path could not fetch or parse the form
+                success = False
+                if reference_view_http_result is None:
+                    # Load page
+                    success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/preferences/general', driver, wait, total_wait_time=30)
+                if success:
+                    # Try to find reference view checkbox (with short timeout since IMDB may have removed this)
+                    try:
+                        reference_checkbox = WebDriverWait(driver, 5).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, "input[id*='reference-view-toggle']"))
+                        ).get_attribute("checked")
+                        
+                        if reference_checkbox:
+                            print("Temporarily disabling reference view IMDB setting for compatability. See: https://www.imdb.com/preferences/general")
+                            # Click reference view checkbox
+                            reference_checkbox_elem = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[id*='reference-view-toggle']")))
+                            driver.execute_script("arguments[0].click();", reference_checkbox_elem)
+                            # Submit
+                            submit = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".article input[type*='submit']")))
+                            driver.execute_script("arguments[0].click();", submit)
+                            reference_view_changed = True
+                            # Wait for the form submit to navigate (submit goes stale) instead of sleeping
+                            try:
+                                WebDriverWait(driver, 5).until(EC.staleness_of(submit))
+                            except TimeoutException:
+                                pass
+                    except (TimeoutException, NoSuchElementException):
+                        # Reference view setting not found - IMDB may have removed it or changed the UI
+                        # This is fine, just continue without it
+                        pass
+            except Exception as e:
+                # If there's any error accessing the preferences page, log it but continue
+                print(f"Note: Could not check IMDB reference view setting (page may have changed). Continuing...")
+                EL.logger.warning(f"Failed to access IMDB preferences: {e}")
+                
+            # Initalize list values. Independent lists rather than a chained assignment,
+            # which would alias all eight names to one shared object and turn any
+            # downstream append into silent cross-list mutation
+            trakt_watchlist, trakt_ratings, trakt_reviews, trakt_watch_history = [], [], [], []
+            imdb_watchlist, imdb_ratings, imdb_reviews, imdb_watch_history = [], [], [], []
+            
+            # Kick off IMDB export generation before the Trakt phase. IMDB builds the
+            # CSVs server-side for minutes, so requesting them now lets the generation
+            # run concurrently with the Trakt API calls below; the IMDB phase then only
+            # waits out whatever generation time is left.
+            print('\n🎥 Requesting IMDB data exports (generated server-side while Trakt data loads)...', flush=True)
+            driver, wait = imdbData.request_imdb_exports(driver, wait, directory, sync_watchlist_value, sync_ratings_value, sync_watch_history_value, remove_watched_from_watchlists_value, mark_rated_as_watched_value)
+
+            # ═══════════════════════════════════════════════════════════════════════════
+            # PHASE: Processing Trakt Data (fast API calls)
+            # ═══════════════════════════════════════════════════════════════════════════
+            print('\n🎬 Processing Trakt Data', flush=True)
+            print('─' * 24, flush=True)
+            trakt_start_time = time.time()
+            
+            print('  • Fetching user profile...', flush=True)
+            trakt_encoded_username = traktData.get_trakt_encoded_username()
+
+            # Fetch the enabled Trakt lists concurrently - these are independent network-bound
+            # calls against distinct api.trakt.tv endpoints, so wall time drops from the sum of
+            # the fetch times to the slowest single fetch
+            trakt_fetches = []
+            if sync_watchlist_value or remove_watched_from_watchlists_value:
+                trakt_fetches.append(('watchlist', traktData.get_trakt_watchlist))
+            if sync_ratings_value or mark_rated_as_watched_value:
+                trakt_fetches.append(('ratings', traktData.get_trakt_ratings))
+            if sync_reviews_value:
+                trakt_fetches.append(('reviews/comments', traktData.get_trakt_comments))
+            if sync_watch_history_value or remove_watched_from_watchlists_value or mark_rated_as_watched_value:
+                trakt_fetches.append(('watch history', traktData.get_trakt_watch_history))
+
+            trakt_results = {}
+            if trakt_fetches:
+                print(f'  • Loading {", ".join(name for name, _ in trakt_fetches)} concurrently...', flush=True)
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    futures = {name: executor.submit(getter, trakt_encoded_username) for name, getter in trakt_fetches}
+                    # Collect results in submission order so the printed summary stays deterministic
+                    for name, _ in trakt_fetches:
+                        trakt_results[name] = futures[name].result()
+                        print(f'    ✓ {name}: {len(trakt_results[name])} items', flush=True)
+
+            trakt_watchlist = trakt_results.get('watchlist', trakt_watchlist)
+            trakt_ratings = trakt_results.get('ratings', trakt_ratings)
+            trakt_reviews = trakt_results.get('reviews/comments', trakt_reviews)
+            trakt_watch_history = trakt_results.get('watch history', trakt_watch_history)
+            
+            trakt_elapsed = time.time() - trakt_start_time
+            print(f'  ✓ Trakt data loaded ({trakt_elapsed:.1f}s)', flush=True)
+            
+            # ═══════════════════════════════════════════════════════════════════════════
+            # PHASE: Processing IMDB Data (export generation + CSV parsing)
+            # ═══════════════════════════════════════════════════════════════════════════
+            print('\n🎥 Processing IMDB Data', flush=True)
+            print('─' * 23, flush=True)
+            imdb_start_time = time.time()
+            
+            print('  • Waiting for IMDB export generation to finish...', flush=True)
+            driver, wait = imdbData.wait_for_imdb_exports(driver, wait)
+
+            print('  • Downloading IMDB export files...', flush=True)
+            driver, wait = imdbData.download_imdb_exports(driver, wait, directory, sync_watchlist_value, sync_ratings_value, sync_watch_history_value, remove_watched_from_watchlists_value, mark_rated_as_watched_value)
+            
+            print('  • Parsing downloaded CSV files...', flush=True)
+            # Fan the CPU-bound CSV parsers out to worker processes so this phase costs
+            # max(t_i) instead of sum(t_i). Review scraping needs the Selenium driver, so
+            # it runs in this thread while the pool parses the CSVs in parallel.
+            csv_parsers = []
+            if sync_watchlist_value or remove_watched_from_watchlists_value:
+                csv_parsers.append(('watchlist', imdbData.parse_imdb_watchlist_csv))
+            if sync_ratings_value or mark_rated_as_watched_value:
+                csv_parsers.append(('ratings', imdbData.parse_imdb_ratings_csv))
+            if sync_watch_history_value or remove_watched_from_watchlists_value or mark_rated_as_watched_value:
+                csv_parsers.append(('watch history', imdbData.parse_imdb_checkins_csv))
+
+            with ProcessPoolExecutor(max_workers=3) as csv_executor:
+                csv_futures = {name: csv_executor.submit(parser, directory) for name, parser in csv_parsers}
+
+                if sync_reviews_value:
+                    print('    • Fetching reviews (via web scraping)...', end='', flush=True)
+                    imdb_reviews, errors_found_getting_imdb_reviews, driver, wait = imdbData.get_imdb_reviews(driver, wait, directory)
+                    print(f' ✓ {len(imdb_reviews)} items', flush=True)
+
+                if 'watchlist' in csv_futures:
+                    imdb_watchlist, imdb_watchlist_size = csv_futures['watchlist'].result()
+                    print(f'    • Parsed watchlist ✓ {imdb_watchlist_size} items', flush=True)
+
+                if 'ratings' in csv_futures:
+                    imdb_ratings = csv_futures['ratings'].result()
+                    print(f'    • Parsed ratings ✓ {len(imdb_ratings)} items', flush=True)
+
+                if 'watch history' in csv_futures:
+                    imdb_watch_history, imdb_watch_history_size = csv_futures['watch history'].result()
+                    print(f'    • Parsed watch history ✓ {imdb_watch_history_size} items', flush=True)
+            
+            imdb_elapsed = time.time() - imdb_start_time
+            print(f'  ✓ IMDB data loaded ({imdb_elapsed:.1f}s)', flush=True)
+            
+            # ═══════════════════════════════════════════════════════════════════════════
+            # PHASE: Analyzing & Comparing Data
+            # ═══════════════════════════════════════════════════════════════════════════
+            print('\n📊 Analyzing & Comparing Data', flush=True)
+            print('─' * 30, flush=True)
+            analysis_start_time = time.time()
+            
+            print('  • Checking list limits...', flush=True)
+            if sync_watchlist_value:
+                # Check if IMDB watchlist has reached the 10,000 item limit. If limit is reached, disable syncing watchlists.
+                imdb_watchlist_limit_reached = EH.check_if_watchlist_limit_reached(imdb_watchlist_size)
+                              
+            if sync_watch_history_value or mark_rated_as_watched_value:
+                # Check if IMDB watch history has reached the 10,000 item limit. If limit is reached, disable syncing watch history.
+                imdb_watch_history_limit_reached = EH.check_if_watch_history_limit_reached(imdb_watch_history_size)
+            
+            print('  • Removing duplicates & filtering invalid items...', flush=True)
+            # Remove duplicates from Trakt watch_history
+            trakt_watch_history = EH.remove_duplicates_by_imdb_id(trakt_watch_history)
+                       
+            # Get trakt and imdb data and filter out items with missing imdb id.
+            # The lists stay as records (list of dicts) rather than a columnar layout:
+            # every downstream phase consumes whole items, and the analysis passes below
+            # each traverse a list at most once against prebuilt ID sets.
+            # itemgetter dispatches in C, which is faster than .get() when these lists are large
+            get_imdb_id = operator.itemgetter('IMDB_ID')
+            trakt_ratings = [rating for rating in trakt_ratings if get_imdb_id(rating) is not None]
+            imdb_ratings = [rating for rating in imdb_ratings if get_imdb_id(rating) is not None]
+            trakt_reviews = [review for review in trakt_reviews if get_imdb_id(review) is not None]
+            imdb_reviews = [review for review in imdb_reviews if get_imdb_id(review) is not None]
+            trakt_watchlist = [item for item in trakt_watchlist if get_imdb_id(item) is not None]
+            imdb_watchlist = [item for item in imdb_watchlist if get_imdb_id(item) is not None]
+            trakt_watch_history = [item for item in trakt_watch_history if get_imdb_id(item) is not None]
+            imdb_watch_history = [item for item in imdb_watch_history if get_imdb_id(item) is not None]
+            
+            # Remove unknown Types from review lists
+            imdb_reviews, trakt_reviews = EH.remove_unknown_types(imdb_reviews, trakt_reviews)
+            
+            # ── Resolve conflicting IMDB IDs (fast HEAD requests with caching) ──
+            print('  • Resolving conflicting IMDB IDs (using fast cached resolution)...', flush=True)
+            EH.clear_imdb_id_cache()  # Start fresh for this sync session
+            
+            # Update outdated IMDB_IDs from trakt lists based on matching Title and Type comparison
+            if sync_ratings_value:
+                trakt_ratings, imdb_ratings, driver, wait = EH.update_outdated_imdb_ids_from_trakt(trakt_ratings, imdb_ratings, driver, wait, list_name="ratings")
+            if sync_reviews_value:
+                trakt_reviews, imdb_reviews, driver, wait = EH.update_outdated_imdb_ids_from_trakt(trakt_reviews, imdb_reviews, driver, wait, list_name="reviews")
+            if sync_watchlist_value:
+                trakt_watchlist, imdb_watchlist, driver, wait = EH.update_outdated_imdb_ids_from_trakt(trakt_watchlist, imdb_watchlist, driver, wait, list_name="watchlist")
+            if sync_watch_history_value or mark_rated_as_watched_value:
+                trakt_watch_history, imdb_watch_history, driver, wait = EH.update_outdated_imdb_ids_from_trakt(trakt_watch_history, imdb_watch_history, driver, wait, list_name="watch history")
+            
+            '''
+            # Removed temporarily to monitor impact. Most conflicts should be resolved by update_outdated_imdb_ids_from_trakt() function
+            # Filter out items that share the same Title, Year and Type, AND have non-matching IMDB_ID values
+            trakt_ratings, imdb_ratings = EH.filter_out_mismatched_items(trakt_ratings, imdb_ratings)
+            trakt_reviews, imdb_reviews = EH.filter_out_mismatched_items(trakt_reviews, imdb_reviews)
+            trakt_watchlist, imdb_watchlist = EH.filter_out_mismatched_items(trakt_watchlist, imdb_watchlist)
+            trakt_watch_history, imdb_watch_history = EH.filter_out_mismatched_items(trakt_watch_history, imdb_watch_history)
+            '''
+            
+            # ── Finding items to sync ──
+            print('  • Comparing lists to find items to sync...', flush=True)
+            
+            # Build each list's ID set once and reuse it across the pairwise filters,
+            # halving the key-set construction passes over these lists
+            # Ratings get a full IMDB_ID -> item index because the rating-conflict pass
+            # below needs the items; the key views double as the membership sets here
+            imdb_ratings_dict = {rating['IMDB_ID']: rating for rating in imdb_ratings}
+            trakt_ratings_dict = {rating['IMDB_ID']: rating for rating in trakt_ratings}
+            imdb_ratings_ids = imdb_ratings_dict.keys()
+            trakt_ratings_ids = trakt_ratings_dict.keys()
+            imdb_reviews_ids = {item['IMDB_ID'] for item in imdb_reviews}
+            trakt_reviews_ids = {item['IMDB_ID'] for item in trakt_reviews}
+            imdb_watchlist_ids = {item['IMDB_ID'] for item in imdb_watchlist}
+            trakt_watchlist_ids = {item['IMDB_ID'] for item in trakt_watchlist}
+            imdb_watch_history_ids = {item['IMDB_ID'] for item in imdb_watch_history}
+            trakt_watch_history_ids = {item['IMDB_ID'] for item in trakt_watch_history}
+
+            # Filter out items already set: keep items from one list that are not already present in the other based on IMDB_ID
+            imdb_ratings_to_set = EH.filter_items_by_ids(trakt_ratings, imdb_ratings_ids)
+            trakt_ratings_to_set = EH.filter_items_by_ids(imdb_ratings, trakt_ratings_ids)
+
+            imdb_reviews_to_set = EH.filter_items_by_ids(trakt_reviews, imdb_reviews_ids)
+            trakt_reviews_to_set = EH.filter_items_by_ids(imdb_reviews, trakt_reviews_ids)
+
+            imdb_watchlist_to_set = EH.filter_items_by_ids(trakt_watchlist, imdb_watchlist_ids)
+            trakt_watchlist_to_set = EH.filter_items_by_ids(imdb_watchlist, trakt_watchlist_ids)
+
+            imdb_watch_history_to_set = EH.filter_items_by_ids(trakt_watch_history, imdb_watch_history_ids)
+            trakt_watch_history_to_set = EH.filter_items_by_ids(imdb_watch_history, trakt_watch_history_ids)
+            
+            if mark_rated_as_watched_value:
+                # Combine Trakt and IMDB ratings, deduplicating by IMDB_ID; chaining the
+                # two lists avoids allocating their concatenation
+                combined_ratings = EH.remove_duplicates_by_imdb_id(chain(trakt_ratings, imdb_ratings))
+
+                # Rated IDs absent from both watch histories, via set difference against
+                # the ID sets built above. Shows are skipped because marking a show as
+                # watched on Trakt would mark every episode as watched
+                rated_ids = {item['IMDB_ID'] for item in combined_ratings if item['Type'] != 'show'}
+                need_ids = rated_ids - trakt_watch_history_ids - imdb_watch_history_ids
+
+                # combined_ratings is deduplicated, so each needed ID maps to one item
+                new_items = [item for item in combined_ratings if item['IMDB_ID'] in need_ids]
+                trakt_watch_history_to_set.extend(new_items)
+                imdb_watch_history_to_set.extend(new_items)
+                trakt_watch_history.extend(new_items)
+                imdb_watch_history.extend(new_items)
+
+                # Remove duplicates from trakt and imdb watch history once after the loop
+                # (in case items were added with mark_rated_as_watched_value)
+                trakt_watch_history = EH.remove_duplicates_by_imdb_id(trakt_watch_history)
+                imdb_watch_history = EH.remove_duplicates_by_imdb_id(imdb_watch_history)
+            
+            # Skip adding shows to trakt watch history, because it will mark all episodes as watched
+            trakt_watch_history_to_set = EH.remove_shows(trakt_watch_history_to_set)
+            
+            # Filter ratings to update
+            imdb_ratings_to_update = []
+            trakt_ratings_to_update = []
+
+            # Include only items with the same IMDB_ID and different ratings and prefer
+            # the most recent rating. Walk the smaller index and probe the larger one
+            # with a single .get(), so the pass scales with the smaller ratings list
+            if len(imdb_ratings_dict) <= len(trakt_ratings_dict):
+                smaller_ratings_dict, larger_ratings_dict, smaller_is_imdb = imdb_ratings_dict, trakt_ratings_dict, True
+            else:
+                smaller_ratings_dict, larger_ratings_dict, smaller_is_imdb = trakt_ratings_dict, imdb_ratings_dict, False
+            for imdb_id, smaller_rating in smaller_ratings_dict.items():
+                larger_rating = larger_ratings_dict.get(imdb_id)
+                if larger_rating is not None:
+                    imdb_rating, trakt_rating = (smaller_rating, larger_rating) if smaller_is_imdb else (larger_rating, smaller_rating)
+                    if imdb_rating['Rating'] != trakt_rating['Rating']:
+                        # Date_Added values are ISO8601 (YYYY-MM-DD...), so the date prefix
+                        # sorts lexicographically and no datetime parsing is needed
+                        imdb_date_added = imdb_rating['Date_Added'][:10]
+                        trakt_date_added = trakt_rating['Date_Added'][:10]
+
+                        # Check if ratings were added on different days
+                        if imdb_date_added != trakt_date_added:
+                            # If IMDB rating is more recent, add the Trakt rating to the update list, and vice versa
+                            if imdb_date_added > trakt_date_added:
+                                trakt_ratings_to_update.append(imdb_rating)
+                            else:
+                                imdb_ratings_to_update.append(trakt_rating)
+
+            # Update ratings_to_set
+            imdb_ratings_to_set.extend(imdb_ratings_to_update)
+            trakt_ratings_to_set.extend(trakt_ratings_to_update)
+            
+            # Filter out setting review IMDB where the comment length is less than 600 characters
+            imdb_reviews_to_set = EH.filter_by_comment_length(imdb_reviews_to_set, 600)
+            
+            # Initialize watchlist_items_to_remove variables
+            trakt_watchlist_items_to_remove = []
+            imdb_watchlist_items_to_remove = []
+            
+            # If remove_watched_from_watchlists_value is true
+            if remove_watched_from_watchlists_value:
+                # Collect the watched IDs from both histories in one chained pass; the set
+                # gives the same membership as concat + dedup without the intermediate
+                # list or second set allocation
+                watched_content_ids = {item['IMDB_ID'] for item in chain(trakt_watch_history, imdb_watch_history) if item['IMDB_ID']}
+                        
+                # One partition pass per watchlist replaces the four separate
+                # comprehensions: watched items feed that list's removal set, and the
+                # unwatched items missing from the other service are exactly the
+                # to_set lists from the pairwise filters minus watched content (the
+                # watchlists and their ID sets are untouched since those filters ran)
+                trakt_watchlist_to_set = []
+                imdb_watchlist_to_set = []
+                for item in trakt_watchlist:
+                    if item['IMDB_ID'] in watched_content_ids:
+                        trakt_watchlist_items_to_remove.append(item)
+                    elif item['IMDB_ID'] not in imdb_watchlist_ids:
+                        imdb_watchlist_to_set.append(item)
+                for item in imdb_watchlist:
+                    if item['IMDB_ID'] in watched_content_ids:
+                        imdb_watchlist_items_to_remove.append(item)
+                    elif item['IMDB_ID'] not in trakt_watchlist_ids:
+                        trakt_watchlist_to_set.append(item)
+                
+                # Sort lists by date
+                trakt_watchlist_items_to_remove = EH.sort_by_date_added(trakt_watchlist_items_to_remove)
+                imdb_watchlist_items_to_remove = EH.sort_by_date_added(imdb_watchlist_items_to_remove)
+            
+            # If remove_watchlist_items_older_than_x_days_value is true, add items older than x days to watchlist_items_to_remove lists
+            if remove_watchlist_items_older_than_x_days_value:
+                days = watchlist_days_to_remove_value
+                
+                # Feed the dedup a chained iterable so the concatenated list is never built
+                combined_watchlist = EH.remove_duplicates_by_imdb_id(chain(trakt_watchlist, imdb_watchlist))
+                
+                # Get items older than x days
+                combined_watchlist_to_remove = EH.get_items_older_than_x_days(combined_watchlist, days)
+                
+                # Merge items to remove into the watchlist_items_to_remove lists,
+                # deduplicating by IMDB_ID so items already flagged by the
+                # remove-watched pass are not removed twice downstream
+                trakt_watchlist_items_to_remove = list({item['IMDB_ID']: item for item in trakt_watchlist_items_to_remove + combined_watchlist_to_remove}.values())
+                imdb_watchlist_items_to_remove = list({item['IMDB_ID']: item for item in imdb_watchlist_items_to_remove + combined_watchlist_to_remove}.values())
+                
+                # Remove combined_watchlist_to_remove items from watchlist_to_set lists
+                imdb_watchlist_to_set, trakt_watchlist_to_set = EH.remove_combined_watchlist_to_remove_items_from_watchlist_to_set_lists_by_imdb_id(combined_watchlist_to_remove, imdb_watchlist_to_set, trakt_watchlist_to_set)
+            
+            # Sort lists by date
+            print('  • Sorting items by date...', flush=True)
+            imdb_ratings_to_set = EH.sort_by_date_added(imdb_ratings_to_set)
+            trakt_ratings_to_set = EH.sort_by_date_added(trakt_ratings_to_set)
+            imdb_watchlist_to_set = EH.sort_by_date_added(imdb_watchlist_to_set)
+            trakt_watchlist_to_set = EH.sort_by_date_added(trakt_watchlist_to_set)
+            imdb_watch_history_to_set = EH.sort_by_date_added(imdb_watch_history_to_set)
+            trakt_watch_history_to_set = EH.sort_by_date_added(trakt_watch_history_to_set)
+            
+            # ── Analysis complete - show summary ──
+            analysis_elapsed = time.time() - analysis_start_time
+            print(f'  ✓ Analysis complete ({analysis_elapsed:.1f}s)', flush=True)
+            
+            # Print sync summary, taking each list's length once and reusing it for the
+            # total below
+            print('\n📋 Sync Summary', flush=True)
+            print('─' * 15, flush=True)
+            operation_lists = (trakt_ratings_to_set, imdb_ratings_to_set,
+                               trakt_watchlist_to_set, imdb_watchlist_to_set,
+                               trakt_watch_history_to_set, imdb_watch_history_to_set,
+                               trakt_reviews_to_set, imdb_reviews_to_set,
+                               trakt_watchlist_items_to_remove, imdb_watchlist_items_to_remove)
+            (trakt_ratings_len, imdb_ratings_len,
+             trakt_watchlist_len, imdb_watchlist_len,
+             trakt_watch_history_len, imdb_watch_history_len,
+             trakt_reviews_len, imdb_reviews_len,
+             trakt_wl_remove_len, imdb_wl_remove_len) = map(len, operation_lists)
+            sync_summary = []
+            if sync_ratings_value:
+                sync_summary.append(f"  Ratings:       {trakt_ratings_len:>4} → Trakt | {imdb_ratings_len:>4} → IMDB")
+            if sync_watchlist_value:
+                sync_summary.append(f"  Watchlist:     {trakt_watchlist_len:>4} → Trakt | {imdb_watchlist_len:>4} → IMDB")
+            if sync_watch_history_value or mark_rated_as_watched_value:
+                sync_summary.append(f"  Watch History: {trakt_watch_history_len:>4} → Trakt | {imdb_watch_history_len:>4} → IMDB")
+            if sync_reviews_value:
+                sync_summary.append(f"  Reviews:       {trakt_reviews_len:>4} → Trakt | {imdb_reviews_len:>4} → IMDB")
+            if remove_watched_from_watchlists_value:
+                sync_summary.append(f"  Remove from WL:{trakt_wl_remove_len:>4} Trakt  | {imdb_wl_remove_len:>4} IMDB")
+
+            for line in sync_summary:
+                print(line, flush=True)
+
+            total_operations = sum(map(len, operation_lists))
+            if total_operations == 0:
+                print('\n  ✓ Everything is already in sync!', flush=True)
+            else:
+                print(f'\n  Total operations: {total_operations}', flush=True)
+            
+            if sync_watchlist_value and imdb_watchlist_limit_reached:
+                # IMDB watchlist limit reached, skip watchlist actions for IMDB
+                imdb_watchlist_to_set = []
+            
+            if sync_watch_history_value and imdb_watch_history_limit_reached:
+                # IMDB watch history limit reached, skip watch history actions for IMDB
+                imdb_watch_history_to_set = []
+            
+            if mark_rated_as_watched_value and imdb_watch_history_limit_reached:
+                # IMDB watch history limit reached, skip watch history actions for IMDB
+                imdb_watch_history_to_set = []
+            
+            # ═══════════════════════════════════════════════════════════════════════════
+            # PHASE: Syncing Data
+            # ═══════════════════════════════════════════════════════════════════════════
+            if total_operations > 0:
+                print('\n🔄 Syncing Data', flush=True)
+                print('─' * 15, flush=True)
+                sync_start_time = time.time()
+                        
+            # If sync_watchlist_value is true
+            if sync_watchlist_value:
+                # Set Trakt Watchlist Items (with batching for faster processing)
+                if trakt_watchlist_to_set:
+                    print('Setting Trakt Watchlist Items')
+
+                    # Count the total number of items
+                    num_items = len(trakt_watchlist_to_set)
+                    
+                    # Process items in batches
+                    url = f"https://api.trakt.tv/sync/watchlist"
+                    
+                    # Group items by type for better batching
+                    batch = {
+                        "movies": [],
+                        "shows": [],
+                        "episodes": []
+                    }
+                    
+                    items_in_batch = []
+                    batch_size = 0  # Tracked incrementally instead of re-summing three len() calls per item
+                    batch_count = 0
+                    processed_count = 0
+                    trakt_batch_size = TRAKT_BATCH_SIZE  # Adapted per response by adjust_trakt_batch_size
+
+                    # Overlap each batch's HTTP round trip with building the next batch:
+                    # keep one request in flight on a worker thread and collect its result
+                    # just before submitting the next one, so the per-batch RTT is paid
+                    # while Python prepares the following payload
+                    with ThreadPoolExecutor(max_workers=1) as batch_executor:
+                        in_flight = None  # (future, items) for the batch currently on the wire
+
+                        for item in trakt_watchlist_to_set:
+                            bucket = TRAKT_TYPE_BUCKETS.get(item['Type'])  # 'movie', 'show', or 'episode'
+                            if not bucket:
+                                continue
+                            # Append the payload entry as a single literal; no intermediate binding
+                            batch[bucket].append({"ids": {"imdb": item['IMDB_ID']}})
+
+                            items_in_batch.append(item)
+                            batch_size += 1
+
+                            # Send batch when it reaches the adaptive batch size
+                            if batch_size >= trakt_batch_size:
+                                # Print results for the previous batch, logging failures,
+                                # and retune the batch size from its response
+                                if in_flight is not None:
+                                    sent_future, sent_items = in_flight
+                                    sent_response = sent_future.result()
+                                    trakt_batch_size = adjust_trakt_batch_size(trakt_batch_size, sent_response)
+                                    processed_count = emit_trakt_batch_results(sent_items, sent_response, 'Trakt Watchlist', num_items, processed_count)
+
+                                batch_count += 1
+                                in_flight = (batch_executor.submit(EH.make_trakt_request, url, payload=batch), items_in_batch)
+
+                                # Reset batch; fresh dict/lists, not clear(), because the
+                                # submitted payload is still being serialized on the worker
+                                batch = {
+                                    "movies": [],
+                                    "shows": [],
+                                    "episodes": []
+                                }
+                                items_in_batch = []
+                                batch_size = 0
+
+
+                        # Send remaining items in final batch
+                        if batch_size > 0:
+                            if in_flight is not None:
+                                sent_future, sent_items = in_flight
+                                processed_count = emit_trakt_batch_results(sent_items, sent_future.result(), 'Trakt Watchlist', num_items, processed_count)
+
+                            batch_count += 1
+                            in_flight = (batch_executor.submit(EH.make_trakt_request, url, payload=batch), items_in_batch)
+
+                        # Drain the last in-flight batch, logging failures
+                        if in_flight is not None:
+                            sent_future, sent_items = in_flight
+                            processed_count = emit_trakt_batch_results(sent_items, sent_future.result(), 'Trakt Watchlist', num_items, processed_count)
+
+                    print(f'Setting Trakt Watchlist Items Complete (Processed {processed_count} items in {batch_count} batch(es))')
+                else:
+                    print('No Trakt Watchlist Items To Set')
+
+                # Set IMDB Watchlist Items
+                if imdb_watchlist_to_set:
+                    print('Setting IMDB Watchlist Items')
+                    
+                    # Count the total number of items
+                    num_items = len(imdb_watchlist_to_set)
+                    item_count = 0
+
+                    # One page load up front fetches the IDs already in the watchlist,
+                    # so items left over from a prior partial run are skipped without
+                    # costing an API call or a per-item page load each
+                    existing_watchlist_ids, driver, wait = EH.get_imdb_watchlist_ids(driver, wait)
+
+                    # Fast path: batch all items through IMDB's AJAX watchlist endpoint so each
+                    # WebDriver round trip covers many adds, then fall back to Selenium UI for
+                    # any items the endpoint could not add
+                    api_results = {}
+                    try:
+                        api_results = add_to_imdb_watchlist_via_api_batch(driver, [item['IMDB_ID'] for item in imdb_watchlist_to_set if item['IMDB_ID'] not in existing_watchlist_ids])
+                    except Exception as e:
+                        EL.logger.warning(f"Batch IMDB API add failed: {e}. Falling back to Selenium...")
+
+                    # Once the fast path yields nothing (disabled or in backoff), skip its
+                    # per-item dict probes entirely; every item goes to Selenium
+                    api_enabled = bool(api_results)
+
+                    items_needing_selenium = []
+                    api_report_lines = []
+                    for item in imdb_watchlist_to_set:
+                        item_count += 1
+                        episode_title = format_episode_label(item)
+
+                        year_str = f' ({item["Year"]})' if item["Year"] is not None else '' # sometimes year is None for episodes from trakt so remove it from the print string
+
+                        if item['IMDB_ID'] in existing_watchlist_ids:
+                            api_report_lines.append(f" - Skipped item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} - Already in IMDB watchlist ({item['IMDB_ID']})")
+                            continue
+
+                        api_result = api_results.get(item['IMDB_ID']) if api_enabled else None
+                        if api_result and api_result.get('ok') and api_result.get('status') == 200:
+                            api_report_lines.append(f" - Added {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) [API]")
+                        else:
+                            if api_result:
+                                EL.logger.warning(f"Fast IMDB add failed for {item['IMDB_ID']} (status {api_result.get('status')}): {api_result.get('error')}. Falling back to Selenium...")
+                            items_needing_selenium.append((item_count, item, episode_title, year_str))
+
+                    # Report all API adds in one buffered write rather than one print per item
+                    if api_report_lines:
+                        sys.stdout.write('\n'.join(api_report_lines) + '\n')
+                        sys.stdout.flush()
+
+                    # Selenium UI fallback for the items the API could not add. This stays
+                    # on the single shared driver: the keep-alive mode attaches to one
+                    # Chrome debug port and EH.get_page_with_retries recreates the driver
+                    # on failure, so a pool of parallel sessions would fight both; bulk
+                    # throughput comes from the batched API path above instead. (IMDB no
+                    # longer offers a CSV list/ratings import, so a one-shot file upload
+                    # is not an option either.)
+                    if items_needing_selenium:
+                        print(f"  → Using Selenium UI method for {len(items_needing_selenium)} of {num_items} items (API fast-path failed for these)")
+
+                    # Selector that matched on a previous item, reused until it stops working
+                    working_selector = None
+                    working_selector_type = "CSS"
+
+                    # Per-item add for the modern title layout, pulled out of the loop so
+                    # driver/wait/selector state resolve as closure cells instead of
+                    # repeated global lookups in the hot path (selectors themselves live
+                    # at module scope as IMDB_WL_* constants). Returns False when no
+                    # watchlist button could be found, feeding the circuit breaker below
+                    def add_watchlist_item_via_ui(item, item_count, episode_title, year_str):
+                        nonlocal working_selector, working_selector_type
+
+                        try:
+                            # One in-page wait covers the loader disappearing and a candidate
+                            # button becoming clickable, replacing the Python-side polling of
+                            # separate loader/presence/clickable waits
+                            driver.execute_async_script(ELEMENT_CLICKABLE_WAIT_JS, IMDB_WL_COMBINED_SELECTOR, 10000)
+                        except Exception:
+                            # Fall through; the selector probes below handle a missing button
+                            pass
+
+                        # Find and check watchlist button with stale element retry
+                        max_stale_retries = 3
+                        stale_retry = 0
+                        button_clicked = False
+
+                        while stale_retry < max_stale_retries and not button_clicked:
+                            try:
+                                watchlist_button = None
+
+                                # Fast path: reuse the selector that worked for a previous item;
+                                # the in-page wait above already blocked until a button was ready
+                                if working_selector:
+                                    try:
+                                        if working_selector_type == "CSS":
+                                            watchlist_button = driver.find_element(By.CSS_SELECTOR, working_selector)
+                                        else:
+                                            watchlist_button = driver.find_element(By.XPATH, working_selector)
+                                    except NoSuchElementException:
+                                        working_selector = None  # Layout changed, rediscover below
+
+                                if not watchlist_button:
+                                    # Probe each selector without waiting to find the concrete
+                                    # match in priority order
+                                    for selector in IMDB_WL_SELECTORS:
+                                        try:
+                                            watchlist_button = driver.find_element(By.CSS_SELECTOR, selector)
+                                            if watchlist_button:
+                                                working_selector = selector
+                                                working_selector_type = "CSS"
+                                                EL.logger.info(f"Found watchlist button using selector: {selector}")
+                                                break
+                                        except NoSuchElementException:
+                                            continue
+
+                                # If CSS selectors failed, try XPath
+                                if not watchlist_button:
+                                    try:
+                                        watchlist_button = wait.until(EC.presence_of_element_located((By.XPATH, IMDB_WL_XPATH_SELECTOR)))
+                                        if watchlist_button:
+                                            working_selector = IMDB_WL_XPATH_SELECTOR
+                                            working_selector_type = "XPATH"
+                                            EL.logger.info(f"Found watchlist button using XPath")
+                                    except (TimeoutException, NoSuchElementException):
+                                        pass
+
+                                if not watchlist_button:
+                                    # Could not find watchlist button with any selector
+                                    error_message = f"Failed to add item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - Watchlist button not found on page"
+                                    EL.print_logger.error(f" - {error_message}. Current URL: {driver.current_url}")
+                                    return False
+
+                                # Element found, scroll into view
+                                driver.execute_script("arguments[0].scrollIntoView(true);", watchlist_button)
+
+                                # No fixed animation sleep: the clickable wait below already
+                                # blocks until the button is interactable
+                                # Wait on the reference we already hold; re-find via the cached
+                                # selector only if the scroll made it stale
+                                try:
+                                    wait.until(EC.element_to_be_clickable(watchlist_button))
+                                except StaleElementReferenceException:
+                                    if working_selector_type == "CSS":
+                                        watchlist_button = driver.find_element(By.CSS_SELECTOR, working_selector)
+                                    else:
+                                        watchlist_button = driver.find_element(By.XPATH, working_selector)
+                                except (TimeoutException, NoSuchElementException):
+                                    pass
+
+                                # Check if item is already in watchlist (all indicators in one call)
+                                already_in_watchlist = driver.execute_script(WATCHLIST_ADDED_CHECK_JS, watchlist_button)
+
+                                if already_in_watchlist:
+                                    error_message1 = f" - Skipped item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} - Already in IMDB watchlist ({item['IMDB_ID']})"
+                                    print(error_message1)
+                                    EL.logger.info(error_message1)
+                                    button_clicked = True
+                                    break
+
+                                # Click the held reference; a stale re-find below covers the
+                                # rare case where the page re-renders between wait and click
+                                retry_count = 0
+                                while retry_count < 2:
+                                    try:
+                                        if not watchlist_button:
+                                            raise NoSuchElementException("Watchlist button disappeared")
+
+                                        # Clear any previous network ack, then click
+                                        driver.execute_script("window.__wlAck = false; arguments[0].click();", watchlist_button)
+
+                                        # Wait for success: the injected hook flips __wlAck the moment
+                                        # the watchlist XHR gets a 2xx, ahead of the DOM re-render the
+                                        # visual indicators depend on, which remains the fallback
+                                        def check_success(driver):
+                                            try:
+                                                if driver.execute_script("return window.__wlAck === true;"):
+                                                    return True
+                                                return driver.execute_script(WATCHLIST_ADDED_CHECK_JS, working_selector, working_selector_type == "CSS")
+                                            except:
+                                                return False
+
+                                        WebDriverWait(driver, 5, poll_frequency=0.1).until(check_success)
+
+                                        print(f" - Added {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) [Selenium]")
+
+                                        # Small delay between operations to avoid being flagged
+                                        if item_count % 10 == 0:  # Every 10 items, spend a larger budget
+                                            imdb_operation_bucket.acquire(IMDB_BATCH_DELAY / IMDB_OPERATION_DELAY)
+                                        else:
+                                            imdb_operation_bucket.acquire()
+
+                                        button_clicked = True
+                                        break  # Break the loop if successful
+                                    except (TimeoutException, NoSuchElementException, StaleElementReferenceException) as e:
+                                        retry_count += 1
+                                        if retry_count >= 2:
+                                            error_message = f"Failed to add item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - Button click timeout or element disappeared"
+                                            EL.print_logger.error(f" - {error_message}. Exception: {e}")
+                                            button_clicked = True
+                                        else:
+                                            if isinstance(e, StaleElementReferenceException):
+                                                # Re-find once via the cached selector before retrying
+                                                try:
+                                                    if working_selector_type == "CSS":
+                                                        watchlist_button = driver.find_element(By.CSS_SELECTOR, working_selector)
+                                                    else:  # XPATH
+                                                        watchlist_button = driver.find_element(By.XPATH, working_selector)
+                                                except NoSuchElementException:
+                                                    watchlist_button = None
+                                            time.sleep(0.5)  # Wait before retry
+
+                                break  # Exit stale retry loop if we got this far
+
+                            except Exception as e:
+                                # Handle stale element or other errors
+                                if 'stale element' in str(e).lower():
+                                    stale_retry += 1
+                                    if stale_retry >= max_stale_retries:
+                                        error_message = f"Failed to add item ({item_count} of {num_items}) after {max_stale_retries} retries: {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']})"
+                                        EL.print_logger.error(f" - {error_message}")
+                                    else:
+                                        time.sleep(0.5)  # Wait before retry
+                                else:
+                                    raise  # Re-raise if it's not a stale element error
+
+                        # False when the stale retries were exhausted without a click
+                        return button_clicked
+
+                    # Circuit breaker: consecutive button-not-found failures mean the DOM
+                    # schema (not an individual title page) has likely changed, so stop
+                    # after a few instead of timing out on every remaining item
+                    consecutive_failures = 0
+                    max_consecutive_failures = 5
+
+                    for item_count, item, episode_title, year_str in items_needing_selenium:
+                        try:
+                            # Load page with better error handling. Request the reference layout
+                            # explicitly: it is a fraction of the weight of the modern title page
+                            # and its watchlist ribbon is plain server-rendered HTML, so no
+                            # loader/hydration waits are needed before clicking
+                            try:
+                                success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/title/{item["IMDB_ID"]}/reference', driver, wait, total_wait_time=60)
+                                if not success:
+                                    # Page failed to load, log and skip
+                                    error_message = f"Failed to add item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - Page load failed (status {status_code})"
+                                    EL.print_logger.error(f" - {error_message}")
+                                    continue
+                            except KeyboardInterrupt:
+                                # User wants to stop - re-raise to stop the entire script
+                                raise
+                            except Exception as e:
+                                error_message = f"Failed to add item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - Exception: {e}"
+                                EL.print_logger.error(f" - {error_message}")
+                                continue
+                            
+                            current_url = driver.current_url
+
+                            # Fail-fast probe: if the "added" indicator is already in the initial
+                            # DOM, skip the item before any selector discovery, scrolling or
+                            # clickable waits (covers both the reference ribbon and modern layout)
+                            if driver.find_elements(By.CSS_SELECTOR, '.titlereference-watch-ribbon .wl-ribbon:not(.not-inWL), [data-testid="tm-box-wl-button"] .ipc-icon--done'):
+                                skip_message = f" - Skipped item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} - Already in IMDB watchlist ({item['IMDB_ID']})"
+                                print(skip_message)
+                                EL.logger.info(skip_message)
+                                continue
+
+                            # IMDB occasionally redirects /reference back to the modern title
+                            # page; only then fall back to the heavyweight selector probing
+                            if "/reference" not in current_url:
+                                if add_watchlist_item_via_ui(item, item_count, episode_title, year_str):
+                                    consecutive_failures = 0
+                                else:
+                                    consecutive_failures += 1
+                                    if consecutive_failures >= max_consecutive_failures:
+                                        error_message = f"Aborting IMDB watchlist sync: {consecutive_failures} consecutive items failed to find the watchlist button. IMDB's page layout has likely changed; remaining items skipped."
+                                        EL.print_logger.error(f" - {error_message}")
+                                        break
+                            else:
+                                # Handle the case when the URL contains "/reference"
+                                
+                                # Scroll the page to bring the element into view
+                                watchlist_button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.titlereference-watch-ribbon > .wl-ribbon')))
+                                driver.execute_script("arguments[0].scrollIntoView(true);", watchlist_button)
+                                
+                                # Check if watchlist_button has class .not-inWL before clicking
+                                if 'not-inWL' in watchlist_button.get_attribute('class'):
+                                    driver.execute_script("arguments[0].click();", watchlist_button)
+                                consecutive_failures = 0
+                            
+                        except KeyboardInterrupt:
+                            # User pressed Ctrl+C - stop the script
+                            raise
+                        except (NoSuchElementException, TimeoutException, PageLoadException) as e:
+                            error_message = f"Failed to add item ({item_count} of {num_items}): {item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - {type(e).__name__}"
+                            EL.print_logger.error(f"  - {error_message}", exc_info=True)
+                        except Exception as e:
+                            error_message = f"Unexpected error adding item ({item_count} of {num_items}): {item['Title']}{year_str} to IMDB Watchlist ({item['IMDB_ID']}) - {type(e).__name__}: {e}"
+                            EL.print_logger.error(f"  - {error_message}", exc_info=True)
+
+                    
+                    print('Setting IMDB Watchlist Items Complete')
+                else:
+                    print('No IMDB Watchlist Items To Set')
+             
+            # If sync_ratings_value is true
+            if sync_ratings_value:
+                
+                #Set Trakt Ratings (with batching for faster processing)
+                if trakt_ratings_to_set:
+                    print('Setting Trakt Ratings')
+
+                    # Set the API endpoints
+                    rate_url = "https://api.trakt.tv/sync/ratings"
+                    
+                    # Count the total number of items
+                    num_items = len(trakt_ratings_to_set)
+                    
+                    # Partition by type so every batch is type-homogeneous: movies, shows
+                    # and episodes hit separate server-side paths on Trakt, and a failed
+                    # batch then maps to exactly one type for any later retry
+                    ratings_by_type = {}
+                    for item in trakt_ratings_to_set:
+                        bucket = TRAKT_TYPE_BUCKETS.get(item["Type"])
+                        if bucket:
+                            ratings_by_type.setdefault(bucket, []).append(item)
+
+                    batch_count = 0
+                    processed_count = 0
+
+                    # Pipeline one batch deep, as with the Trakt watchlist: the next batch
+                    # is built while the previous request is on the wire
+                    with ThreadPoolExecutor(max_workers=1) as batch_executor:
+                        in_flight = None  # (future, items) for the batch currently on the wire
+
+                        trakt_batch_size = TRAKT_BATCH_SIZE  # Adapted per response by adjust_trakt_batch_size
+                        for bucket, bucket_items in ratings_by_type.items():
+                            start = 0
+                            while start < len(bucket_items):
+                                items_in_batch = bucket_items[start:start + trakt_batch_size]
+                                start += len(items_in_batch)
+                                payload = {bucket: [
+                                    {"ids": {"imdb": item["IMDB_ID"]}, "rating": item["Rating"]}
+                                    for item in items_in_batch
+                                ]}
+
+                                # Print results for the previous batch, logging failures,
+                                # and retune the batch size from its response
+                                if in_flight is not None:
+                                    sent_future, sent_items = in_flight
+                                    sent_response = sent_future.result()
+                                    trakt_batch_size = adjust_trakt_batch_size(trakt_batch_size, sent_response)
+                                    processed_count = emit_trakt_rating_results(sent_items, sent_response, num_items, processed_count)
+
+                                batch_count += 1
+                                in_flight = (batch_executor.submit(EH.make_trakt_request, rate_url, payload=payload), items_in_batch)
+
+
+                        # Drain the last in-flight batch, logging failures
+                        if in_flight is not None:
+                            sent_future, sent_items = in_flight
+                            processed_count = emit_trakt_rating_results(sent_items, sent_future.result(), num_items, processed_count)
+
+                    print(f'Setting Trakt Ratings Complete (Processed {processed_count} items in {batch_count} batch(es))')
+                else:
+                    print('No Trakt Ratings To Set')
+
+                # Set IMDB Ratings
+                if imdb_ratings_to_set:
+                    print('Setting IMDB Ratings')
+
+                    # Count the total number of items once; it is invariant across the loop
+                    total_ratings = len(imdb_ratings_to_set)
+
+                    # loop through each movie and TV show rating and submit rating on IMDB website
+                    for i, item in enumerate(imdb_ratings_to_set, 1):
+                        
+                        episode_title = format_episode_label(item)
+                        
+                        year_str = f' ({item["Year"]})' if item["Year"] is not None else '' # sometimes year is None for episodes from trakt so remove it from the print string
+                        
+                        try:
+                            # Load page
+                            success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/title/{item["IMDB_ID"]}/', driver, wait)
+                            if not success:
+                                # Page failed to load, raise an exception
+                                raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
+                            
+                            current_url = driver.current_url
+                            
+                            # Check if the URL doesn't contain "/reference"
+                            if "/reference" not in current_url:
+                                # Wait until the rating bar has loaded
+                                wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, '[data-testid="hero-rating-bar__loading"]')))
+                                
+                                # Wait until rate button is located and scroll to it
+                                button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="hero-rating-bar__user-rating"] button.ipc-btn')))
+                                # driver.execute_script("arguments[0].scrollIntoView(true);", button)
+                                
+                                # click on "Rate" button and select rating option, then submit rating
+                                locator = (By.CSS_SELECTOR, '[data-testid="hero-rating-bar__user-rating"] button.ipc-btn')
+                                button = wait.until(lambda d: (lambda el: el if el.get_attribute("aria-disabled") == "false" else False)(d.find_element(*locator)))
+                                try:
+                                    has_existing_rating = button.find_element(By.CSS_SELECTOR, '[data-testid="hero-rating-bar__user-rating__score"] span')
+                                    existing_rating_text = has_existing_rating.get_attribute("textContent").strip()
+                                    existing_rating = int(existing_rating_text)
+                                except NoSuchElementException:
+                                    existing_rating = None
+                                except ValueError as e:
+                                    error_message = f'There was a ValueError when attempting to get existing rating for for this item {item["Type"]}. See error log for details. Script will still attempt to rate this {item["Type"]}. : ({i} of {total_ratings}) {episode_title}{item["Title"]}{year_str}: {item["Rating"]}/10 on IMDB ({item["IMDB_ID"]})'
+                                    existing_rating = None
+                                    EL.print_logger.error(error_message, exc_info=True)
+                                    
+                                if existing_rating != item["Rating"]:
+                                    button = driver.find_element(By.CSS_SELECTOR, '[data-testid="hero-rating-bar__user-rating"] button.ipc-btn')
+                                    driver.execute_script("arguments[0].click();", button)
+                                    rating_option_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f'button[aria-label="Rate {item["Rating"]}"]')))
+                                    driver.execute_script("arguments[0].click();", rating_option_element)
+                                    submit_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button.ipc-rating-prompt__rate-button')))
+                                    driver.execute_script("arguments[0].click();", submit_element)
+                                    # Small delay after rating submission
+                                    if i % 10 == 0:  # Every 10 items, spend a larger budget
+                                        imdb_operation_bucket.acquire(IMDB_BATCH_DELAY / IMDB_OPERATION_DELAY)
+                                    else:
+                                        imdb_operation_bucket.acquire()
+                                    
+                                    print(f' - Rated {item["Type"]}: ({i} of {total_ratings}) {episode_title}{item["Title"]}{year_str}: {item["Rating"]}/10 on IMDB ({item["IMDB_ID"]})')
+                                    
+                                else:
+                                    error_message1 = f' - Rating already exists on IMDB for this {item["Type"]}: ({i} of {total_ratings}) {episode_title}{item["Title"]}{year_str}: {item["Rating"]}/10 on IMDB ({item["IMDB_ID"]})'
+                                    EL.print_logger.error(error_message1)
+                            else:
+                                # Handle the case when the URL contains "/reference"
+                                
+                                # Wait until rate button is located and scroll to it
+                                button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.ipl-rating-interactive__star-container')))
+                                driver.execute_script("arguments[0].scrollIntoView(true);", button)
+
+                                # click on "Rate" button and select rating option, then submit
+                                # rating; the JS click bypasses the clickable-state check, so
+                                # re-waiting on the same selector would just be a second RPC
+                                driver.execute_script("arguments[0].click();", button)
+                                
+                                # Find the rating option element based on the data-value attribute
+                                rating_option_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f'.ipl-rating-selector__star-link[data-value="{item["Rating"]}"]')))
+                                driver.execute_script("arguments[0].click();", rating_option_element)
+                                
+                                # Small delay after rating submission
+                                if i % 10 == 0:  # Every 10 items, spend a larger budget
+                                    imdb_operation_bucket.acquire(IMDB_BATCH_DELAY / IMDB_OPERATION_DELAY)
+                                else:
+                                    imdb_operation_bucket.acquire()
+                                
+                        except (NoSuchElementException, TimeoutException, PageLoadException):
+                            error_message = f'Failed to rate {item["Type"]}: ({i} of {total_ratings}) {episode_title}{item["Title"]}{year_str}: {item["Rating"]}/10 on IMDB ({item["IMDB_ID"]})'
+                            EL.print_logger.error(f" - {error_message}", exc_info=True)
+                            pass
+
+                    print('Setting IMDB Ratings Complete')
+                else:
+                    print('No IMDB Ratings To Set')
+
+            # If sync_reviews_value is true
+            if sync_reviews_value:
+                
+                # Check if there was an error getting IMDB reviews
+                if not errors_found_getting_imdb_reviews:
+                    
+                    # Set Trakt Reviews
+                    if trakt_reviews_to_set:
+                        print('Setting Trakt Reviews')
+
+                        # Count the total number of items
+                        num_items = len(trakt_reviews_to_set)
+                        item_count = 0
+
+                        url = f"https://api.trakt.tv/comments"
+
+                        # Each review is an independent POST; run them concurrently since
+                        # the work is pure I/O and make_trakt_request handles its own
+                        # retries/backoff per call
+                        def submit_review(item):
+                            if item['Type'] not in TRAKT_TYPE_BUCKETS:  # 'movie', 'show', or 'episode'
+                                return item, None
+                            data = {
+                                "comment": item['Comment'],
+                                item['Type']: {
+                                    "ids": {
+                                        "imdb": item['IMDB_ID']
+                                    }
+                                }
+                            }
+                            return item, EH.make_trakt_request(url, payload=data)
+
+                        with ThreadPoolExecutor(max_workers=10) as review_executor:
+                            futures = [review_executor.submit(submit_review, item) for item in trakt_reviews_to_set]
+                            for future in as_completed(futures):
+                                item, response = future.result()
+                                item_count += 1
+
+                                if item['Type'] not in TRAKT_TYPE_BUCKETS:
+                                    continue
+
+                                episode_title = format_episode_label(item)
+
+                                if response and response.status_code in [200, 201, 204]:
+                                    print(f" - Submitted comment ({item_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) on Trakt ({item['IMDB_ID']})")
+                                else:
+                                    error_message = f"Failed to submit comment ({item_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) on Trakt ({item['IMDB_ID']})"
+                                    EL.print_logger.error(f"   - {error_message}")
+
+                        print('Trakt Reviews Set Successfully')
+                    else:
+                        print('No Trakt Reviews To Set')
+
+                    # Set IMDB Reviews
+                    if imdb_reviews_to_set:
+                        # Call the check_last_run() function
+                        if VC.check_imdb_reviews_last_submitted():
+                            print('Setting IMDB Reviews')
+                            
+                            # Count the total number of items
+                            num_items = len(imdb_reviews_to_set)
+                            item_count = 0
+                            
+                            for item in imdb_reviews_to_set:
+                                item_count += 1
+                                try:
+
+                                    episode_title = format_episode_label(item)
+
+                                    # Fast path: post the contribute form directly with the
+                                    # browser's cookies, skipping the rendered page entirely;
+                                    # any failure falls through to the Selenium path below
+                                    http_ok, http_reason = submit_imdb_review_via_http(driver, item)
+                                    if http_ok:
+                                        if http_reason == 'exists':
+                                            print(f"   - Skipped setting review for {item['Title']} ({item['Year']}) on IMDB ({item['IMDB_ID']}) — a review already exists for this item")
+                                        else:
+                                            print(f" - Submitted review ({item_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) on IMDB ({item['IMDB_ID']}) [API]")
+                                            imdb_operation_bucket.acquire()
+                                        continue
+                                    EL.logger.warning(f"HTTP review submit failed for {item['IMDB_ID']}: {http_reason}. Falling back to Selenium...")
+
+                                    # Load page
+                                    success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://contribute.imdb.com/review/{item["IMDB_ID"]}/add?bus=imdb', driver, wait)
+                                    if not success:
+                                        # Page failed to load, raise an exception
+                                        raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
+                                    
+                                    # No fixed pause: the presence waits below already block
+                                    # until the form inputs exist in the DOM
+                                    review_title_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#text-input__0")))
+                                    review_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#textarea__0")))
+                                    
+                                    existing_title = review_title_input.get_attribute("value") or ""
+                                    existing_review = review_input.get_attribute("value") or ""
+                                    
+                                    # Skip submission if review title or review body already contains text
+                                    if existing_title.strip() or existing_review.strip():
+                                        print(f"   - Skipped setting review for {item['Title']} ({item['Year']}) on IMDB ({item['IMDB_ID']}) — a review already exists for this item")
+                                        continue
+                                    
+                                    # Clear old review inputs in one script call per field instead
+                                    # of simulated select-all/delete keystrokes; the input event
+                                    # keeps the page's form state in sync with the cleared value
+                                    clear_field_js = "arguments[0].value = ''; arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+                                    driver.execute_script(clear_field_js, review_title_input)
+                                    driver.execute_script(clear_field_js, review_input)
+
+                                    # Set the field values in one script call each rather than one
+                                    # WebDriver keypress per character; dispatching an input event
+                                    # makes the page's form state pick up the new value
+                                    set_field_js = "arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+                                    driver.execute_script(set_field_js, review_title_input, "My Review")
+                                    driver.execute_script(set_field_js, review_input, item["Comment"])
+                                    
+                                    no_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#is_spoiler-1")))
+                                    yes_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#is_spoiler-0")))
+                                    
+                                    if item["Spoiler"]:
+                                        driver.execute_script("arguments[0].click();", yes_element)
+                                    else:
+                                        driver.execute_script("arguments[0].click();", no_element)
+                                                            
+                                    submit_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button[aria-label='Submit']")))
+
+                                    driver.execute_script("arguments[0].click();", submit_button)
+                                    
+                                    # Wait for review to submit, with optimized delays
+                                    if item_count % 10 == 0:  # Every 10 reviews, spend a larger budget
+                                        imdb_operation_bucket.acquire(IMDB_BATCH_DELAY * 2 / IMDB_OPERATION_DELAY)
+                                    else:
+                                        imdb_operation_bucket.acquire(IMDB_BATCH_DELAY / IMDB_OPERATION_DELAY)
+                                    
+                                    print(f" - Submitted review ({item_count} of {num_items}): {episode_title}{item['Title']} ({item['Year']}) on IMDB ({item['IMDB_ID']})")
+                                    
+                                except (NoSuchElementException, TimeoutException, PageLoadException):
+                                    error_message = f"Failed to submit review ({item_count} of {num_items}): {item['Title']} ({item['Year']}) on IMDB ({item['IMDB_ID']})"
+                                    EL.print_logger.error(f"   - {error_message}", exc_info=True)
+                                    pass
+                            
+                            print('Setting IMDB Reviews Complete')
+                        else:
+                            print('IMDB reviews were submitted within the last 10 days. Skipping IMDB review submission.')
+                    else:
+                        print('No IMDB Reviews To Set')
+                else:
+                    print('There was an error getting IMDB reviews. See exception. Skipping reviews submissions.')
+
+            # If remove_watched_from_watchlists_value is true
+            if remove_watched_from_watchlists_value or remove_watchlist_items_older_than_x_days_value:
+                
+                # Remove Watched Items Trakt Watchlist (with batching for faster processing)
+                if trakt_watchlist_items_to_remove:
+                    print('Removing Watched Items From Trakt Watchlist')
+
+                    # Set the API endpoint
+                    remove_url = "https://api.trakt.tv/sync/watchlist/remove"
+
+                    # Count the total number of items
+                    num_items = len(trakt_watchlist_items_to_remove)
+                    
+                    # Partition once by type and slice type-homogeneous batches, as with
+                    # ratings: no per-item bucket bookkeeping or counter checks in the loop
+                    removals_by_type = {}
+                    for item in trakt_watchlist_items_to_remove:
+                        bucket = TRAKT_TYPE_BUCKETS.get(item["Type"])
+                        if bucket:
+                            removals_by_type.setdefault(bucket, []).append(item)
+
+                    batch_count = 0
+                    processed_count = 0
+
+                    # Pipeline one batch deep like the other Trakt loops: the next batch
+                    # is built while the previous request is on the wire, so successive
+                    # batches ride the shared keep-alive connection back to back
+                    with ThreadPoolExecutor(max_workers=1) as batch_executor:
+                        in_flight = None  # (future, items) for the batch currently on the wire
+
+                        trakt_batch_size = TRAKT_BATCH_SIZE  # Adapted per response by adjust_trakt_batch_size
+                        for bucket, bucket_items in removals_by_type.items():
+                            start = 0
+                            while start < len(bucket_items):
+                                items_in_batch = bucket_items[start:start + trakt_batch_size]
+                                start += len(items_in_batch)
+                                payload = {bucket: [{"ids": {"imdb": item["IMDB_ID"]}} for item in items_in_batch]}
+
+                                # Print results for the previous batch, logging failures,
+                                # and retune the batch size from its response
+                                if in_flight is not None:
+                                    sent_future, sent_items = in_flight
+                                    sent_response = sent_future.result()
+                                    trakt_batch_size = adjust_trakt_batch_size(trakt_batch_size, sent_response)
+                                    processed_count = emit_trakt_batch_results(sent_items, sent_response, 'Trakt Watchlist', num_items, processed_count,
+                                                                               verb='Removed', fail_verb='Failed removing', preposition='from')
+
+                                batch_count += 1
+                                in_flight = (batch_executor.submit(EH.make_trakt_request, remove_url, payload=payload), items_in_batch)
+
+                        # Drain the last in-flight batch, logging failures
+                        if in_flight is not None:
+                            sent_future, sent_items = in_flight
+                            processed_count = emit_trakt_batch_results(sent_items, sent_future.result(), 'Trakt Watchlist', num_items, processed_count,
+                                                                       verb='Removed', fail_verb='Failed removing', preposition='from')
+
+                    print(f'Removing Watched Items From Trakt Watchlist Complete (Processed {processed_count} items in {batch_count} batch(es))')
+                else:
+                    print('No Trakt Watchlist Items To Remove')
+
+                # Remove Watched Items IMDB Watchlist
+                if imdb_watchlist_items_to_remove:
+                    print('Removing Watched Items From IMDB Watchlist')
+                    
+                    # Count the total number of items
+                    num_items = len(imdb_watchlist_items_to_remove)
+                    item_count = 0
+                                    
+                    # Fast path: batch removals through IMDB's AJAX watchlist endpoint,
+                    # as with adds; a pool of parallel Selenium drivers would fight the
+                    # keep-alive single debug port and the driver-recreating retry
+                    # helper, and the batched API path removes far more per round trip
+                    # than extra browsers would
+                    api_results = {}
+                    try:
+                        api_results = remove_from_imdb_watchlist_via_api_batch(driver, [item['IMDB_ID'] for item in imdb_watchlist_items_to_remove])
+                    except Exception as e:
+                        EL.logger.warning(f"Batch IMDB API remove failed: {e}. Falling back to Selenium...")
+                    api_enabled = bool(api_results)
+
+                    items_needing_selenium = []
+                    api_report_lines = []
+                    for item in imdb_watchlist_items_to_remove:
+                        item_count += 1
+                        episode_title = format_episode_label(item)
+                        year_str = f' ({item["Year"]})' if item["Year"] is not None else ''
+
+                        api_result = api_results.get(item['IMDB_ID']) if api_enabled else None
+                        if api_result and api_result.get('ok') and api_result.get('status') == 200:
+                            api_report_lines.append(f" - Removed {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} from IMDB Watchlist ({item['IMDB_ID']}) [API]")
+                        else:
+                            if api_result:
+                                EL.logger.warning(f"Fast IMDB remove failed for {item['IMDB_ID']} (status {api_result.get('status')}): {api_result.get('error')}. Falling back to Selenium...")
+                            items_needing_selenium.append((item_count, item, episode_title, year_str))
+
+                    # Report all API removals in one buffered write
+                    if api_report_lines:
+                        sys.stdout.write('\n'.join(api_report_lines) + '\n')
+                        sys.stdout.flush()
+
+                    for item_count, item, episode_title, year_str in items_needing_selenium:
+
+                        try:
+                            # Load page
+                            success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/title/{item["IMDB_ID"]}/', driver, wait)
+                            if not success:
+                                # Page failed to load, raise an exception
+                                raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
+                            
+                            current_url = driver.current_url
+                            
+                            # Check if the URL doesn't contain "/reference"
+                            if "/reference" not in current_url:
+                                # Wait until the loader has disappeared, indicating the watchlist button has loaded
+                                wait.until(EC.invisibility_of_element_located(WH_LOADER_LOCATOR))
+                                
+                                # Scroll the page to bring the element into view; the located
+                                # element is reused below since the JS click does not need a
+                                # separate clickable wait on the same selector
+                                watchlist_button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'button[data-testid="tm-box-wl-button"]')))
+                                driver.execute_script("arguments[0].scrollIntoView(true);", watchlist_button)
+
+                                # Check if item is not in watchlist otherwise skip it
+                                if 'ipc-icon--add' not in watchlist_button.get_attribute('innerHTML'):
+                                    retry_count = 0
+                                    while retry_count < 2:
+                                        driver.execute_script("arguments[0].click();", watchlist_button)
+                                        try:
+                                            WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'button[data-testid="tm-box-wl-button"] .ipc-icon--add')))
+                                            
+                                            print(f" - Removed {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} from IMDB Watchlist ({item['IMDB_ID']})")
+                                            
+                                            break  # Break the loop if successful
+                                        except TimeoutException:
+                                            retry_count += 1
+
+                                    if retry_count == 2:
+                                        error_message = f"Failed to remove {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} from IMDB Watchlist ({item['IMDB_ID']})"
+                                        EL.print_logger.error(f" - {error_message}")
+                                    
+                                else:
+                                    error_message1 = f" - Failed to remove {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} from IMDB Watchlist ({item['IMDB_ID']})"
+                                    error_message2 = f"   - {item['Type'].capitalize()} not in IMDB watchlist."
+                                    EL.logger.error(error_message1)
+                                    EL.logger.error(error_message2)
+                        
+                            else:
+                                # Handle the case when the URL contains "/reference"
+                                
+                                # Scroll the page to bring the element into view
+                                watchlist_button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.titlereference-watch-ribbon > .wl-ribbon')))
+                                driver.execute_script("arguments[0].scrollIntoView(true);", watchlist_button)
+                                
+                                # Check if watchlist_button doesn't have the class .not-inWL before clicking
+                                if 'not-inWL' not in watchlist_button.get_attribute('class'):
+                                    driver.execute_script("arguments[0].click();", watchlist_button)
+
+                        except (NoSuchElementException, TimeoutException, PageLoadException):
+                            error_message = f"Failed to remove {item['Type']} ({item_count} of {num_items}): {item['Title']}{year_str} from IMDB Watchlist ({item['IMDB_ID']})"
+                            EL.print_logger.error(f" - {error_message}", exc_info=True)
+                            pass
+
+                    
+                    print('Removing Watched Items From IMDB Watchlist Complete')
+                else:
+                    print('No IMDB Watchlist Items To Remove')
+            
+            # If sync_watch_history_value is true
+            if sync_watch_history_value or mark_rated_as_watched_value:
+            
+                # Set Trakt Watch History (with batching for faster processing)
+                if trakt_watch_history_to_set:
+                    print('Setting Trakt Watch History')
+
+                    # Set the API endpoint for syncing watch history
+                    watch_history_url = "https://api.trakt.tv/sync/history"
+                    
+                    # Count the total number of items
+                    num_items = len(trakt_watch_history_to_set)
+                    
+                    # Partition once by type and slice type-homogeneous batches. Shows are
+                    # skipped here as they would mark all episodes as watched
+                    history_by_type = {}
+                    for item in trakt_watch_history_to_set:
+                        bucket = TRAKT_TYPE_BUCKETS.get(item["Type"])
+                        if bucket in ('movies', 'episodes'):
+                            history_by_type.setdefault(bucket, []).append(item)
+
+                    processed_count = 0
+
+                    # Prepare every type-homogeneous batch up front, then submit them
+                    # with a small bounded pool: history batches are independent POSTs,
+                    # so a few in flight overlap their round trips while the pooled
+                    # session and make_trakt_request's Retry-After handling keep the
+                    # request volume inside Trakt's rate budget
+                    prepared_batches = []
+                    for bucket, bucket_items in history_by_type.items():
+                        for start in range(0, len(bucket_items), TRAKT_BATCH_SIZE):
+                            items_in_batch = bucket_items[start:start + TRAKT_BATCH_SIZE]
+                            payload = {bucket: [
+                                {"ids": {"imdb": item["IMDB_ID"]}, "watched_at": item["WatchedAt"]}
+                                for item in items_in_batch
+                            ]}
+                            prepared_batches.append((payload, items_in_batch))
+
+                    batch_count = len(prepared_batches)
+
+                    with ThreadPoolExecutor(max_workers=4) as batch_executor:
+                        futures = [batch_executor.submit(EH.make_trakt_request, watch_history_url, payload=payload)
+                                   for payload, _ in prepared_batches]
+                        # Report in submission order as each batch resolves, logging failures
+                        for future, (payload, items_in_batch) in zip(futures, prepared_batches):
+                            processed_count = emit_trakt_batch_results(items_in_batch, future.result(), 'Trakt Watch History', num_items, processed_count,
+                                                                       verb='Adding')
+
+                    print(f'Setting Trakt Watch History Complete (Processed {processed_count} items in {batch_count} batch(es))')
+                else:
+                    print('No Trakt Watch History To Set')
+                    
+                # Set IMDB Watch History Items
+                if imdb_watch_history_to_set:
+                    print('Setting IMDB Watch History Items')
+                    
+                    # Count the total number of items
+                    num_items = len(imdb_watch_history_to_set)
+                    item_count = 0
+                                    
+                    for item in imdb_watch_history_to_set:
+                        
+                        episode_title = format_episode_label(item)
+                            
+                        year_str = f' ({item.get("Year")})' if item.get("Year") is not None else ''  # Handles None safely
+                        
+                        try:
+                            item_count += 1
+
+                            # Fast path: replay the check-in GraphQL mutation over HTTP;
+                            # any failure backs off the API window and falls through to
+                            # the Selenium page flow below
+                            if add_imdb_checkin_via_http(driver, item['IMDB_ID']):
+                                print(f" - Adding {item.get('Type')} ({item_count} of {num_items}): {episode_title}{item.get('Title')}{year_str} to IMDB Watch History ({item.get('IMDB_ID')}) [API]")
+                                imdb_api_bucket.acquire()
+                                continue
+
+                            # Load page
+                            success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/title/{item["IMDB_ID"]}/', driver, wait)
+                            if not success:
+                                # Page failed to load, raise an exception
+                                raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
+
+                            current_url = driver.current_url
+
+                            # Check if the URL doesn't contain "/reference"
+                            if "/reference" not in current_url:
+                                # Wait until the loader has disappeared, indicating the watch history button has loaded
+                                wait.until(EC.invisibility_of_element_located(WH_LOADER_LOCATOR))
+                                
+                                # Scroll the page to bring the element into view and click the
+                                # located element directly; the JS clicks below bypass the
+                                # clickable-state check, so re-waiting on the same selectors
+                                # would only add WebDriver round trips
+                                watch_history_button = wait.until(EC.presence_of_element_located(WH_ADDTOLIST_LOCATOR))
+                                driver.execute_script("arguments[0].scrollIntoView(true);", watch_history_button)
+
+                                driver.execute_script("arguments[0].click();", watch_history_button)
+
+                                watch_history_button = wait.until(EC.presence_of_element_located(WH_CHECKINS_LOCATOR))
+
+
+                                # Check if item is already in watch history otherwise skip it
+                                if 'true' not in watch_history_button.get_attribute('data-titleinlist'):
+                                    retry_count = 0
+                                    while retry_count < 2:
+                                        driver.execute_script("arguments[0].click();", watch_history_button)
+                                        try:
+                                            WebDriverWait(driver, 3).until(EC.presence_of_element_located(WH_CHECKIN_CONFIRMED_LOCATOR))
+                                            
+                                            print(f" - Adding {item.get('Type')} ({item_count} of {num_items}): {episode_title}{item.get('Title')}{year_str} to IMDB Watch History ({item.get('IMDB_ID')})")
+                                            
+                                            # Small delay between operations to avoid being flagged
+                                            if item_count % 10 == 0:  # Every 10 items, spend a larger budget
+                                                imdb_operation_bucket.acquire(IMDB_BATCH_DELAY / IMDB_OPERATION_DELAY)
+                                            else:
+                                                imdb_operation_bucket.acquire()
+                            
+                                            break  # Break the loop if successful
+                                        except TimeoutException:
+                                            retry_count += 1
+
+                                    if retry_count == 2:
+                                        error_message = f"Failed to add {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watch History ({item['IMDB_ID']})"
+                                        EL.print_logger.error(f" - {error_message}")
+                                else:
+                                    error_message1 = f" - Failed to add {item['Type']} ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watch History ({item['IMDB_ID']})"
+                                    error_message2 = f"   - {item['Type'].capitalize()} already exists in IMDB watch history."
+                                    EL.logger.error(error_message1)
+                                    EL.logger.error(error_message2)
+                            else:
+                                # Handle the case when the URL contains "/reference"
+                                error_message1 = f"IMDB reference view setting is enabled. Adding items to IMDB Check-ins is not supported. See: https://www.imdb.com/preferences/general"
+                                error_message2 = f"Failed to add item ({item_count} of {num_items}): {item['Title']}{year_str} to IMDB Watch History ({item['IMDB_ID']})"
+                                EL.print_logger.error(f" - {error_message1}")
+                                EL.print_logger.error(f" - {error_message2}")
+                            
+                        except (NoSuchElementException, TimeoutException, PageLoadException):
+                            error_message = f"Failed to add item ({item_count} of {num_items}): {episode_title}{item['Title']}{year_str} to IMDB Watch History ({item['IMDB_ID']})"
+                            EL.print_logger.error(f" - {error_message}", exc_info=True)
+                            pass
+
+                    
+                    print('Setting IMDB Watch History Items Complete')
+                else:
+                    print('No IMDB Watch History Items To Set')
+            
+            # Change language back to original if was changed
+            if (original_language != "English (United States)"):
+                print("Changing IMDB Language Back to Original. See: https://www.imdb.com/preferences/general")
+                # go to IMDB homepage
+                success, status_code, url, driver, wait = EH.get_page_with_retries('https://www.imdb.com/', driver, wait)
+                if not success:
+                    # Page failed to load, raise an exception
+                    raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
+                
+                # Change Language Back to Original
+                # Open Language Dropdown
+                language_dropdown = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "label[for*='nav-language-selector']")))
+                driver.execute_script("arguments[0].click();", language_dropdown)
+                # Change Language to Original
+                original_language_element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f"span[id*='nav-language-selector-contents'] li[aria-label*='{original_language}']")))
+                driver.execute_script("arguments[0].click();", original_language_element)
+                
+            # Find reference view checkbox
+            if reference_view_changed:
+                print("Changing reference view IMDB setting back to original. See: https://www.imdb.com/preferences/general")
+                # Fast path: re-enable the setting by replaying the preferences form over HTTP
+                if set_reference_view_via_http(driver, enabled=True) is None:
+                    # Load page
+                    success, status_code, url, driver, wait = EH.get_page_with_retries(f'https://www.imdb.com/preferences/general', driver, wait)
+                    if not success:
+                        # Page failed to load, raise an exception
+                        raise PageLoadException(f"Failed to load page. Status code: {status_code}. URL: {url}")
+                    # Click reference view checkbox
+                    reference_checkbox = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[id*='reference-view-toggle']")))
+                    driver.execute_script("arguments[0].click();", reference_checkbox)
+                    # Submit
+                    submit = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".article input[type*='submit']")))
+                    driver.execute_script("arguments[0].click();", submit)
+                    time.sleep(1)
+            
+            # ═══════════════════════════════════════════════════════════════════════════
+            # PHASE: Cleanup & Completion
+            # ═══════════════════════════════════════════════════════════════════════════
+            if total_operations > 0:
+                sync_elapsed = time.time() - sync_start_time
+                print(f'\n✓ Sync complete ({sync_elapsed:.1f}s)', flush=True)
+            
+            #Close web driver
+            print("\n🔒 Closing webdriver...", flush=True)
+            shutdown_webdriver(driver, service, keep_alive=args.keep_alive)
+            EH.close_session()  # Release the pooled Trakt connections
+            print("\n" + "═" * 50, flush=True)
+            print("✅ IMDBTraktSyncer Complete", flush=True)
+            print("═" * 50, flush=True)
+        
+        except Exception as e:
+            error_message = "An error occurred while running the script."
+            EH.report_error(error_message)
+            EL.logger.error(error_message, exc_info=True)
+            
+            # Close the driver and stop the service if they were initialized
+            if 'driver' in locals() and driver is not None:
+                service_to_stop = service if 'service' in locals() else None
+                shutdown_webdriver(driver, service_to_stop, keep_alive=args.keep_alive)
+            elif 'service' in locals() and service is not None and not args.keep_alive:
+                service.stop()
+            EH.close_session()  # Release the pooled Trakt connections
+
+if __name__ == '__main__':
+    main()
@@ -7,7 +7,8 @@ import time
 import sys
 import threading
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 class SyncProgressTracker:
@@ -31,9 +32,18 @@ class SyncProgressTracker:
         self.update_interval = 0.1  # Update display at most every 100ms
         self.spinner_idx = 0
         self.sub_tasks = {}
-        self.stats = defaultdict(int)
+        self.stats = Counter()
         self._lock = threading.Lock()
         self._active = False
+        self._pad = ' ' * 100  # Reused to clear previous draws without per-call ljust allocs
+        self._flush_counter = 0  # Renders since the last explicit stdout flush
+        self._last_frame = None  # Dedupes redraws whose visible content is unchanged
+        # Static line prefix formatted once; only the variable segment is
+        # rebuilt per tick. Kept in sync with description by start()
+        self._prefix = f"\r    {self.description}: "
+        # All bar states precomputed so renders index a table instead of
+        # rebuilding the string with two multiplications per tick
+        self._bars = ['█' * i + '░' * (bar_width - i) for i in range(bar_width + 1)]
         
     def start(self, total_items=None, description=None):
         """Start or restart the progress tracker."""
@@ -42,23 +52,29 @@ class SyncProgressTracker:
                 self.total_items = total_items
             if description is not None:
                 self.description = description
+                self._prefix = f"\r    {self.description}: "
             self.processed_items = 0
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
             self.last_update_time = 0
+            self._last_frame = None
             self._active = True
             self._display_progress()
         return self
     
     def update(self, increment=1, status_text=None):
         """Update progress by increment amount."""
+        # Throttle check on the monotonic clock outside the lock: in tight
+        # loops most calls only bump the counter, so they skip the redraw
+        # work (and any stdout write) entirely
+        now = time.monotonic()
+        if now - self.last_update_time < self.update_interval:
+            with self._lock:
+                self.processed_items += increment
+            return
         with self._lock:
             self.processed_items += increment
-            current_time = time.time()
-            
-            # Throttle display updates
-            if current_time - self.last_update_time >= self.update_interval:
-                self._display_progress(status_text)
-                self.last_update_time = current_time
+            self._display_progress(status_text)
+            self.last_update_time = now
     
     def set_progress(self, current, total=None, status_text=None):
         """Set absolute progress values."""
@@ -67,18 +83,30 @@ class SyncProgressTracker:
             if total is not None:
                 self.total_items = total
             self._display_progress(status_text)
-            self.last_update_time = time.time()
+            self.last_update_time = time.monotonic()
     
     def add_stat(self, key, value=1):
         """Track a statistic."""
         with self._lock:
             self.stats[key] += value
+
+    def add_stats(self, mapping):
+        """Merge a batch of statistics in one lock acquisition.
+
+        Hot loops should count into a local Counter and hand it over here
+        once per batch; Counter.update runs at C speed.
+        """
+        with self._lock:
+            self.stats.update(mapping)
     
     def finish(self, final_message=None):
         """Complete the progress tracker and show final stats."""
         with self._lock:
             self._active = False
-            elapsed = time.time() - self.start_time if self.start_time else 0
+            # Push out any byte writes still sitting behind a skipped flush
+            sys.stdout.flush()
+            self._flush_counter = 0
+            elapsed = time.monotonic() - self.start_time if self.start_time else 0
             
             # Clear line and show completion
             sys.stdout.write('\r' + ' ' * 80 + '\r')
@@ -99,7 +127,7 @@ class SyncProgressTracker:
         if not self._active:
             return
             
-        elapsed = time.time() - self.start_time if self.start_time else 0
+        elapsed = time.monotonic() - self.start_time if self.start_time else 0
         
         if self.total_items > 0:
             progress = self.processed_items / self.total_items
@@ -113,15 +141,29 @@ class SyncProgressTracker:
                 eta_str = "--:--"
             
             if self.show_bar:
-                # Build progress bar
-                filled = int(self.bar_width * progress)
-                bar = '█' * filled + '░' * (self.bar_width - filled)
+                # Look up the prebuilt progress bar for this fill level
+                filled = min(int(self.bar_width * progress), self.bar_width)
+                bar = self._bars[filled]
                 
                 status = status_text if status_text else f"{self.processed_items}/{self.total_items}"
-                line = f"\r    {self.description}: [{bar}] {percentage:5.1f}% | {status} | ETA: {eta_str}"
+
+                # Skip the write when nothing visible changed since the last
+                # frame; a TTY redraw is far more expensive than this check
+                frame = (filled, int(percentage * 10), status, eta_str)
+                if frame == self._last_frame:
+                    return
+                self._last_frame = frame
+
+                line = self._prefix + f"[{bar}] {percentage:5.1f}% | {status} | ETA: {eta_str}"
             else:
                 status = status_text if status_text else f"{self.processed_items}/{self.total_items}"
-                line = f"\r    {self.description}: {percentage:5.1f}% | {status} | ETA: {eta_str}"
+
+                frame = (int(percentage * 10), status, eta_str)
+                if frame == self._last_frame:
+                    return
+                self._last_frame = frame
+
+                line = self._prefix + f"{percentage:5.1f}% | {status} | ETA: {eta_str}"
         else:
             # Indeterminate progress with spinner
             self.spinner_idx = (self.spinner_idx + 1) % len(self.SPINNER_CHARS)
@@ -130,8 +172,23 @@ class SyncProgressTracker:
             line = f"\r    {spinner} {self.description}: {status} | {self._format_time(elapsed)}"
         
         # Pad to clear previous content
-        sys.stdout.write(line.ljust(100))
-        sys.stdout.flush()
+        pad_len = 100 - len(line)
+        if pad_len > 0:
+            line = line + self._pad[:pad_len]
+
+        # Encode once and write bytes below the text layer, flushing only every
+        # fifth render; falls back to the plain text path where stdout is not
+        # UTF-8 (some Windows consoles reinterpret raw bytes) or has no buffer
+        out = sys.stdout
+        if getattr(out, 'buffer', None) is not None and (out.encoding or '').lower() in ('utf-8', 'utf8'):
+            out.buffer.write(line.encode('utf-8'))
+            self._flush_counter += 1
+            if self._flush_counter >= 5:
+                out.flush()
+                self._flush_counter = 0
+        else:
+            out.write(line)
+            out.flush()
     
     @staticmethod
     def _format_time(seconds):
@@ -153,92 +210,162 @@ class CachedIMDBResolver:
     """
     High-performance IMDB ID resolver with caching and lightweight HEAD requests.
     Resolves outdated/redirected IMDB IDs without loading full pages.
+    Resolutions persist on disk across runs, so daily syncs skip the network
+    entirely for IDs resolved within the last CACHE_MAX_AGE seconds.
     """
-    
-    def __init__(self):
-        self._cache = {}  # Maps original_id -> resolved_id
-        self._pending = set()  # IDs that need resolution
+
+    CACHE_MAX_AGE = 30 * 24 * 3600  # Re-resolve entries older than 30 days
+
+    def __init__(self, cache_path=None):
+        import os
+        import shelve
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        if cache_path is None:
+            cache_path = os.path.join(os.path.expanduser('~'), '.imdb_trakt_syncer', 'idresolve')
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Maps original_id -> (resolved_id, epoch_seconds); write-through to disk
+            self._cache = shelve.open(cache_path)
+        except Exception:
+            # Unwritable cache dir or corrupt db: fall back to memory-only for this run
+            self._cache = {}
+        self._pending = {}  # IDs that need resolution; dict keys act as an insertion-ordered set
+        # Only the non-identity resolutions; almost all cached entries resolve
+        # to themselves, so apply_resolutions can probe this small dict instead
+        # of the full cache. Repopulated from cache hits as IDs are queried
+        self._mutated = {}
+        # Shared keep-alive session for the HEAD probes: a bare requests.head()
+        # per ID pays a fresh TCP+TLS handshake against imdb.com every call,
+        # while the pooled session reuses one socket across the whole batch
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[429, 500, 502, 503, 504])))
         self.stats = {
             'cache_hits': 0,
             'resolved': 0,
             'errors': 0
         }
-    
+        self._stats_lock = threading.Lock()  # Guards stats updates from HEAD worker threads
+
+    def close(self):
+        """Release the pooled HTTP connections and the on-disk cache."""
+        self._session.close()
+        if hasattr(self._cache, 'close'):
+            self._cache.close()
+
+    def _cache_get(self, imdb_id):
+        """Return the cached resolution, or None if missing or expired."""
+        entry = self._cache.get(imdb_id)
+        if entry is None:
+            return None
+        resolved_id, stored_at = entry
+        if time.time() - stored_at > self.CACHE_MAX_AGE:
+            return None
+        if resolved_id != imdb_id:
+            self._mutated[imdb_id] = resolved_id
+        return resolved_id
+
+    def _cache_set(self, imdb_id, resolved_id):
+        """Store a resolution with its timestamp; shelve writes through to disk."""
+        self._cache[imdb_id] = (resolved_id, time.time())
+        if resolved_id != imdb_id:
+            self._mutated[imdb_id] = resolved_id
+
     def add_ids_to_resolve(self, imdb_ids):
         """Queue IDs for resolution."""
         for imdb_id in imdb_ids:
-            if imdb_id and imdb_id not in self._cache:
-                self._pending.add(imdb_id)
-    
+            if imdb_id and self._cache_get(imdb_id) is None:
+                self._pending[imdb_id] = None
+
     def get_cached(self, imdb_id):
         """Get cached resolution if available."""
-        if imdb_id in self._cache:
+        resolved_id = self._cache_get(imdb_id)
+        if resolved_id is not None:
             self.stats['cache_hits'] += 1
-            return self._cache[imdb_id]
-        return None
+        return resolved_id
     
-    def resolve_batch_with_driver(self, driver, wait, progress_callback=None):
+    def _head_resolve(self, imdb_id):
         """
-        Resolve all pending IDs using the webdriver.
-        Uses HEAD requests first, falls back to full page load only if needed.
+        Resolve a single ID via a lightweight HEAD request (no page render).
+        Returns (imdb_id, resolved_id) where resolved_id is None if the HEAD
+        path failed and the caller should fall back to the driver.
         """
         import requests
+        try:
+            url = f"https://www.imdb.com/title/{imdb_id}/"
+            response = self._session.head(url, allow_redirects=True, timeout=10,
+                                          headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+            if response.status_code == 200 and '/title/' in response.url:
+                # Extract resolved ID from final URL after redirects
+                return imdb_id, response.url.split('/title/')[1].split('/')[0]
+        except (requests.RequestException, Exception):
+            pass
+        return imdb_id, None
+
+    def resolve_batch_with_driver(self, driver, wait, progress_callback=None):
+        """
+        Resolve all pending IDs.
+        HEAD requests run concurrently on a thread pool (the wait is pure
+        network RTT); only IDs whose HEAD path fails fall back to sequential
+        full page loads in the webdriver.
+        """
         from IMDBTraktSyncer import errorHandling as EH
-        
+
         pending_list = list(self._pending)
         total = len(pending_list)
-        
+
         if total == 0:
             return
-        
-        for idx, imdb_id in enumerate(pending_list):
-            if imdb_id in self._cache:
-                continue
-            
-            if progress_callback:
-                progress_callback(idx + 1, total, imdb_id)
-            
+
+        needs_driver = []
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = {executor.submit(self._head_resolve, imdb_id): imdb_id for imdb_id in pending_list}
+            for future in as_completed(futures):
+                imdb_id, resolved_id = future.result()
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total, imdb_id)
+                if resolved_id is not None:
+                    with self._stats_lock:
+                        self.stats['resolved'] += 1
+                    self._cache_set(imdb_id, resolved_id)
+                    self._pending.pop(imdb_id, None)
+                else:
+                    needs_driver.append(imdb_id)
+
+        # Sequential driver fallback for IDs the HEAD path could not resolve
+        for imdb_id in needs_driver:
             resolved_id = imdb_id  # Default to same if resolution fails
-            
             try:
-                # Try lightweight HEAD request first (faster, no page render)
                 url = f"https://www.imdb.com/title/{imdb_id}/"
-                try:
-                    response = requests.head(url, allow_redirects=True, timeout=10,
-                                             headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
-                    if response.status_code == 200:
-                        # Extract resolved ID from final URL
-                        final_url = response.url
-                        if '/title/' in final_url:
-                            resolved_id = final_url.split('/title/')[1].split('/')[0]
-                            self.stats['resolved'] += 1
-                except (requests.RequestException, Exception):
-                    # HEAD request failed, fall back to driver
-                    try:
-                        success, status_code, resolved_url, driver, wait = EH.get_page_with_retries(url, driver, wait, total_wait_time=30)
-                        if success and '/title/' in resolved_url:
-                            resolved_id = resolved_url.split('/title/')[1].split('/')[0]
-                            self.stats['resolved'] += 1
-                    except Exception:
-                        self.stats['errors'] += 1
+                success, status_code, resolved_url, driver, wait = EH.get_page_with_retries(url, driver, wait, total_wait_time=30)
+                if success and '/title/' in resolved_url:
+                    resolved_id = resolved_url.split('/title/')[1].split('/')[0]
+                    self.stats['resolved'] += 1
             except Exception:
                 self.stats['errors'] += 1
-            
-            self._cache[imdb_id] = resolved_id
-            self._pending.discard(imdb_id)
-        
+
+            self._cache_set(imdb_id, resolved_id)
+            self._pending.pop(imdb_id, None)
+
         return driver, wait
     
     def apply_resolutions(self, item_list, id_key='IMDB_ID'):
         """Apply cached resolutions to a list of items."""
         updated_count = 0
+        if not self._mutated:
+            return updated_count
         for item in item_list:
-            original_id = item.get(id_key)
-            if original_id and original_id in self._cache:
-                resolved_id = self._cache[original_id]
-                if resolved_id != original_id:
-                    item[id_key] = resolved_id
-                    updated_count += 1
+            resolved_id = self._mutated.get(item.get(id_key))
+            if resolved_id is not None:
+                item[id_key] = resolved_id
+                updated_count += 1
         return updated_count
 
 
@@ -298,20 +425,26 @@ class DataAnalyzer:
             imdb_list = imdb_data.get(dtype, [])
             
             self.progress.update(status_text=f"Filtering {dtype}")
-            
-            # Build sets for fast lookup
-            trakt_ids = {item.get('IMDB_ID') for item in trakt_list if item.get('IMDB_ID')}
-            imdb_ids = {item.get('IMDB_ID') for item in imdb_list if item.get('IMDB_ID')}
-            
+
+            # One pass per list builds an {id: item} dict (deduplicating by ID
+            # for free); the diff is then a C-level set difference on the key
+            # views instead of a per-item membership scan of the other list
+            trakt_by_id = {item['IMDB_ID']: item for item in trakt_list if item.get('IMDB_ID')}
+            imdb_by_id = {item['IMDB_ID']: item for item in imdb_list if item.get('IMDB_ID')}
+
             # Find items to sync
-            to_trakt = [item for item in imdb_list if item.get('IMDB_ID') not in trakt_ids]
-            to_imdb = [item for item in trakt_list if item.get('IMDB_ID') not in imdb_ids]
-            
+            to_trakt = [imdb_by_id[k] for k in imdb_by_id.keys() - trakt_by_id.keys()]
+            to_imdb = [trakt_by_id[k] for k in trakt_by_id.keys() - imdb_by_id.keys()]
+
             self.progress.update(status_text=f"Comparing {dtype}")
-            
+
             results[dtype] = {
                 'to_trakt': to_trakt,
                 'to_imdb': to_imdb,
+                # Keep the id->item maps so downstream lookups reuse them
+                # instead of re-filtering the raw lists
+                'trakt_by_id': trakt_by_id,
+                'imdb_by_id': imdb_by_id,
                 'trakt_count': len(trakt_list),
                 'imdb_count': len(imdb_list),
                 'sync_to_trakt': len(to_trakt),
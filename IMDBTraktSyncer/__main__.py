@@ -1,4 +1,4 @@
-from .IMDBTraktSyncer import main
-
-if __name__ == "__main__":
+from .IMDBTraktSyncer import main
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
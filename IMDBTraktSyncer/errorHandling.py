@@ -1,794 +1,1145 @@
-import traceback
-import requests
-from requests.exceptions import ConnectionError, RequestException, Timeout, TooManyRedirects, SSLError, ProxyError
-import time
-import os
-import inspect
-import json
-import re
-from datetime import datetime, timedelta
-from selenium.common.exceptions import WebDriverException, TimeoutException
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from IMDBTraktSyncer import verifyCredentials as VC
-from IMDBTraktSyncer import errorLogger as EL
-
-class PageLoadException(Exception):
-    pass
-
-def report_error(error_message):
-    github_issue_url = "https://github.com/RileyXX/IMDB-Trakt-Syncer/issues/new?template=bug_report.yml"
-    traceback_info = traceback.format_exc()
-
-    print("\n--- ERROR ---")
-    print(error_message)
-    print("Please submit the error to GitHub with the following information:")
-    print("-" * 50)
-    print(traceback_info)
-    print("-" * 50)
-    print(f"Submit the error here: {github_issue_url}")
-    print("-" * 50)
-
-def make_trakt_request(url, headers=None, params=None, payload=None, max_retries=5):
-
-    # Set default headers if none are provided
-    if headers is None:
-        # Get credentials
-        trakt_client_id, _, trakt_access_token, _, _, _ = VC.prompt_get_credentials()
-        
-        headers = {
-            'Content-Type': 'application/json',
-            'trakt-api-version': '2',
-            'trakt-api-key': trakt_client_id,
-            'Authorization': f'Bearer {trakt_access_token}'
-        }
-    
-    retry_delay = 1  # Initial delay between retries (in seconds)
-    retry_attempts = 0  # Count of retry attempts made
-    connection_timeout = 20  # Timeout for requests (in seconds)
-    total_wait_time = sum(1 * (2 ** i) for i in range(max_retries))  # Total possible wait time
-
-    # Retry loop to handle network errors or server overload scenarios
-    while retry_attempts < max_retries:
-        response = None
-        try:
-            # Send GET or POST request depending on whether a payload is provided
-            if payload is None:
-                if params:
-                    # GET request with query parameters
-                    response = requests.get(url, headers=headers, params=params, timeout=connection_timeout)
-                else:
-                    # GET request without query parameters
-                    response = requests.get(url, headers=headers, timeout=connection_timeout)
-            else:
-                # POST request with JSON payload
-                response = requests.post(url, headers=headers, json=payload, timeout=connection_timeout)
-            
-            if response is not None:
-                # If request is successful, return the response
-                if response.status_code in [200, 201, 204]:
-                    return response
-                
-                # Handle retryable server errors and rate limit exceeded
-                elif response.status_code in [429, 500, 502, 503, 504, 520, 521, 522]:
-                    retry_attempts += 1  # Increment retry counter
-
-                    # Respect the 'Retry-After' header if provided, otherwise use default delay
-                    retry_after = int(response.headers.get('Retry-After', retry_delay))
-                    if response.status_code != 429:
-                        remaining_time = sum(1 * (2 ** i) for i in range(retry_attempts, max_retries))
-                        print(f" - Server returned {response.status_code}. Retrying after {retry_after}s... "
-                              f"({retry_attempts}/{max_retries}) - Time remaining: {remaining_time}s")
-                        EL.logger.warning(f"Server returned {response.status_code}. Retrying after {retry_after}s... "
-                                          f"({retry_attempts}/{max_retries}) - Time remaining: {remaining_time}s")
-
-                    time.sleep(retry_after)  # Wait before retrying
-                    retry_delay *= 2  # Apply exponential backoff for retries
-                
-                else:
-                    # Handle non-retryable HTTP status codes
-                    status_message = get_trakt_message(response.status_code)
-                    error_message = f"Request failed with status code {response.status_code}: {status_message}"
-                    print(f" - {error_message}")
-                    EL.logger.error(f"{error_message}. URL: {url}")
-                    return response  # Exit with failure for non-retryable errors
-            else:
-                # Failsafe in case response is still None for any unexpected reason
-                retry_attempts += 1
-                print(f" - No response received. Retrying... ({retry_attempts}/{max_retries})")
-                EL.logger.warning(f"No response received. Retrying... ({retry_attempts}/{max_retries})")
-                time.sleep(retry_delay)
-                retry_delay *= 2
-
-        # Handle Network errors (connection issues, timeouts, SSL, etc.)
-        except (ConnectionError, Timeout, TooManyRedirects, SSLError, ProxyError) as network_error:
-            retry_attempts += 1  # Increment retry counter
-            remaining_time = sum(1 * (2 ** i) for i in range(retry_attempts, max_retries))
-            print(f" - Network error: {network_error}. Retrying ({retry_attempts}/{max_retries})... "
-                  f"Time remaining: {remaining_time}s")
-            EL.logger.warning(f"Network error: {network_error}. Retrying ({retry_attempts}/{max_retries})... "
-                              f"Time remaining: {remaining_time}s")
-            
-            time.sleep(retry_delay)  # Wait before retrying
-            retry_delay *= 2  # Apply exponential backoff for retries
-
-        # Handle general request-related exceptions (non-retryable)
-        except requests.exceptions.RequestException as req_err:
-            error_message = f"Request failed with exception: {req_err}"
-            print(f" - {error_message}")
-            EL.logger.error(error_message, exc_info=True)
-            return None  # Exit on non-retryable exceptions
-
-    # If all retries are exhausted, log and return failure
-    error_message = "Max retry attempts reached with Trakt API, request failed."
-    print(f" - {error_message}")
-    EL.logger.error(error_message)
-    return None
-
-def get_trakt_message(status_code):
-    error_messages = {
-        200: "Success",
-        201: "Success - new resource created (POST)",
-        204: "Success - no content to return (DELETE)",
-        400: "Bad Request - request couldn't be parsed",
-        401: "Unauthorized - OAuth must be provided",
-        403: "Forbidden - invalid API key or unapproved app",
-        404: "Not Found - method exists, but no record found",
-        405: "Method Not Found - method doesn't exist",
-        409: "Conflict - resource already created",
-        412: "Precondition Failed - use application/json content type",
-        420: "Account Limit Exceeded - list count, item count, etc",
-        422: "Unprocessable Entity - validation errors",
-        423: "Locked User Account - have the user contact support",
-        426: "VIP Only - user must upgrade to VIP",
-        429: "Rate Limit Exceeded",
-        500: "Server Error - please open a support ticket",
-        502: "Service Unavailable - server overloaded (try again in 30s)",
-        503: "Service Unavailable - server overloaded (try again in 30s)",
-        504: "Service Unavailable - server overloaded (try again in 30s)",
-        520: "Service Unavailable - Cloudflare error",
-        521: "Service Unavailable - Cloudflare error",
-        522: "Service Unavailable - Cloudflare error"
-    }
-    return error_messages.get(status_code, "Unknown error")
-
-def get_page_with_retries(url, driver, wait, total_wait_time=180, initial_wait_time=5):
-    total_time_spent = 0  # Track total elapsed time
-    status_code = None
-
-    while total_time_spent < total_wait_time:
-        try:
-            start_time = time.time()  # Track time taken for each retry attempt
-            
-            # Temporary solution to Chromium bug: Restart tab logic. See: https://issues.chromium.org/issues/386887881
-            # Open a new tab and close any extras from previous iterations
-            driver.execute_script("window.open();")
-            new_tab = driver.window_handles[-1]
-            driver.switch_to.window(new_tab)
-
-            # Close all other tabs except the current new tab
-            for handle in driver.window_handles[:-1]:
-                driver.switch_to.window(handle)
-                driver.close()
-            driver.switch_to.window(new_tab)
-
-            # Attempt to load the page using Selenium driver
-            driver.get(url)
-
-            # Wait until the status code becomes available
-            wait.until(lambda driver: driver.execute_script(
-                "return window.performance.getEntries().length > 0 && window.performance.getEntries()[0].responseStatus !== undefined"
-            ))
-
-            # Get the HTTP status code of the page using JavaScript
-            status_code = driver.execute_script(
-                "return window.performance.getEntries()[0].responseStatus;"
-            )
-            
-            # Update resolved_url with the current URL after potential redirects
-            resolved_url = driver.current_url
-            
-            # Handle status codes
-            if status_code is None or status_code == 0:
-                print(f"   - Unable to determine page load status. Status code returned 0 or None. Retrying...")
-                elapsed_time = time.time() - start_time  # Time taken for this attempt
-                total_time_spent += elapsed_time
-
-                if total_time_spent >= total_wait_time:
-                    print("   - Total wait time exceeded. Aborting.")
-                    return False, None, url, driver, wait
-
-                remaining_time = total_wait_time - total_time_spent
-                print(f"   - Remaining time for retries: {int(remaining_time)} seconds.")
-                time.sleep(min(remaining_time, initial_wait_time))
-                continue
-                        
-            elif status_code in [408, 425, 429, 500, 502, 503, 504]:
-                raise PageLoadException(f"Retryable HTTP error encountered: {status_code}")
-            
-            elif status_code >= 400:
-                print(f"   - Non-retryable error encountered. Status code: {status_code} Aborting.")
-                return False, status_code, url, driver, wait
-
-            else:
-                # Page loaded successfully
-                return True, status_code, resolved_url, driver, wait
-
-        except TimeoutException as e:
-            frame = inspect.currentframe()
-            lineno = frame.f_lineno
-            filename = os.path.basename(inspect.getfile(frame))
-            print(f"   - TimeoutException: {str(e).splitlines()[0]} URL: {url} (File: {filename}, Line: {lineno})")
-
-            elapsed_time = time.time() - start_time
-            total_time_spent += elapsed_time
-
-            if total_time_spent >= total_wait_time:
-                print("   - Total wait time exceeded. Aborting after timeout.")
-                return False, None, url, driver, wait
-
-            remaining_time = total_wait_time - total_time_spent
-            print(f"   - Retrying... Time Remaining: {int(remaining_time)}s")
-            time.sleep(min(remaining_time, initial_wait_time))
-            continue
-
-        except WebDriverException as e:
-            frame = inspect.currentframe()
-            lineno = frame.f_lineno
-            filename = os.path.basename(inspect.getfile(frame))
-            print(f"   - Selenium WebDriver Error: {str(e).splitlines()[0]} URL: {url} (File: {filename}, Line: {lineno})")
-
-            retryable_errors = [
-                "net::ERR_NAME_NOT_RESOLVED",
-                "net::ERR_DNS_TIMED_OUT",
-                "net::ERR_DNS_PROBE_FINISHED_NXDOMAIN",
-                "net::ERR_CONNECTION_RESET",
-                "net::ERR_CONNECTION_CLOSED",
-                "net::ERR_CONNECTION_REFUSED",
-                "net::ERR_CONNECTION_TIMED_OUT",
-                "net::ERR_SSL_PROTOCOL_ERROR",
-                "net::ERR_CERT_COMMON_NAME_INVALID",
-                "net::ERR_CERT_DATE_INVALID",
-                "net::ERR_NETWORK_CHANGED"
-            ]
-
-            if any(error in str(e) for error in retryable_errors):
-                elapsed_time = time.time() - start_time
-                total_time_spent += elapsed_time
-
-                if total_time_spent >= total_wait_time:
-                    print("   - Total wait time exceeded. Aborting after WebDriver error.")
-                    return False, None, url, driver, wait
-
-                remaining_time = total_wait_time - total_time_spent
-                print(f"   - Retryable network error detected. Retrying... Time Remaining: {int(remaining_time)}s")
-                time.sleep(min(remaining_time, initial_wait_time))
-                continue
-
-            else:
-                print("   - Non-retryable WebDriver error encountered. Aborting.")
-                return False, None, url, driver, wait
-
-        except PageLoadException as e:
-            frame = inspect.currentframe()
-            lineno = frame.f_lineno
-            filename = os.path.basename(inspect.getfile(frame))
-            print(f"   - PageLoadException: {str(e).splitlines()[0]} URL: {url} (File: {filename}, Line: {lineno})")
-
-            elapsed_time = time.time() - start_time
-            total_time_spent += elapsed_time
-
-            if total_time_spent >= total_wait_time:
-                print("   - Total wait time exceeded. Aborting after page load exception.")
-                return False, None, url, driver, wait
-
-            remaining_time = total_wait_time - total_time_spent
-            print(f"   - Retryable error detected. Retrying... Time Remaining: {int(remaining_time)}s")
-            time.sleep(min(remaining_time, initial_wait_time))
-            continue
-
-    print("   - All retries failed. Unable to load page.")
-    return False, status_code, url, driver, wait
-    
-def make_request_with_retries(url, method="GET", headers=None, params=None, payload=None, max_retries=5, timeout=(30, 300), stream=False):
-    """
-    Make an HTTP request with retry logic for handling server and connection errors.
-
-    Args:
-        url (str): The URL to request.
-        method (str): HTTP method ("GET" or "POST"). Default is "GET".
-        headers (dict): Optional headers for the request.
-        params (dict): Optional query parameters for GET requests.
-        payload (dict): Optional JSON payload for POST requests.
-        max_retries (int): Maximum number of retries. Default is 5.
-        timeout (tuple): Tuple of (connect timeout, read timeout). Default is (30, 300).
-        stream (bool): Whether to stream the response. Default is False.
-
-    Returns:
-        requests.Response: The HTTP response object if successful.
-        None: If the request fails after retries.
-    """
-    retry_delay = 1  # Initial delay between retries (seconds)
-    retry_attempts = 0
-
-    while retry_attempts < max_retries:
-        try:
-            # Make the HTTP request based on the method
-            if method.upper() == "GET":
-                response = requests.get(url, headers=headers, params=params, timeout=timeout, stream=stream)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=headers, json=payload, timeout=timeout, stream=stream)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            # Check for successful response
-            if response.status_code in [200, 201, 204]:
-                return response
-
-            # Handle retryable HTTP status codes (rate limits or server errors)
-            if response.status_code in [429, 500, 502, 503, 504]:
-                retry_after = response.headers.get("Retry-After")
-
-                if retry_after:
-                    try:
-                        retry_after = int(retry_after)  # If it's a number, use it as seconds
-                    except ValueError:
-                        retry_after = retry_delay  # If it's not a number, default back to exponential delay
-                else:
-                    retry_after = retry_delay  # Default exponential backoff if no header is provided
-                
-                print(f"Server error {response.status_code}. Retrying in {retry_after} seconds...")
-                time.sleep(retry_after)  # Wait before retrying
-                
-                retry_delay *= 2  # Exponential backoff
-                retry_attempts += 1
-            else:
-                # Non-retryable errors
-                print(f"Request failed with status code {response.status_code}: {response.text}")
-                return None
-
-        except (ConnectionError, Timeout, TooManyRedirects, SSLError, ProxyError) as network_err:
-            # Handle network-related errors
-            retry_attempts += 1
-            print(f"Network error: {network_err}. Retrying in {retry_delay} seconds... (Attempt {retry_attempts}/{max_retries})")
-            time.sleep(retry_delay)  # Wait before retrying
-            retry_delay *= 2  # Exponential backoff
-
-        except RequestException as req_err:
-            # Handle non-retryable exceptions
-            print(f"Request exception: {req_err}. Exiting.")
-            return None
-
-    # If retries are exhausted, log the failure
-    print(f"Max retries reached. Request to {url} failed.")
-    return None
-    
-# Function to clean a title by removing non-alphanumeric characters
-def clean_title(title):
-    return re.sub(r'[^a-zA-Z0-9. ]', '', title).lower()
-    
-# Global cache for resolved IMDB IDs - persists across all update_outdated_imdb_ids_from_trakt calls
-_imdb_id_resolution_cache = {}
-
-# Function to resolve IMDB_ID redirection using lightweight HEAD request first, then driver fallback
-def resolve_imdb_id_fast(imdb_id, driver, wait):
-    """
-    Resolve IMDB ID redirects using a fast HEAD request first, with driver fallback.
-    Results are cached globally to avoid re-resolving the same ID.
-    """
-    global _imdb_id_resolution_cache
-    
-    # Check cache first
-    if imdb_id in _imdb_id_resolution_cache:
-        return _imdb_id_resolution_cache[imdb_id], driver, wait
-    
-    resolved_id = imdb_id  # Default to same if resolution fails
-    url = f"https://www.imdb.com/title/{imdb_id}/"
-    
-    try:
-        # Try lightweight HEAD request first (no page render, much faster)
-        try:
-            response = requests.head(url, allow_redirects=True, timeout=10,
-                                     headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36'})
-            if response.status_code == 200:
-                final_url = response.url
-                if '/title/' in final_url:
-                    resolved_id = final_url.split('/title/')[1].split('/')[0]
-        except (requests.RequestException, Exception):
-            # HEAD request failed, fall back to full driver page load
-            try:
-                success, status_code, resolved_url, driver, wait = get_page_with_retries(url, driver, wait, total_wait_time=30)
-                if success and '/title/' in resolved_url:
-                    resolved_id = resolved_url.split('/title/')[1].split('/')[0]
-            except Exception:
-                pass  # Keep original ID
-    except Exception:
-        pass  # Keep original ID
-    
-    # Cache the result
-    _imdb_id_resolution_cache[imdb_id] = resolved_id
-    return resolved_id, driver, wait
-
-# Function to resolve IMDB_ID redirection using the driver (legacy, kept for compatibility)
-def resolve_imdb_id_with_driver(imdb_id, driver, wait):
-    return resolve_imdb_id_fast(imdb_id, driver, wait)
-    
-# Function to resolve and update outdated IMDB_IDs from the trakt list based on matching Title and Type comparison
-def update_outdated_imdb_ids_from_trakt(trakt_list, imdb_list, driver, wait, list_name="items", show_progress=True):
-    """
-    Resolve conflicting IMDB IDs between Trakt and IMDB lists using fast HEAD requests.
-    
-    Args:
-        trakt_list: List of items from Trakt
-        imdb_list: List of items from IMDB
-        driver: Selenium webdriver instance
-        wait: Selenium WebDriverWait instance
-        list_name: Name of the list for progress display
-        show_progress: Whether to show progress updates
-    
-    Returns:
-        tuple: (updated_trakt_list, imdb_list, driver, wait)
-    """
-    comparison_keys = ['Title', 'Type', 'IMDB_ID']
-
-    # Group items by (Title, Type), cleaning the Title
-    trakt_grouped = {}
-    for item in trakt_list:
-        if all(key in item for key in comparison_keys):
-            cleaned_title = clean_title(item['Title'])
-            key = (cleaned_title, item['Type'])
-            trakt_grouped.setdefault(key, set()).add(item['IMDB_ID'])
-
-    imdb_grouped = {}
-    for item in imdb_list:
-        if all(key in item for key in comparison_keys):
-            cleaned_title = clean_title(item['Title'])
-            key = (cleaned_title, item['Type'])
-            imdb_grouped.setdefault(key, set()).add(item['IMDB_ID'])
-
-    # Find conflicting items based on Title and Type where IMDB_IDs are different
-    conflicting_items = {
-        key for key in trakt_grouped.keys() & imdb_grouped.keys()
-        if trakt_grouped[key] != imdb_grouped[key]
-    }
-    
-    # Collect all IDs that need resolution
-    ids_to_resolve = set()
-    for key in conflicting_items:
-        ids_to_resolve.update(trakt_grouped[key])
-    
-    total_conflicts = len(ids_to_resolve)
-    
-    if total_conflicts > 0 and show_progress:
-        print(f"      Resolving {total_conflicts} conflicting {list_name} IDs...", flush=True)
-    
-    # Resolve all conflicting IDs with progress tracking
-    resolved_count = 0
-    cache_hits = 0
-    
-    for key in conflicting_items:
-        trakt_ids = trakt_grouped[key]
-
-        for trakt_id in trakt_ids:
-            # Check if already cached (fast path)
-            was_cached = trakt_id in _imdb_id_resolution_cache
-            
-            resolved_id, driver, wait = resolve_imdb_id_fast(trakt_id, driver, wait)
-            
-            if was_cached:
-                cache_hits += 1
-            else:
-                resolved_count += 1
-                # Show progress every 5 resolutions
-                if show_progress and resolved_count % 5 == 0:
-                    print(f"\r      Resolved {resolved_count}/{total_conflicts} IDs (cache hits: {cache_hits})...", end='', flush=True)
-
-            # Update IMDB_ID in the original trakt_list
-            if resolved_id != trakt_id:
-                for item in trakt_list:
-                    if item.get('IMDB_ID') == trakt_id:
-                        item['IMDB_ID'] = resolved_id
-    
-    if total_conflicts > 0 and show_progress:
-        print(f"\r      ✓ Resolved {total_conflicts} {list_name} IDs (cache hits: {cache_hits})          ", flush=True)
-
-    return trakt_list, imdb_list, driver, wait
-
-def clear_imdb_id_cache():
-    """Clear the global IMDB ID resolution cache."""
-    global _imdb_id_resolution_cache
-    _imdb_id_resolution_cache = {}
-    
-# Function to filter out items that share the same Title, Year, and Type
-# AND have non-matching IMDB_ID values, using cleaned titles for comparison
-def filter_out_mismatched_items(trakt_list, IMDB_list):
-    # Define the keys to be used for comparison
-    comparison_keys = ['Title', 'Year', 'Type', 'IMDB_ID']
-
-    # Group items by (Title, Year, Type), cleaning the Title for comparison
-    trakt_grouped = {}
-    for item in trakt_list:
-        if all(key in item for key in comparison_keys):
-            cleaned_title = clean_title(item['Title'])  # Clean the Title for comparison
-            key = (cleaned_title, item['Year'], item['Type'])
-            trakt_grouped.setdefault(key, set()).add(item['IMDB_ID'])
-
-    IMDB_grouped = {}
-    for item in IMDB_list:
-        if all(key in item for key in comparison_keys):
-            cleaned_title = clean_title(item['Title'])  # Clean the Title for comparison
-            key = (cleaned_title, item['Year'], item['Type'])
-            IMDB_grouped.setdefault(key, set()).add(item['IMDB_ID'])
-
-    # Find conflicting items (same Title, Year, Type but different IMDB_IDs)
-    conflicting_items = {
-        key for key in trakt_grouped.keys() & IMDB_grouped.keys()  # Only consider shared keys
-        if trakt_grouped[key] != IMDB_grouped[key]  # Check if IMDB_IDs differ
-    }
-
-    # Filter out conflicting items from both lists
-    filtered_trakt_list = [
-        item for item in trakt_list if (clean_title(item['Title']), item['Year'], item['Type']) not in conflicting_items
-    ]
-    filtered_IMDB_list = [
-        item for item in IMDB_list if (clean_title(item['Title']), item['Year'], item['Type']) not in conflicting_items
-    ]
-
-    return filtered_trakt_list, filtered_IMDB_list
-    
-def filter_items(source_list, target_list, key="IMDB_ID"):
-    """
-    Filters items from the target_list that are not already present in the source_list based on a key.
-
-    Args:
-        source_list (list): The list whose elements are used to filter the target_list.
-        target_list (list): The list to be filtered.
-        key (str): The key to identify unique elements. Defaults to "IMDB_ID".
-
-    Returns:
-        list: A filtered list containing items from the target_list that are not in the source_list.
-    """
-    source_set = {item[key] for item in source_list}
-    return [item for item in target_list if item[key] not in source_set]
-    
-def remove_unknown_types(list_a, list_b):
-    """
-    Remove items with unknown or invalid 'Type' from two lists.
-    
-    Rules:
-    - Keep only items where Type is 'movie', 'show', or 'episode'.
-    - If one list has None/invalid type but the other has a valid type 
-      for the same IMDB_ID, assume the valid type applies to both.
-    
-    Args:
-        list_a (list): First list of dicts (e.g. trakt_reviews, imdb_reviews).
-        list_b (list): Second list of dicts (e.g. trakt_ratings, imdb_ratings).
-    
-    Returns:
-        tuple: (cleaned_list_a, cleaned_list_b)
-    """
-    valid_types = {"movie", "show", "episode"}
-
-    # Step 1: Build a map of IMDB_ID -> valid type (if found in either list)
-    type_map = {}
-    for item in list_a + list_b:
-        imdb_id = item.get("IMDB_ID")
-        itype = item.get("Type")
-        if imdb_id and itype in valid_types:
-            type_map[imdb_id] = itype
-
-    # Step 2: Filter & update lists
-    def filter_list_items(items):
-        filtered = []
-        for item in items:
-            imdb_id = item.get("IMDB_ID")
-            itype = item.get("Type")
-
-            if itype in valid_types:
-                filtered.append(item)
-            elif imdb_id in type_map:
-                # Fix missing/invalid type
-                item["Type"] = type_map[imdb_id]
-                filtered.append(item)
-            # else: drop
-        return filtered
-
-    return filter_list_items(list_a), filter_list_items(list_b)
-    
-def remove_combined_watchlist_to_remove_items_from_watchlist_to_set_lists_by_imdb_id(combined_watchlist_to_remove, imdb_watchlist_to_set, trakt_watchlist_to_set):
-    # Extract IMDB_IDs from the items to remove
-    imdb_ids_to_remove = {item['IMDB_ID'] for item in combined_watchlist_to_remove}
-
-    # Filter imdb_watchlist_to_set, keeping items not in imdb_ids_to_remove
-    imdb_watchlist_to_set = [
-        item for item in imdb_watchlist_to_set if item['IMDB_ID'] not in imdb_ids_to_remove
-    ]
-
-    # Filter trakt_watchlist_to_set, keeping items not in imdb_ids_to_remove
-    trakt_watchlist_to_set = [
-        item for item in trakt_watchlist_to_set if item['IMDB_ID'] not in imdb_ids_to_remove
-    ]
-
-    return imdb_watchlist_to_set, trakt_watchlist_to_set
-    
-# Function to remove duplicates based on IMDB_ID, keeping the older one based on Date_Added
-def remove_duplicates_by_imdb_id(watched_content):
-    seen = {}
-    for item in watched_content:
-        imdb_id = item['IMDB_ID']
-        date_added = item.get('Date_Added')
-
-        if date_added:
-            date_added = datetime.strptime(date_added, '%Y-%m-%dT%H:%M:%S.000Z')
-        
-        if imdb_id not in seen:
-            seen[imdb_id] = item
-        else:
-            existing_date = seen[imdb_id].get('Date_Added')
-            if existing_date:
-                existing_date = datetime.strptime(existing_date, '%Y-%m-%dT%H:%M:%S.000Z')
-                if date_added and date_added < existing_date:
-                    seen[imdb_id] = item
-            elif not date_added:
-                continue  # Keep the first one encountered when no Date_Added is available
-
-    return list(seen.values())
-    
-# Function to remove items with Type 'show'
-def remove_shows(watched_content):
-    filtered_content = []
-    for item in watched_content:
-        if item['Type'] != 'show':
-            filtered_content.append(item)
-    return filtered_content
-
-# Filter out setting review IMDB where the comment length is less than 600 characters
-def filter_by_comment_length(lst, min_comment_length=None):
-    result = []
-    for item in lst:
-        if min_comment_length is None or ('Comment' in item and len(item['Comment']) >= min_comment_length):
-            result.append(item)
-    return result
-    
-
-def sort_by_date_added(items, descending=False):
-    """
-    Sorts a list of items by the 'Date_Added' field.
-
-    Args:
-        items (list): A list of dictionaries or objects with a 'Date_Added' field.
-        descending (bool): Whether to sort in descending order. Defaults to False (ascending).
-
-    Returns:
-        list: A sorted list of items by the 'Date_Added' field.
-    """
-    def parse_date(item):
-        date_str = item.get('Date_Added')  # Safely get the Date_Added field
-        if date_str:
-            try:
-                return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S.%fZ")
-            except ValueError:
-                pass  # Invalid date format
-        return datetime.min  # Use the earliest date as a fallback
-
-    return sorted(items, key=parse_date, reverse=descending)
-    
-def get_items_older_than_x_days(items, days):
-    """
-    Returns items older than a specified number of days based on the 'Date_Added' field.
-
-    Args:
-        items (list): A list of dictionaries or objects with a 'Date_Added' field.
-        days (int): The number of days to use as the cutoff.
-
-    Returns:
-        list: A filtered list of items where 'Date_Added' is older than the specified number of days.
-    """
-    def is_older(item):
-        date_str = item.get('Date_Added')  # Safely get the Date_Added field
-        if date_str:
-            try:
-                date_added = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S.%fZ")
-                cutoff_date = datetime.utcnow() - timedelta(days=days)
-                return date_added < cutoff_date
-            except ValueError:
-                pass  # Invalid date format
-        return False  # Exclude items with invalid or missing dates
-
-    return [item for item in items if is_older(item)]
-    
-def check_if_watch_history_limit_reached(size):
-    """
-    Checks if the watch history has 10,000 or more items.
-    If true, updates the sync_watch_history in credentials.txt to False
-    and marks the watch history limit as reached.
-    
-    Args:
-        size (int): Size of the user's watch history.
-    
-    Returns:
-        bool: True if the watch history limit has been reached, False otherwise.
-    """
-    
-    '''
-    # Define the file path for credentials.txt
-    here = os.path.abspath(os.path.dirname(__file__))
-    file_path = os.path.join(here, 'credentials.txt')
-    
-    # Load the credentials file
-    credentials = {}
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            credentials = json.load(file)
-    except FileNotFoundError:
-        print("Credentials file not found. A new file will be created if needed.", exc_info=True)
-        return False  # Return False if the file doesn't exist
-    '''
-
-    # Check if list has 10,000 or more items
-    if size >= 9999:
-        '''
-        # Update sync_watch_history to False
-        credentials['sync_watch_history'] = False
-        '''
-        print("WARNING: IMDB watch history has reached the 10,000 limit. New watch history items will be not added to IMDB.")
-        return True  # Return True indicating limit reached and updated the credentials
-        
-        '''
-        # Mark that the watch history limit has been reached
-        try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(credentials, file, indent=4, separators=(', ', ': '))
-            print("IMDB watch history has reached the 10,000 item limit. sync_watch_history value set to False. Watch history will no longer be synced.")
-            return True  # Return True indicating limit reached and updated the credentials
-        except Exception as e:
-            print("Failed to write to credentials file.", exc_info=True)
-            return False  # Return False if there was an error while updating the file
-        '''
-
-    # Return False if the limit hasn't been reached
-    return False
-    
-def check_if_watchlist_limit_reached(size):
-    """
-    Checks if the watchlist is 10,000 or more items.
-    If true, updates the sync_watchlist in credentials.txt to False
-    and marks the watchlist limit as reached.
-    
-    Args:
-        size (int): Size of the user's watchlist.
-    
-    Returns:
-        bool: True if the watchlist limit has been reached, False otherwise.
-    """
-    # Define the file path for credentials.txt
-    here = os.path.abspath(os.path.dirname(__file__))
-    file_path = os.path.join(here, 'credentials.txt')
-    
-    # Load the credentials file
-    credentials = {}
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            credentials = json.load(file)
-    except FileNotFoundError:
-        print("Credentials file not found. A new file will be created if needed.", exc_info=True)
-        return False  # Return False if the file doesn't exist
-
-    # Check if list has 10,000 or more items
-    if size >= 9999:
-        # Update sync_watchlist to False
-        credentials['sync_watchlist'] = False
-        
-        # Mark that the watchlist limit has been reached
-        try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(credentials, file, indent=4, separators=(', ', ': '))
-            print("IMDB watchlist has reached the 10,000 item limit. sync_watchlist value set to False. Watchlist will no longer be synced.")
-            return True  # Return True indicating limit reached and updated the credentials
-        except Exception as e:
-            print("Failed to write to credentials file.", exc_info=True)
-            return False  # Return False if there was an error while updating the file
-
-    # Return False if the limit hasn't been reached
+import traceback
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.exceptions import ConnectionError, RequestException, Timeout, TooManyRedirects, SSLError, ProxyError
+import time
+import os
+import json
+import logging
+import random
+import re
+import hashlib
+import threading
+from email.utils import parsedate_to_datetime
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import functools
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from IMDBTraktSyncer import verifyCredentials as VC
+from IMDBTraktSyncer import errorLogger as EL
+
+class PageLoadException(Exception):
+    pass
+
+# Basename for exception-branch log lines, computed once: inspect-based frame
+# walking per exception is slow during driver error storms
+_THIS_FILE = os.path.basename(__file__)
+
+def _first_line(e):
+    """First line of an exception message, capped at 200 chars.
+
+    WebDriverException messages can run to kilobytes of embedded page source;
+    slicing up to the first newline avoids splitlines() materializing every
+    line just to take the first.
+    """
+    s = str(e)
+    i = s.find("\n")
+    if i >= 0:
+        s = s[:i]
+    return s[:200]
+
+# Network exceptions treated as retryable, shared by every except clause
+_NET_ERRORS = (ConnectionError, Timeout, TooManyRedirects, SSLError, ProxyError)
+
+@functools.lru_cache(maxsize=None)
+def _selenium_exceptions():
+    """Import the selenium exception types on first use.
+
+    Selenium parses dozens of submodules at import time; deferring it keeps
+    cold start cheap for callers that only hit the Trakt API and never touch
+    a driver.
+    """
+    from selenium.common.exceptions import WebDriverException, TimeoutException
+    return WebDriverException, TimeoutException
+
+# Use orjson for response decoding when it happens to be installed: it parses
+# large history/ratings pages several times faster than the stdlib decoder and
+# works zero-copy from bytes. Falls back to stdlib json transparently
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Shared pooled session for Trakt API calls. Reusing one session keeps TCP+TLS
+# connections alive (keep-alive) across the many paginated requests issued per run,
+# instead of paying a fresh handshake for every call. The pool is sized to hold a
+# warm connection for every worker of the concurrent review submission, so none
+# get discarded and re-handshaken under parallel load. Retries are handled by
+# make_trakt_request itself, so no urllib3 Retry is mounted here.
+_trakt_session = requests.Session()
+_trakt_session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+def close_session():
+    """Release the shared session's pooled connections on shutdown."""
+    _trakt_session.close()
+
+# Persistent disk cache for idempotent GET responses, keyed by URL+params and
+# validated with ETags. Repeated runs send If-None-Match and get a cheap
+# 304 Not Modified back instead of re-downloading unchanged lists.
+_http_cache_directory = os.path.join(os.path.abspath(os.path.dirname(__file__)), '.http_cache')
+
+class CachedResponse:
+    """Lightweight stand-in for requests.Response, served from the disk cache on a 304."""
+    def __init__(self, text, headers, status_code=200):
+        self.text = text
+        # Case-insensitive like requests' own headers, so lookups such as
+        # X-Pagination-Page-Count keep working whatever casing was cached
+        self.headers = CaseInsensitiveDict(headers)
+        self.status_code = status_code
+        self.from_cache = True
+        self._decoded = None
+
+    def json(self):
+        # Decode once and memoize: cache hits hand the same object to several
+        # callers, and each used to re-parse the full body
+        if self._decoded is None:
+            self._decoded = _json_loads(self.text)
+        return self._decoded
+
+def _http_cache_path(url, params):
+    key = url if not params else url + '?' + json.dumps(params, sort_keys=True)
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    return os.path.join(_http_cache_directory, f'{digest}.json')
+
+def _read_http_cache(url, params):
+    """Return the cached entry dict for a GET, or None when absent/unreadable."""
+    try:
+        with open(_http_cache_path(url, params), 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def _write_http_cache(url, params, response):
+    """Store a 200 GET response (body, headers, ETag validator) on disk."""
+    try:
+        os.makedirs(_http_cache_directory, exist_ok=True)
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'headers': dict(response.headers),
+            'text': response.text
+        }
+        with open(_http_cache_path(url, params), 'w', encoding='utf-8') as file:
+            json.dump(entry, file)
+    except OSError:
+        pass  # Cache writes are best-effort
+
+# In-process TTL+LRU cache for idempotent Trakt GETs. It sits in front of the
+# ETag disk cache above: a repeat lookup within its TTL skips even the 304
+# revalidation round trip and spends none of the rate-limit quota. Entries are
+# also kept past expiry so a request that exhausts all retries can fall back to
+# the last good body instead of returning None.
+_response_cache = OrderedDict()  # key -> (response, expires_at)
+_response_cache_lock = threading.Lock()
+_response_cache_max_entries = 256
+
+def _response_cache_ttl(url):
+    # /sync/ endpoints change as the run writes to them, so keep those short;
+    # search/lookup results are stable enough to hold for the whole run
+    return 60 if '/sync/' in url else 600
+
+def _response_cache_get(key, allow_stale=False):
+    """Return the cached response for key, or None when absent or expired."""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        response, expires_at = entry
+        if not allow_stale and time.monotonic() > expires_at:
+            return None
+        _response_cache.move_to_end(key)  # Refresh LRU position
+        return response
+
+def _response_cache_put(key, response, ttl):
+    """Store a successful GET response, evicting the oldest entries past the cap."""
+    with _response_cache_lock:
+        _response_cache[key] = (response, time.monotonic() + ttl)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _response_cache_max_entries:
+            _response_cache.popitem(last=False)
+
+class _TokenBucket:
+    """Client-side token bucket that paces Trakt calls below the published
+    rate limits, so sustained workloads stop paying the 429-and-retry round
+    trip. Thread-safe because batches are submitted from a worker pool."""
+    def __init__(self, refill_rate, capacity):
+        self.refill_rate = refill_rate  # Tokens added per second
+        self.capacity = capacity  # Burst allowance
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.refill_rate
+            time.sleep(wait)  # Sleep outside the lock so other workers can refill
+
+# Trakt's published limits are per method, not per path: authed GETs get
+# 1000 calls per 5 minutes, writes (POST/PUT/DELETE) 1 call per second.
+# Bursts are sized so short runs never wait; the reactive 429 handler stays
+# as the backstop for anything that still slips through
+_trakt_buckets = {
+    'GET': _TokenBucket(refill_rate=1000 / 300, capacity=100),
+    'POST': _TokenBucket(refill_rate=1, capacity=5),
+}
+
+def _parse_retry_after(value, fallback):
+    """Parse a Retry-After header in either delta-seconds or HTTP-date form.
+
+    Returns the advertised delay clamped to [0, 300] seconds, or fallback when
+    the header is missing or unparseable, so a malformed value never raises
+    out of the retry loop or stalls the sync with a pathological sleep.
+    """
+    if value is None:
+        return fallback
+    try:
+        seconds = int(value)
+    except (TypeError, ValueError):
+        try:
+            retry_date = parsedate_to_datetime(value)
+            seconds = (retry_date - datetime.now(retry_date.tzinfo)).total_seconds()
+        except (TypeError, ValueError):
+            return fallback
+    return min(max(seconds, 0), 300)
+
+def report_error(error_message):
+    github_issue_url = "https://github.com/RileyXX/IMDB-Trakt-Syncer/issues/new?template=bug_report.yml"
+    traceback_info = traceback.format_exc()
+
+    print("\n--- ERROR ---")
+    print(error_message)
+    print("Please submit the error to GitHub with the following information:")
+    print("-" * 50)
+    print(traceback_info)
+    print("-" * 50)
+    print(f"Submit the error here: {github_issue_url}")
+    print("-" * 50)
+
+def _do_request(method, url, headers=None, params=None, data=None, json_body=None,
+                timeout=20, stream=False, max_retries=5, retryable_statuses=None,
+                total_budget=None):
+    """Shared retry loop behind make_trakt_request and make_request_with_retries.
+
+    Sends the request on the pooled session and retries retryable statuses and
+    network errors with Retry-After aware exponential backoff. Returns the
+    final response whatever its status (callers decide how to report
+    non-retryable errors), or None when retries are exhausted or the request
+    raised a non-retryable exception.
+    """
+    retry_delay = 1  # Initial delay between retries (in seconds)
+    retry_attempts = 0  # Count of retry attempts made
+
+    # Hard wall-clock deadline alongside the attempt counter: without it, a
+    # few pathological Retry-After values could block one sync item for many
+    # minutes. The default budget allows the full local backoff plus one
+    # maximal (300s) server-directed wait
+    if total_budget is None:
+        total_budget = ((1 << max_retries) - 1) + 300
+    deadline = time.monotonic() + total_budget
+
+    # Retry loop to handle network errors or server overload scenarios
+    while retry_attempts < max_retries:
+        try:
+            # Pace Trakt calls proactively; downloads from other hosts are not throttled
+            if 'api.trakt.tv' in url:
+                bucket = _trakt_buckets.get(method)
+                if bucket is not None:
+                    bucket.acquire()
+            if method == 'GET':
+                response = _trakt_session.get(url, headers=headers, params=params, timeout=timeout, stream=stream)
+            elif method == 'POST':
+                response = _trakt_session.post(url, headers=headers, params=params, data=data, json=json_body,
+                                               timeout=timeout, stream=stream)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+
+            # Handle retryable server errors and rate limit exceeded
+            if response.status_code in retryable_statuses:
+                retry_attempts += 1  # Increment retry counter
+
+                # Respect the 'Retry-After' header if provided (seconds or HTTP-date
+                # form), plus a slice of jitter so parallel workers told the same
+                # wait do not all wake and re-hammer the server at once; without a
+                # header use AWS-style full jitter over the exponential window,
+                # which spreads retries across time instead of in lockstep bursts
+                if 'Retry-After' in response.headers:
+                    retry_after = max(retry_delay, _parse_retry_after(response.headers['Retry-After'], retry_delay))
+                    retry_after = round(retry_after + random.uniform(0, retry_delay), 1)
+                else:
+                    retry_after = round(random.uniform(0, retry_delay), 1)
+                # 429s are expected steady-state during bulk syncs, so skip their
+                # log lines entirely; gate the rest behind the level check so the
+                # remaining-time math and formatting cost nothing when filtered
+                if response.status_code != 429 and EL.logger.isEnabledFor(logging.WARNING):
+                    remaining_time = (1 << max_retries) - (1 << retry_attempts)  # Closed form of the remaining geometric backoff
+                    print(f" - Server returned {response.status_code}. Retrying after {retry_after}s... "
+                          f"({retry_attempts}/{max_retries}) - Time remaining: {remaining_time}s")
+                    EL.logger.warning("Server returned %s. Retrying after %ss... (%s/%s) - Time remaining: %ss",
+                                      response.status_code, retry_after, retry_attempts, max_retries, remaining_time)
+
+                # Clamp the wait to the remaining budget and give up promptly
+                # once the deadline is spent
+                retry_after = min(retry_after, deadline - time.monotonic())
+                if retry_after <= 0:
+                    break
+                time.sleep(retry_after)  # Wait before retrying
+                retry_delay = min(retry_delay * 2, 60)  # Exponential backoff, capped
+
+            else:
+                # Success and non-retryable statuses alike go back to the caller
+                return response
+
+        # Handle Network errors (connection issues, timeouts, SSL, etc.)
+        except _NET_ERRORS as network_error:
+            retry_attempts += 1  # Increment retry counter
+            remaining_time = (1 << max_retries) - (1 << retry_attempts)  # Closed form of the remaining geometric backoff
+            print(f" - Network error: {network_error}. Retrying ({retry_attempts}/{max_retries})... "
+                  f"Time remaining: {remaining_time}s")
+            EL.logger.warning(f"Network error: {network_error}. Retrying ({retry_attempts}/{max_retries})... "
+                              f"Time remaining: {remaining_time}s")
+
+            sleep_for = min(random.uniform(0, retry_delay), deadline - time.monotonic())
+            if sleep_for <= 0:
+                break  # Deadline spent, give up promptly
+            time.sleep(sleep_for)  # Full jitter spreads parallel retries in time
+            retry_delay = min(retry_delay * 2, 60)  # Exponential backoff, capped
+
+        # Handle general request-related exceptions (non-retryable)
+        except requests.exceptions.RequestException as req_err:
+            error_message = f"Request failed with exception: {req_err}"
+            print(f" - {error_message}")
+            EL.logger.error(error_message, exc_info=True)
+            return None  # Exit on non-retryable exceptions
+
+    # If all retries or the time budget are exhausted, log and return failure
+    error_message = f"Retry budget exhausted. Request to {url} failed."
+    print(f" - {error_message}")
+    EL.logger.error(error_message)
+    return None
+
+def make_trakt_request(url, headers=None, params=None, payload=None, max_retries=5):
+
+    # Set default headers if none are provided
+    if headers is None:
+        # Get credentials
+        trakt_client_id, _, trakt_access_token, _, _, _ = VC.prompt_get_credentials()
+        
+        headers = {
+            'Content-Type': 'application/json',
+            'trakt-api-version': '2',
+            'trakt-api-key': trakt_client_id,
+            'Authorization': f'Bearer {trakt_access_token}'
+        }
+
+    cache_key = None
+    cached_entry = None
+    request_headers = headers
+    payload_bytes = None
+    if payload is None:
+        # GETs are cacheable in-process; identical lookups within the TTL are
+        # answered from memory without touching the network at all
+        cache_key = (url, tuple(sorted((params or {}).items())))
+        cached_response = _response_cache_get(cache_key)
+        if cached_response is not None:
+            return cached_response
+        # Attach the cached ETag validator when we have one so the server can
+        # answer 304 Not Modified instead of resending the full body
+        cached_entry = _read_http_cache(url, params)
+        if cached_entry and cached_entry.get('etag'):
+            request_headers = dict(headers)
+            request_headers['If-None-Match'] = cached_entry['etag']
+    else:
+        # Serialize POST payloads once so a batch that gets retried after a
+        # 429/5xx does not pay json.dumps again; compact separators also trim
+        # the bytes on the wire. Content-Type is already application/json in
+        # the default headers above
+        payload_bytes = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+    response = _do_request('GET' if payload is None else 'POST', url, headers=request_headers,
+                           params=params, data=payload_bytes, timeout=20, max_retries=max_retries,
+                           retryable_statuses=_RETRYABLE_TRAKT_CODES)
+
+    if response is None:
+        # Retries exhausted (or the request raised): prefer serving a stale
+        # cached body over returning nothing, since an out-of-date list still
+        # lets the sync make progress
+        if cache_key is not None:
+            stale_response = _response_cache_get(cache_key, allow_stale=True)
+            if stale_response is not None:
+                print(" - Serving last cached response instead.")
+                EL.logger.warning(f"Serving last cached response instead. URL: {url}")
+                return stale_response
+        return None
+
+    # Nothing changed server-side, serve the cached body
+    if response.status_code == 304 and cached_entry is not None:
+        cached_response = CachedResponse(cached_entry['text'], cached_entry.get('headers', {}))
+        _response_cache_put(cache_key, cached_response, _response_cache_ttl(url))
+        return cached_response
+
+    # If request is successful, return the response
+    if response.status_code in [200, 201, 204]:
+        if payload is None and response.status_code == 200:
+            _response_cache_put(cache_key, response, _response_cache_ttl(url))
+            if response.headers.get('ETag'):
+                _write_http_cache(url, params, response)
+        # Proactive pacing from the server's own rate-limit headers:
+        # when the remaining quota runs low, yield a second here so
+        # the next call does not trip a 429 and its full Retry-After
+        try:
+            if int(response.headers.get('X-RateLimit-Remaining', 999)) < 5:
+                time.sleep(1)
+        except (TypeError, ValueError):
+            pass
+        return response
+
+    # Handle non-retryable HTTP status codes
+    status_message = get_trakt_message(response.status_code)
+    error_message = f"Request failed with status code {response.status_code}: {status_message}"
+    print(f" - {error_message}")
+    EL.logger.error(f"{error_message}. URL: {url}")
+    return response  # Exit with failure for non-retryable errors
+
+# Status-code tables built once at module load instead of per call: the error
+# path looks these up while logging, so keep it to a plain dict .get()
+_TRAKT_STATUS_MESSAGES = {
+    200: "Success",
+    201: "Success - new resource created (POST)",
+    204: "Success - no content to return (DELETE)",
+    400: "Bad Request - request couldn't be parsed",
+    401: "Unauthorized - OAuth must be provided",
+    403: "Forbidden - invalid API key or unapproved app",
+    404: "Not Found - method exists, but no record found",
+    405: "Method Not Found - method doesn't exist",
+    409: "Conflict - resource already created",
+    412: "Precondition Failed - use application/json content type",
+    420: "Account Limit Exceeded - list count, item count, etc",
+    422: "Unprocessable Entity - validation errors",
+    423: "Locked User Account - have the user contact support",
+    426: "VIP Only - user must upgrade to VIP",
+    429: "Rate Limit Exceeded",
+    500: "Server Error - please open a support ticket",
+    502: "Service Unavailable - server overloaded (try again in 30s)",
+    503: "Service Unavailable - server overloaded (try again in 30s)",
+    504: "Service Unavailable - server overloaded (try again in 30s)",
+    520: "Service Unavailable - Cloudflare error",
+    521: "Service Unavailable - Cloudflare error",
+    522: "Service Unavailable - Cloudflare error"
+}
+
+# Retryable server errors and rate limiting, as a frozenset for O(1) membership tests
+_RETRYABLE_TRAKT_CODES = frozenset({429, 500, 502, 503, 504, 520, 521, 522})
+
+# Narrower retryable set for plain downloads (no Cloudflare-fronted Trakt codes)
+_RETRYABLE_DOWNLOAD_CODES = frozenset({429, 500, 502, 503, 504})
+
+def get_trakt_message(status_code):
+    return _TRAKT_STATUS_MESSAGES.get(status_code, "Unknown error")
+
+# Chromium network errors worth retrying in get_page_with_retries, built once
+# at module load instead of per exception
+_RETRYABLE_NET_ERRORS = (
+    "net::ERR_NAME_NOT_RESOLVED",
+    "net::ERR_DNS_TIMED_OUT",
+    "net::ERR_DNS_PROBE_FINISHED_NXDOMAIN",
+    "net::ERR_CONNECTION_RESET",
+    "net::ERR_CONNECTION_CLOSED",
+    "net::ERR_CONNECTION_REFUSED",
+    "net::ERR_CONNECTION_TIMED_OUT",
+    "net::ERR_SSL_PROTOCOL_ERROR",
+    "net::ERR_CERT_COMMON_NAME_INVALID",
+    "net::ERR_CERT_DATE_INVALID",
+    "net::ERR_NETWORK_CHANGED"
+)
+
+# HTTP status codes worth retrying when loading pages through the driver
+_RETRYABLE_PAGE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Single-round-trip status probe for wait.until: returns the navigation
+# entry's status code directly (0 mapped to -1 so the wait does not mistake
+# it for "not ready yet"), or null while the entry is still pending
+_STATUS_JS = (
+    "var entries = window.performance.getEntries();"
+    "if (entries.length === 0 || entries[0].responseStatus === undefined) { return null; }"
+    "return entries[0].responseStatus || -1;"
+)
+
+def get_page_with_retries(url, driver, wait, total_wait_time=180, initial_wait_time=5):
+    WebDriverException, TimeoutException = _selenium_exceptions()
+    total_time_spent = 0  # Track total elapsed time
+    status_code = None
+
+    while total_time_spent < total_wait_time:
+        try:
+            start_time = time.monotonic()  # Monotonic so NTP steps or suspend cannot skew the retry budget
+            
+            # Temporary solution to Chromium bug: Restart tab logic. See: https://issues.chromium.org/issues/386887881
+            # Open a new tab and close any extras from previous iterations
+            driver.execute_script("window.open();")
+            new_tab = driver.window_handles[-1]
+            stale_tabs = driver.window_handles[:-1]
+
+            # Close stale tabs over CDP without switching into each one first:
+            # every switch_to is a WebDriver round-trip, so the old
+            # switch-and-close loop grew quadratically as tabs accumulated.
+            # Chromedriver window handles are the CDP target ids behind a
+            # "CDwindow-" prefix
+            try:
+                for handle in stale_tabs:
+                    driver.execute_cdp_cmd("Target.closeTarget", {"targetId": handle.replace("CDwindow-", "", 1)})
+            except (AttributeError, WebDriverException):
+                # Fall back to switch-and-close for drivers without CDP support
+                for handle in stale_tabs:
+                    driver.switch_to.window(handle)
+                    driver.close()
+            driver.switch_to.window(new_tab)
+
+            # Attempt to load the page using Selenium driver
+            driver.get(url)
+
+            # Wait for the navigation entry's status code in a single scripted
+            # poll per tick, instead of polling for readiness and then fetching
+            # the code with a second execute_script round-trip
+            status_code = wait.until(lambda driver: driver.execute_script(_STATUS_JS))
+            if status_code == -1:
+                status_code = 0
+            
+            # Update resolved_url with the current URL after potential redirects
+            resolved_url = driver.current_url
+            
+            # Handle status codes
+            if status_code is None or status_code == 0:
+                print(f"   - Unable to determine page load status. Status code returned 0 or None. Retrying...")
+                elapsed_time = time.monotonic() - start_time  # Time taken for this attempt
+                total_time_spent += elapsed_time
+
+                if total_time_spent >= total_wait_time:
+                    print("   - Total wait time exceeded. Aborting.")
+                    return False, None, url, driver, wait
+
+                remaining_time = total_wait_time - total_time_spent
+                print(f"   - Remaining time for retries: {int(remaining_time)} seconds.")
+                time.sleep(min(remaining_time, initial_wait_time))
+                continue
+                        
+            elif status_code in _RETRYABLE_PAGE_STATUS:
+                raise PageLoadException(f"Retryable HTTP error encountered: {status_code}")
+            
+            elif status_code >= 400:
+                print(f"   - Non-retryable error encountered. Status code: {status_code} Aborting.")
+                return False, status_code, url, driver, wait
+
+            else:
+                # Page loaded successfully
+                return True, status_code, resolved_url, driver, wait
+
+        except TimeoutException as e:
+            filename = _THIS_FILE
+            lineno = sys.exc_info()[2].tb_lineno
+            print(f"   - TimeoutException: {_first_line(e)} URL: {url} (File: {filename}, Line: {lineno})")
+
+            elapsed_time = time.monotonic() - start_time
+            total_time_spent += elapsed_time
+
+            if total_time_spent >= total_wait_time:
+                print("   - Total wait time exceeded. Aborting after timeout.")
+                return False, None, url, driver, wait
+
+            remaining_time = total_wait_time - total_time_spent
+            print(f"   - Retrying... Time Remaining: {int(remaining_time)}s")
+            time.sleep(min(remaining_time, initial_wait_time))
+            continue
+
+        except WebDriverException as e:
+            filename = _THIS_FILE
+            lineno = sys.exc_info()[2].tb_lineno
+            print(f"   - Selenium WebDriver Error: {_first_line(e)} URL: {url} (File: {filename}, Line: {lineno})")
+
+            # Stringify the exception once and scan it against the shared table
+            error_text = str(e)
+            if any(error in error_text for error in _RETRYABLE_NET_ERRORS):
+                elapsed_time = time.monotonic() - start_time
+                total_time_spent += elapsed_time
+
+                if total_time_spent >= total_wait_time:
+                    print("   - Total wait time exceeded. Aborting after WebDriver error.")
+                    return False, None, url, driver, wait
+
+                remaining_time = total_wait_time - total_time_spent
+                print(f"   - Retryable network error detected. Retrying... Time Remaining: {int(remaining_time)}s")
+                time.sleep(min(remaining_time, initial_wait_time))
+                continue
+
+            else:
+                print("   - Non-retryable WebDriver error encountered. Aborting.")
+                return False, None, url, driver, wait
+
+        except PageLoadException as e:
+            filename = _THIS_FILE
+            lineno = sys.exc_info()[2].tb_lineno
+            print(f"   - PageLoadException: {_first_line(e)} URL: {url} (File: {filename}, Line: {lineno})")
+
+            elapsed_time = time.monotonic() - start_time
+            total_time_spent += elapsed_time
+
+            if total_time_spent >= total_wait_time:
+                print("   - Total wait time exceeded. Aborting after page load exception.")
+                return False, None, url, driver, wait
+
+            remaining_time = total_wait_time - total_time_spent
+            print(f"   - Retryable error detected. Retrying... Time Remaining: {int(remaining_time)}s")
+            time.sleep(min(remaining_time, initial_wait_time))
+            continue
+
+    print("   - All retries failed. Unable to load page.")
+    return False, status_code, url, driver, wait
+    
+def make_request_with_retries(url, method="GET", headers=None, params=None, payload=None, max_retries=5, timeout=(30, 300), stream=False, total_budget=None):
+    """
+    Make an HTTP request with retry logic for handling server and connection errors.
+
+    Args:
+        url (str): The URL to request.
+        method (str): HTTP method ("GET" or "POST"). Default is "GET".
+        headers (dict): Optional headers for the request.
+        params (dict): Optional query parameters for GET requests.
+        payload (dict): Optional JSON payload for POST requests.
+        max_retries (int): Maximum number of retries. Default is 5.
+        timeout (tuple): Tuple of (connect timeout, read timeout). Default is (30, 300).
+        stream (bool): Whether to stream the response. Default is False.
+        total_budget (float): Optional wall-clock cap in seconds across all retries.
+
+    Returns:
+        requests.Response: The HTTP response object if successful.
+        None: If the request fails after retries.
+    """
+    # Delegate the retry loop to the shared core; this wrapper only decides
+    # the retryable set and how to report non-retryable statuses
+    response = _do_request(method.upper(), url, headers=headers, params=params, json_body=payload,
+                           timeout=timeout, stream=stream, max_retries=max_retries,
+                           retryable_statuses=_RETRYABLE_DOWNLOAD_CODES, total_budget=total_budget)
+    if response is None:
+        return None
+
+    # Check for successful response
+    if response.status_code in [200, 201, 204]:
+        return response
+
+    # Non-retryable errors
+    print(f"Request failed with status code {response.status_code}: {response.text}")
+    return None
+    
+# Function to clean a title by removing non-alphanumeric characters
+def clean_title(title):
+    return re.sub(r'[^a-zA-Z0-9. ]', '', title).lower()
+    
+# Global cache for resolved IMDB IDs - persists across all update_outdated_imdb_ids_from_trakt calls
+_imdb_id_resolution_cache = {}
+
+# Function to resolve IMDB_ID redirection using lightweight HEAD request first, then driver fallback
+def resolve_imdb_id_fast(imdb_id, driver, wait):
+    """
+    Resolve IMDB ID redirects using a fast HEAD request first, with driver fallback.
+    Results are cached globally to avoid re-resolving the same ID.
+    """
+    global _imdb_id_resolution_cache
+    
+    # Check cache first
+    if imdb_id in _imdb_id_resolution_cache:
+        return _imdb_id_resolution_cache[imdb_id], driver, wait
+    
+    resolved_id = imdb_id  # Default to same if resolution fails
+    url = f"https://www.imdb.com/title/{imdb_id}/"
+    
+    try:
+        # Try lightweight HEAD request first (no page render, much faster)
+        try:
+            response = requests.head(url, allow_redirects=True, timeout=10,
+                                     headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36'})
+            if response.status_code == 200:
+                final_url = response.url
+                if '/title/' in final_url:
+                    resolved_id = final_url.split('/title/')[1].split('/')[0]
+        except (requests.RequestException, Exception):
+            # HEAD request failed, fall back to full driver page load
+            try:
+                success, status_code, resolved_url, driver, wait = get_page_with_retries(url, driver, wait, total_wait_time=30)
+                if success and '/title/' in resolved_url:
+                    resolved_id = resolved_url.split('/title/')[1].split('/')[0]
+            except Exception:
+                pass  # Keep original ID
+    except Exception:
+        pass  # Keep original ID
+    
+    # Cache the result
+    _imdb_id_resolution_cache[imdb_id] = resolved_id
+    return resolved_id, driver, wait
+
+# Function to resolve IMDB_ID redirection using the driver (legacy, kept for compatibility)
+def resolve_imdb_id_with_driver(imdb_id, driver, wait):
+    return resolve_imdb_id_fast(imdb_id, driver, wait)
+    
+# Function to resolve and update outdated IMDB_IDs from the trakt list based on matching Title and Type comparison
+def update_outdated_imdb_ids_from_trakt(trakt_list, imdb_list, driver, wait, list_name="items", show_progress=True):
+    """
+    Resolve conflicting IMDB IDs between Trakt and IMDB lists using fast HEAD requests.
+    
+    Args:
+        trakt_list: List of items from Trakt
+        imdb_list: List of items from IMDB
+        driver: Selenium webdriver instance
+        wait: Selenium WebDriverWait instance
+        list_name: Name of the list for progress display
+        show_progress: Whether to show progress updates
+    
+    Returns:
+        tuple: (updated_trakt_list, imdb_list, driver, wait)
+    """
+    comparison_keys = ['Title', 'Type', 'IMDB_ID']
+
+    # Group items by (Title, Type), cleaning the Title
+    trakt_grouped = {}
+    for item in trakt_list:
+        if all(key in item for key in comparison_keys):
+            cleaned_title = clean_title(item['Title'])
+            key = (cleaned_title, item['Type'])
+            trakt_grouped.setdefault(key, set()).add(item['IMDB_ID'])
+
+    imdb_grouped = {}
+    for item in imdb_list:
+        if all(key in item for key in comparison_keys):
+            cleaned_title = clean_title(item['Title'])
+            key = (cleaned_title, item['Type'])
+            imdb_grouped.setdefault(key, set()).add(item['IMDB_ID'])
+
+    # Find conflicting items based on Title and Type where IMDB_IDs are different
+    conflicting_items = {
+        key for key in trakt_grouped.keys() & imdb_grouped.keys()
+        if trakt_grouped[key] != imdb_grouped[key]
+    }
+    
+    # Collect all IDs that need resolution
+    ids_to_resolve = set()
+    for key in conflicting_items:
+        ids_to_resolve.update(trakt_grouped[key])
+    
+    total_conflicts = len(ids_to_resolve)
+    
+    if total_conflicts > 0 and show_progress:
+        print(f"      Resolving {total_conflicts} conflicting {list_name} IDs...", flush=True)
+    
+    # Resolve all conflicting IDs with progress tracking
+    resolved_count = 0
+    cache_hits = 0
+    
+    for key in conflicting_items:
+        trakt_ids = trakt_grouped[key]
+
+        for trakt_id in trakt_ids:
+            # Check if already cached (fast path)
+            was_cached = trakt_id in _imdb_id_resolution_cache
+            
+            resolved_id, driver, wait = resolve_imdb_id_fast(trakt_id, driver, wait)
+            
+            if was_cached:
+                cache_hits += 1
+            else:
+                resolved_count += 1
+                # Show progress every 5 resolutions
+                if show_progress and resolved_count % 5 == 0:
+                    print(f"\r      Resolved {resolved_count}/{total_conflicts} IDs (cache hits: {cache_hits})...", end='', flush=True)
+
+            # Update IMDB_ID in the original trakt_list
+            if resolved_id != trakt_id:
+                for item in trakt_list:
+                    if item.get('IMDB_ID') == trakt_id:
+                        item['IMDB_ID'] = resolved_id
+    
+    if total_conflicts > 0 and show_progress:
+        print(f"\r      ✓ Resolved {total_conflicts} {list_name} IDs (cache hits: {cache_hits})          ", flush=True)
+
+    return trakt_list, imdb_list, driver, wait
+
+def clear_imdb_id_cache():
+    """Clear the global IMDB ID resolution cache."""
+    global _imdb_id_resolution_cache
+    _imdb_id_resolution_cache = {}
+
+# Function to fetch the IMDB IDs currently in the user's watchlist with one page load
+def _extract_watchlist_ids(payload):
+    """Collect tconsts from the list-item edges of a watchlist __NEXT_DATA__ payload.
+
+    Only ids reached through titleListItemSearch edges are taken: the payload
+    also embeds recommendation strips and promoted titles, and harvesting those
+    would make callers treat titles as already-in-watchlist and skip adding
+    them on every run.
+    """
+    ids = set()
+
+    def walk(node):
+        if isinstance(node, dict):
+            search = node.get('titleListItemSearch')
+            if isinstance(search, dict):
+                for edge in search.get('edges') or []:
+                    item = edge.get('listItem') if isinstance(edge, dict) else None
+                    item_id = item.get('id') if isinstance(item, dict) else None
+                    if isinstance(item_id, str) and re.fullmatch(r'tt\d{7,}', item_id):
+                        ids.add(item_id)
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    walk(payload)
+    return ids
+
+def get_imdb_watchlist_ids(driver, wait):
+    """
+    Fetch the set of IMDB IDs currently in the user's watchlist using a single
+    page load. Returns (ids, driver, wait); ids is an empty set when the page
+    cannot be read, so callers fall back to their per-item checks.
+    """
+    ids = set()
+    try:
+        success, status_code, url, driver, wait = get_page_with_retries('https://www.imdb.com/list/watchlist', driver, wait, total_wait_time=30)
+        if success:
+            # The embedded page data (__NEXT_DATA__) carries the delivered list
+            # items; parse it and take tconsts from the list-item edges only
+            raw = driver.execute_script(
+                "var d = document.getElementById('__NEXT_DATA__'); return d ? d.textContent : null;"
+            )
+            if raw:
+                try:
+                    ids = _extract_watchlist_ids(json.loads(raw))
+                except ValueError:
+                    ids = set()
+            if not ids:
+                # Fallback: scan anchors inside the list rows only, so tconsts
+                # from recommendation strips and footer links are not harvested.
+                # An empty result leaves ids empty and callers fall back to
+                # their per-item checks
+                hrefs = driver.execute_script(
+                    "return Array.from(document.querySelectorAll("
+                    "'li.ipc-metadata-list-summary-item a[href*=\"/title/tt\"]'"
+                    ")).map(function(a) { return a.href; }).join(' ');"
+                )
+                if hrefs:
+                    ids = set(re.findall(r'tt\d{7,}', hrefs))
+    except Exception as e:
+        EL.logger.warning(f"Could not fetch IMDB watchlist IDs up front: {e}")
+    return ids, driver, wait
+
+
+# Function to filter out items that share the same Title, Year, and Type
+# AND have non-matching IMDB_ID values, using cleaned titles for comparison
+def filter_out_mismatched_items(trakt_list, IMDB_list):
+    # Define the keys to be used for comparison
+    comparison_keys = ['Title', 'Year', 'Type', 'IMDB_ID']
+
+    # Group items by (Title, Year, Type), cleaning the Title for comparison
+    trakt_grouped = {}
+    for item in trakt_list:
+        if all(key in item for key in comparison_keys):
+            cleaned_title = clean_title(item['Title'])  # Clean the Title for comparison
+            key = (cleaned_title, item['Year'], item['Type'])
+            trakt_grouped.setdefault(key, set()).add(item['IMDB_ID'])
+
+    IMDB_grouped = {}
+    for item in IMDB_list:
+        if all(key in item for key in comparison_keys):
+            cleaned_title = clean_title(item['Title'])  # Clean the Title for comparison
+            key = (cleaned_title, item['Year'], item['Type'])
+            IMDB_grouped.setdefault(key, set()).add(item['IMDB_ID'])
+
+    # Find conflicting items (same Title, Year, Type but different IMDB_IDs)
+    conflicting_items = {
+        key for key in trakt_grouped.keys() & IMDB_grouped.keys()  # Only consider shared keys
+        if trakt_grouped[key] != IMDB_grouped[key]  # Check if IMDB_IDs differ
+    }
+
+    # Filter out conflicting items from both lists
+    filtered_trakt_list = [
+        item for item in trakt_list if (clean_title(item['Title']), item['Year'], item['Type']) not in conflicting_items
+    ]
+    filtered_IMDB_list = [
+        item for item in IMDB_list if (clean_title(item['Title']), item['Year'], item['Type']) not in conflicting_items
+    ]
+
+    return filtered_trakt_list, filtered_IMDB_list
+    
+def filter_items(source_list, target_list, key="IMDB_ID"):
+    """
+    Filters items from the target_list that are not already present in the source_list based on a key.
+
+    Args:
+        source_list (list): The list whose elements are used to filter the target_list.
+        target_list (list): The list to be filtered.
+        key (str): The key to identify unique elements. Defaults to "IMDB_ID".
+
+    Returns:
+        list: A filtered list containing items from the target_list that are not in the source_list.
+    """
+    return filter_items_by_ids(target_list, {item[key] for item in source_list}, key=key)
+
+def filter_items_by_ids(target_list, source_ids, key="IMDB_ID"):
+    """
+    Same as filter_items, but takes a prebuilt set of source ids so callers filtering
+    several list pairs can hash each list once instead of once per call.
+
+    Args:
+        target_list (list): The list to be filtered.
+        source_ids (set): The key values used to filter the target_list.
+        key (str): The key to identify unique elements. Defaults to "IMDB_ID".
+
+    Returns:
+        list: A filtered list containing items from the target_list that are not in source_ids.
+    """
+    return [item for item in target_list if item[key] not in source_ids]
+    
+def remove_unknown_types(list_a, list_b):
+    """
+    Remove items with unknown or invalid 'Type' from two lists.
+    
+    Rules:
+    - Keep only items where Type is 'movie', 'show', or 'episode'.
+    - If one list has None/invalid type but the other has a valid type 
+      for the same IMDB_ID, assume the valid type applies to both.
+    
+    Args:
+        list_a (list): First list of dicts (e.g. trakt_reviews, imdb_reviews).
+        list_b (list): Second list of dicts (e.g. trakt_ratings, imdb_ratings).
+    
+    Returns:
+        tuple: (cleaned_list_a, cleaned_list_b)
+    """
+    valid_types = {"movie", "show", "episode"}
+
+    # Step 1: Build a map of IMDB_ID -> valid type (if found in either list)
+    type_map = {}
+    for item in list_a + list_b:
+        imdb_id = item.get("IMDB_ID")
+        itype = item.get("Type")
+        if imdb_id and itype in valid_types:
+            type_map[imdb_id] = itype
+
+    # Step 2: Filter & update lists
+    def filter_list_items(items):
+        filtered = []
+        for item in items:
+            imdb_id = item.get("IMDB_ID")
+            itype = item.get("Type")
+
+            if itype in valid_types:
+                filtered.append(item)
+            elif imdb_id in type_map:
+                # Fix missing/invalid type
+                item["Type"] = type_map[imdb_id]
+                filtered.append(item)
+            # else: drop
+        return filtered
+
+    return filter_list_items(list_a), filter_list_items(list_b)
+    
+def remove_combined_watchlist_to_remove_items_from_watchlist_to_set_lists_by_imdb_id(combined_watchlist_to_remove, imdb_watchlist_to_set, trakt_watchlist_to_set):
+    # Extract IMDB_IDs from the items to remove
+    imdb_ids_to_remove = {item['IMDB_ID'] for item in combined_watchlist_to_remove}
+
+    # Filter imdb_watchlist_to_set, keeping items not in imdb_ids_to_remove
+    imdb_watchlist_to_set = [
+        item for item in imdb_watchlist_to_set if item['IMDB_ID'] not in imdb_ids_to_remove
+    ]
+
+    # Filter trakt_watchlist_to_set, keeping items not in imdb_ids_to_remove
+    trakt_watchlist_to_set = [
+        item for item in trakt_watchlist_to_set if item['IMDB_ID'] not in imdb_ids_to_remove
+    ]
+
+    return imdb_watchlist_to_set, trakt_watchlist_to_set
+    
+# Function to remove duplicates based on IMDB_ID, keeping the older one based on Date_Added
+def remove_duplicates_by_imdb_id(watched_content):
+    seen = {}
+    for item in watched_content:
+        imdb_id = item['IMDB_ID']
+        date_added = item.get('Date_Added')
+
+        if date_added:
+            date_added = datetime.strptime(date_added, '%Y-%m-%dT%H:%M:%S.000Z')
+        
+        if imdb_id not in seen:
+            seen[imdb_id] = item
+        else:
+            existing_date = seen[imdb_id].get('Date_Added')
+            if existing_date:
+                existing_date = datetime.strptime(existing_date, '%Y-%m-%dT%H:%M:%S.000Z')
+                if date_added and date_added < existing_date:
+                    seen[imdb_id] = item
+            elif not date_added:
+                continue  # Keep the first one encountered when no Date_Added is available
+
+    return list(seen.values())
+    
+# Function to remove items with Type 'show'
+def remove_shows(watched_content):
+    filtered_content = []
+    for item in watched_content:
+        if item['Type'] != 'show':
+            filtered_content.append(item)
+    return filtered_content
+
+# Filter out setting review IMDB where the comment length is less than 600 characters
+def filter_by_comment_length(lst, min_comment_length=None):
+    # No threshold means nothing to filter, so skip the scan entirely
+    if min_comment_length is None:
+        return list(lst)
+    return [item for item in lst if 'Comment' in item and len(item['Comment']) >= min_comment_length]
+    
+
+def sort_by_date_added(items, descending=False):
+    """
+    Sorts a list of items by the 'Date_Added' field.
+
+    Args:
+        items (list): A list of dictionaries or objects with a 'Date_Added' field.
+        descending (bool): Whether to sort in descending order. Defaults to False (ascending).
+
+    Returns:
+        list: A sorted list of items by the 'Date_Added' field.
+    """
+    def date_key(item):
+        # Date_Added strings are ISO8601, which orders lexicographically, so sorting on
+        # the raw string skips a strptime parse per item; missing dates sort earliest
+        return item.get('Date_Added') or ''
+
+    return sorted(items, key=date_key, reverse=descending)
+    
+def get_items_older_than_x_days(items, days):
+    """
+    Returns items older than a specified number of days based on the 'Date_Added' field.
+
+    Args:
+        items (list): A list of dictionaries or objects with a 'Date_Added' field.
+        days (int): The number of days to use as the cutoff.
+
+    Returns:
+        list: A filtered list of items where 'Date_Added' is older than the specified number of days.
+    """
+    def is_older(item):
+        date_str = item.get('Date_Added')  # Safely get the Date_Added field
+        if date_str:
+            try:
+                date_added = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S.%fZ")
+                cutoff_date = datetime.utcnow() - timedelta(days=days)
+                return date_added < cutoff_date
+            except ValueError:
+                pass  # Invalid date format
+        return False  # Exclude items with invalid or missing dates
+
+    return [item for item in items if is_older(item)]
+    
+def check_if_watch_history_limit_reached(size):
+    """
+    Checks if the watch history has 10,000 or more items.
+    If true, updates the sync_watch_history in credentials.txt to False
+    and marks the watch history limit as reached.
+    
+    Args:
+        size (int): Size of the user's watch history.
+    
+    Returns:
+        bool: True if the watch history limit has been reached, False otherwise.
+    """
+    
+    '''
+    # Define the file path for credentials.txt
+    here = os.path.abspath(os.path.dirname(__file__))
+    file_path = os.path.join(here, 'credentials.txt')
+    
+    # Load the credentials file
+    credentials = {}
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            credentials = json.load(file)
+    except FileNotFoundError:
+        print("Credentials file not found. A new file will be created if needed.", exc_info=True)
+        return False  # Return False if the file doesn't exist
+    '''
+
+    # Check if list has 10,000 or more items
+    if size >= 9999:
+        '''
+        # Update sync_watch_history to False
+        credentials['sync_watch_history'] = False
+        '''
+        print("WARNING: IMDB watch history has reached the 10,000 limit. New watch history items will be not added to IMDB.")
+        return True  # Return True indicating limit reached and updated the credentials
+        
+        '''
+        # Mark that the watch history limit has been reached
+        try:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                json.dump(credentials, file, indent=4, separators=(', ', ': '))
+            print("IMDB watch history has reached the 10,000 item limit. sync_watch_history value set to False. Watch history will no longer be synced.")
+            return True  # Return True indicating limit reached and updated the credentials
+        except Exception as e:
+            print("Failed to write to credentials file.", exc_info=True)
+            return False  # Return False if there was an error while updating the file
+        '''
+
+    # Return False if the limit hasn't been reached
+    return False
+    
+def check_if_watchlist_limit_reached(size):
+    """
+    Checks if the watchlist is 10,000 or more items.
+    If true, updates the sync_watchlist in credentials.txt to False
+    and marks the watchlist limit as reached.
+    
+    Args:
+        size (int): Size of the user's watchlist.
+    
+    Returns:
+        bool: True if the watchlist limit has been reached, False otherwise.
+    """
+    # Define the file path for credentials.txt
+    here = os.path.abspath(os.path.dirname(__file__))
+    file_path = os.path.join(here, 'credentials.txt')
+    
+    # Load the credentials file
+    credentials = {}
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            credentials = json.load(file)
+    except FileNotFoundError:
+        print("Credentials file not found. A new file will be created if needed.", exc_info=True)
+        return False  # Return False if the file doesn't exist
+
+    # Check if list has 10,000 or more items
+    if size >= 9999:
+        # Update sync_watchlist to False
+        credentials['sync_watchlist'] = False
+        
+        # Mark that the watchlist limit has been reached
+        try:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                json.dump(credentials, file, indent=4, separators=(', ', ': '))
+            print("IMDB watchlist has reached the 10,000 item limit. sync_watchlist value set to False. Watchlist will no longer be synced.")
+            return True  # Return True indicating limit reached and updated the credentials
+        except Exception as e:
+            print("Failed to write to credentials file.", exc_info=True)
+            return False  # Return False if there was an error while updating the file
+
+    # Return False if the limit hasn't been reached
     return False
\ No newline at end of file
@@ -1,55 +1,71 @@
-import os
-import logging
-
-class CustomFormatter(logging.Formatter):
-    def formatException(self, exc_info):
-        result = super().formatException(exc_info)
-        return f"{result}"
-
-    def format(self, record):
-        if record.exc_info:
-            exc_info = record.exc_info
-            record.exc_info = None
-            message = super().format(record)
-            record.exc_info = exc_info
-            traceback_message = self.formatException(record.exc_info)
-            return f"{'`' * 100}\n{message}\n{traceback_message}\n{'`' * 100}\n"
-        else:
-            message = super().format(record)
-            return f"{'`' * 100}\n{message}\n{'`' * 100}\n"
-
-class PrependFileHandler(logging.Handler):
-    def __init__(self, filename):
-        super().__init__()
-        self.filename = filename
-
-    def emit(self, record):
-        try:
-            log_entry = self.format(record) + "\n"
-            if os.path.exists(self.filename):
-                with open(self.filename, "r+", encoding="utf-8") as file:
-                    old_content = file.read()
-                    file.seek(0)
-                    file.write(log_entry + old_content)
-            else:
-                with open(self.filename, "w", encoding="utf-8") as file:
-                    file.write(log_entry)
-        except Exception:
-            print("Error writing log.")
-
-# Get the directory of the script
-script_dir = os.path.dirname(os.path.abspath(__file__))
-log_file = os.path.join(script_dir, "log.txt")
-
-# Create a custom file handler for prepending logs
-handler = PrependFileHandler(log_file)
-handler.setLevel(logging.ERROR)
-
-# Set the log format
-formatter = CustomFormatter("%(asctime)s - %(levelname)s - %(message)s")
-handler.setFormatter(formatter)
-
-# Get the root logger and add the handler
-logger = logging.getLogger("")
-logger.setLevel(logging.ERROR)
-logger.addHandler(handler)
\ No newline at end of file
+import os
+import sys
+import logging
+
+class CustomFormatter(logging.Formatter):
+    def formatException(self, exc_info):
+        result = super().formatException(exc_info)
+        return f"{result}"
+
+    def format(self, record):
+        if record.exc_info:
+            exc_info = record.exc_info
+            record.exc_info = None
+            message = super().format(record)
+            record.exc_info = exc_info
+            traceback_message = self.formatException(record.exc_info)
+            return f"{'`' * 100}\n{message}\n{traceback_message}\n{'`' * 100}\n"
+        else:
+            message = super().format(record)
+            return f"{'`' * 100}\n{message}\n{'`' * 100}\n"
+
+class PrependFileHandler(logging.Handler):
+    def __init__(self, filename):
+        super().__init__()
+        self.filename = filename
+
+    def emit(self, record):
+        try:
+            log_entry = self.format(record) + "\n"
+            if os.path.exists(self.filename):
+                with open(self.filename, "r+", encoding="utf-8") as file:
+                    old_content = file.read()
+                    file.seek(0)
+                    file.write(log_entry + old_content)
+            else:
+                with open(self.filename, "w", encoding="utf-8") as file:
+                    file.write(log_entry)
+        except Exception:
+            print("Error writing log.")
+
+# Get the directory of the script
+script_dir = os.path.dirname(os.path.abspath(__file__))
+log_file = os.path.join(script_dir, "log.txt")
+
+# Create a custom file handler for prepending logs
+handler = PrependFileHandler(log_file)
+handler.setLevel(logging.ERROR)
+
+# Set the log format
+formatter = CustomFormatter("%(asctime)s - %(levelname)s - %(message)s")
+handler.setFormatter(formatter)
+
+# Get the root logger and add the handler
+logger = logging.getLogger("")
+logger.setLevel(logging.ERROR)
+logger.addHandler(handler)
+
+class ConsoleFormatter(logging.Formatter):
+    def format(self, record):
+        # Message only; exc_info tracebacks stay in the log file
+        return record.getMessage()
+
+# Logger for error branches that previously paired a print() with a
+# logger.error() call: a single .error() on print_logger reaches the
+# terminal through the stream handler below and the log file through
+# propagation to the root logger, so call sites format the message once
+print_logger = logging.getLogger("IMDBTraktSyncer.console")
+console_handler = logging.StreamHandler(sys.stdout)
+console_handler.setLevel(logging.ERROR)
+console_handler.setFormatter(ConsoleFormatter())
+print_logger.addHandler(console_handler)